@@ -4,20 +4,83 @@ Module for file reading utilities.
 
 This module provides utilities for reading and displaying the contents
 of text files, with automatic file handling and content output to stdout.
+Large files can be streamed to stdout in fixed-size chunks, letting the
+kernel copy them directly with os.sendfile where possible.
 """
 
+import errno
+import io
+import os
+import shutil
+import sys
 
-def read_file(filename=""):
+_NO_SENDFILE = (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.EOPNOTSUPP)
+
+
+def _copy_to_stdout(f, chunk_size):
+    """
+    Copy a file opened in binary mode to stdout, chunk by chunk.
+
+    Tries, in order: os.sendfile from the file to the stdout descriptor,
+    shutil.copyfileobj into the binary buffer of stdout, and, when stdout
+    is a plain text stream (e.g. io.StringIO), decoding and writing text
+    chunks.
+
+    Args:
+        f (file): The source file, opened in binary mode.
+        chunk_size (int): Largest number of bytes (or characters) copied
+            at once.
+    """
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        text = io.TextIOWrapper(f)
+        chunk = text.read(chunk_size)
+        while chunk:
+            out.write(chunk)
+            chunk = text.read(chunk_size)
+        return
+    out.flush()
+    buffer.flush()
+    offset = 0
+    if hasattr(os, "sendfile"):
+        try:
+            out_fd = buffer.fileno()
+            in_fd = f.fileno()
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, chunk_size)
+                if not sent:
+                    return
+                offset += sent
+        except (ValueError, io.UnsupportedOperation):
+            pass
+        except OSError as e:
+            if e.errno not in _NO_SENDFILE:
+                raise
+        f.seek(offset)
+    shutil.copyfileobj(f, buffer, chunk_size)
+    buffer.flush()
+
+
+def read_file(filename="", stream=False, chunk_size=65536):
     """
     Read and print the contents of a text file.
     
     This function opens a text file in read mode, reads its entire contents,
     and prints it to stdout. The file is automatically closed after reading
     due to the use of a context manager (with statement).
+
+    With stream=True the file is instead copied to stdout as raw bytes,
+    chunk_size at a time, so memory use stays constant whatever the size
+    of the file, and no decoding or re-encoding takes place.
     
     Args:
         filename (str, optional): The path to the file to be read. 
                                  Defaults to an empty string.
+        stream (bool, optional): Copy the file in chunks instead of
+                                 reading it whole. Defaults to False.
+        chunk_size (int, optional): Bytes copied at once when streaming.
+                                    Defaults to 65536.
     
     Raises:
         FileNotFoundError: If the specified file does not exist.
@@ -34,5 +97,9 @@ def read_file(filename=""):
         >>> read_file()  # Attempts to read file with empty filename
         FileNotFoundError: [Errno 2] No such file or directory: ''
     """
+    if stream:
+        with open(filename, 'rb') as f:
+            _copy_to_stdout(f, chunk_size)
+        return
     with open(filename, 'r') as f:
-        print(f.read(), end="")
\ No newline at end of file
+        print(f.read(), end="")
@@ -4,10 +4,89 @@ Module for file writing utilities.
 
 This module provides utilities for writing text content to files with
 UTF-8 encoding, including automatic file handling and character count reporting.
+Files can also be replaced atomically, so that a crash or a concurrent
+reader never observes a half-written file.
 """
 
+import os
+import stat
+from contextlib import contextmanager
 
-def write_file(filename="", text=""):
+
+@contextmanager
+def atomic_open(filename, mode='w', encoding=None):
+    """
+    Open a temporary file that atomically replaces filename on success.
+
+    The temporary file is created in the same directory as filename, so
+    that the final os.replace is an atomic rename on the same file system.
+    When the with block ends normally, the data is flushed and fsynced,
+    the temporary file takes the place of filename and the directory entry
+    is fsynced as well. If the block raises, the temporary file is removed
+    and filename is left untouched. Readers opening filename always see
+    either the complete old content or the complete new content.
+
+    Args:
+        filename (str): The path to the file to replace or create.
+        mode (str, optional): 'w' for text or 'wb' for bytes.
+                              Defaults to 'w'.
+        encoding (str, optional): Text encoding, as for open.
+                                  Defaults to None.
+
+    Yields:
+        file: The temporary file, open for writing.
+
+    Raises:
+        ValueError: If mode is not a write mode.
+        FileNotFoundError: If the directory path for the file does not exist.
+        PermissionError: If the directory is not writable.
+
+    Example:
+        >>> with atomic_open("config.json") as f:
+        ...     f.write('{"debug": true}')
+    """
+    if mode not in ('w', 'wb'):
+        raise ValueError("mode must be 'w' or 'wb'")
+    directory, name = os.path.split(os.path.abspath(filename))
+    try:
+        perms = stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        perms = None
+    while True:
+        tmp = os.path.join(directory, ".{}.{}.tmp".format(
+            name, os.urandom(4).hex()))
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with open(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if perms is not None:
+            os.chmod(tmp, perms)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def write_file(filename="", text="", atomic=False):
     """
     Write text content to a file with UTF-8 encoding.
     
@@ -22,6 +101,9 @@ def write_file(filename="", text=""):
                                  Defaults to an empty string.
         text (str, optional): The text content to write to the file.
                              Defaults to an empty string.
+        atomic (bool, optional): Replace the file atomically through a
+                                 fsynced temporary file (see atomic_open)
+                                 instead of truncating it. Defaults to False.
     
     Returns:
         int: The number of characters written to the file.
@@ -45,5 +127,8 @@ def write_file(filename="", text=""):
         >>> write_file("unicode.txt", "Hello 世界")
         8
     """
+    if atomic:
+        with atomic_open(filename, 'w', encoding="utf-8") as f:
+            return f.write(text)
     with open(filename, 'w', encoding="utf-8") as f:
         return f.write(text)
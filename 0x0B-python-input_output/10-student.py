@@ -4,9 +4,14 @@ Module for Student class representation and JSON serialization.
 
 This module provides a Student class that represents student information
 with basic attributes and includes functionality for JSON serialization
-of the student data.
+of the student data. to_json_many converts a whole batch of students
+in one loop.
 """
 
+import json
+
+_CHUNK = 1000
+
 
 class Student:
     """
@@ -75,9 +80,59 @@ class Student:
             {'first_name': 'Alice', 'last_name': 'Johnson', 'age': 20}
         """
         if isinstance(attrs, list):
+            d = self.__dict__
             dic = {}
             for i in attrs:
-                if i in self.__dict__:
-                    dic[i] = getattr(self, i)
+                if i in d:
+                    dic[i] = d[i]
             return dic
-        return self.__dict__
\ No newline at end of file
+        return self.__dict__
+
+    @staticmethod
+    def to_json_many(students, attrs=None, stream=None):
+        """
+        Convert many students at once, as to_json does for one.
+
+        With a stream, the dictionaries are written to it as one JSON
+        array, chunk by chunk, exactly as json.dump would write the list,
+        without building the whole list or string first.
+
+        Args:
+            students (iterable): Student instances.
+            attrs (list, optional): Attribute names, as for to_json.
+            stream (file, optional): Text stream to write the JSON array
+                                     to. If None, a list is returned.
+
+        Returns:
+            list or int: The dictionaries if stream is None, otherwise
+                         the number of students written.
+
+        Example:
+            >>> Student.to_json_many([Student("A", "B", 1)], ['age'])
+            [{'age': 1}]
+        """
+        filtered = isinstance(attrs, list)
+        dicts = []
+        count = 0
+        if stream is not None:
+            stream.write("[")
+        for student in students:
+            dic = student.__dict__
+            if filtered:
+                d = dic
+                dic = {}
+                for i in attrs:
+                    if i in d:
+                        dic[i] = d[i]
+            dicts.append(dic)
+            if stream is not None and len(dicts) == _CHUNK:
+                stream.write((", " if count else "") + json.dumps(dicts)[1:-1])
+                count += len(dicts)
+                dicts = []
+        if stream is None:
+            return dicts
+        if dicts:
+            stream.write((", " if count else "") + json.dumps(dicts)[1:-1])
+            count += len(dicts)
+        stream.write("]")
+        return count
\ No newline at end of file
@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+"""
+Module for JSON Lines file utilities.
+
+This module provides the JSON Lines counterparts of save_to_json_file and
+load_from_json_file: instead of one JSON document per file, a JSON Lines
+file holds one JSON value per line, so records can be appended and read
+back one at a time with bounded memory, whatever the size of the file.
+"""
+
+import json
+
+
+def append_json_line(my_obj, filename):
+    """
+    Append one object to a JSON Lines file.
+
+    The object is encoded with json.dumps and written, followed by a
+    newline, at the end of the file, which is created if needed.
+
+    Args:
+        my_obj: A JSON-serializable Python object.
+        filename (str): The path to the JSON Lines file.
+
+    Returns:
+        int: The number of characters written, newline included.
+
+    Raises:
+        TypeError: If the object contains non-JSON-serializable types.
+
+    Example:
+        >>> append_json_line({"event": "login", "user": 12}, "events.jsonl")
+        31
+    """
+    line = json.dumps(my_obj) + "\n"
+    with open(filename, 'a', encoding="utf-8") as f:
+        return f.write(line)
+
+
+def read_json_lines(filename):
+    """
+    Yield the objects of a JSON Lines file, one line at a time.
+
+    Only the current line is held in memory. Blank lines are skipped.
+
+    Args:
+        filename (str): The path to the JSON Lines file.
+
+    Yields:
+        object: The Python object of each non-blank line, in file order.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        json.JSONDecodeError: If a line is not valid JSON.
+
+    Example:
+        >>> for event in read_json_lines("events.jsonl"):
+        ...     print(event)
+        {'event': 'login', 'user': 12}
+    """
+    with open(filename, 'r', encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class JsonLinesWriter:
+    """
+    Batched writer appending objects to a JSON Lines file.
+
+    Encoded lines are kept in memory and written together once flush_size
+    of them are waiting, which costs one write call per batch instead of
+    one open, write and close per object. Use it as a context manager, or
+    call close() so that the last batch is written.
+
+    Attributes:
+        filename (str): The path to the JSON Lines file.
+        flush_size (int): Number of lines buffered before a write.
+        count (int): Number of objects written so far, buffered ones
+            included.
+    """
+
+    def __init__(self, filename, flush_size=1000):
+        """
+        Open filename for appending.
+
+        Args:
+            filename (str): The path to the JSON Lines file, created if
+                needed.
+            flush_size (int, optional): Number of lines buffered before
+                they are written. Defaults to 1000.
+
+        Raises:
+            TypeError: If flush_size is not an integer.
+            ValueError: If flush_size < 1.
+        """
+        if not isinstance(flush_size, int):
+            raise TypeError("flush_size must be an integer")
+        if flush_size < 1:
+            raise ValueError("flush_size must be >= 1")
+        self.filename = filename
+        self.flush_size = flush_size
+        self.count = 0
+        self.__lines = []
+        self.__file = open(filename, 'a', encoding="utf-8")
+
+    def write(self, my_obj):
+        """
+        Add one object to the file.
+
+        Args:
+            my_obj: A JSON-serializable Python object.
+
+        Returns:
+            int: The number of characters of its line, newline included.
+
+        Raises:
+            TypeError: If the object contains non-JSON-serializable types.
+            ValueError: If the writer is closed.
+        """
+        if self.__file is None:
+            raise ValueError("I/O operation on closed JsonLinesWriter")
+        line = json.dumps(my_obj) + "\n"
+        self.__lines.append(line)
+        self.count += 1
+        if len(self.__lines) >= self.flush_size:
+            self.flush()
+        return len(line)
+
+    def write_many(self, objs):
+        """
+        Add several objects to the file.
+
+        Args:
+            objs (iterable): JSON-serializable Python objects.
+
+        Returns:
+            int: The total number of characters of their lines.
+        """
+        return sum(self.write(obj) for obj in objs)
+
+    def flush(self):
+        """Write the buffered lines to the file."""
+        if self.__lines:
+            self.__file.write("".join(self.__lines))
+            self.__lines = []
+        self.__file.flush()
+
+    def close(self):
+        """Write the buffered lines and close the file."""
+        if self.__file is not None:
+            try:
+                self.flush()
+            finally:
+                self.__file.close()
+                self.__file = None
+
+    def __enter__(self):
+        """Return the writer."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the writer when leaving a with block."""
+        self.close()
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+json_lines = __import__('12-json_lines')
+append_json_line = json_lines.append_json_line
+read_json_lines = json_lines.read_json_lines
+JsonLinesWriter = json_lines.JsonLinesWriter
+
+filename = "my_events.jsonl"
+open(filename, "w").close()
+
+print(append_json_line({'event': "login", 'user': 12}, filename))
+
+with JsonLinesWriter(filename, flush_size=2) as writer:
+    for i in range(3):
+        writer.write({'event': "click", 'user': 12, 'n': i})
+    print(writer.count)
+
+for event in read_json_lines(filename):
+    print(event)
+
+try:
+    append_json_line({1, 2}, filename)
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+StudentTable = __import__('13-student_table').StudentTable
+Student = __import__('11-student').Student
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+
+path = "my_students.json"
+save_to_json_file([Student("John", "Doe", 23).to_json(),
+                   Student("Bob", "Dylan", 27).to_json()], path)
+
+table = StudentTable.from_json_file(path)
+print(len(table))
+student = table[1]
+print(isinstance(student, Student))
+print(student.to_json())
+print(student.to_json(['first_name', 'age']))
+
+student.reload_from_json({'age': 28, 'nickname': "Bobby"})
+table.update([{'first_name': "Johnny"}])
+for student in table:
+    print("{} {} {}".format(student.first_name, student.last_name,
+                            student.age))
+
+table.to_json_lines("my_students.jsonl")
+print(list(StudentTable.from_json_lines("my_students.jsonl").rows()))
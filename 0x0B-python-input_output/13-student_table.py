@@ -0,0 +1,358 @@
+#!/usr/bin/python3
+"""
+Module for a columnar store of many students.
+
+A list of a million Student instances costs one object and one __dict__
+per student, and reloading it from JSON costs one Student creation plus
+one setattr per key and per student. StudentTable keeps the same data in
+three columns instead: a list of first names, a list of last names and,
+as long as every age is an integer, a compact array of ages. Repeated
+names are stored once. Student objects are only created on demand, as
+views reading and writing the columns of their row.
+"""
+
+import json
+from array import array
+
+Student = __import__('11-student').Student
+
+_CHUNK = 1000
+
+
+class StudentTable:
+    """
+    Columnar table of students, one row per student.
+
+    Rows are read and written through StudentView instances, which
+    are Student objects: ``table[0].age`` reads the age column,
+    ``table[0].age = 30`` writes it, and ``table[0].to_json()`` gives the
+    dictionary that Student.to_json would give.
+
+    Attributes:
+        first_names (list): The first name of every row.
+        last_names (list): The last name of every row.
+        ages (array or list): The age of every row; an array of signed
+            64-bit integers until a non-integer age is stored.
+    """
+
+    def __init__(self, records=()):
+        """
+        Initialize a table, optionally filled with records.
+
+        Args:
+            records (iterable, optional): Dictionaries with the keys
+                first_name, last_name and age, as Student.to_json returns.
+                Defaults to an empty table.
+
+        Raises:
+            KeyError: If a record lacks one of the three keys.
+        """
+        self.first_names = []
+        self.last_names = []
+        self.ages = array('q')
+        self.__names = {}
+        self.extend(records)
+
+    @classmethod
+    def from_json_file(cls, filename):
+        """
+        Create a table from a JSON file holding a list of records.
+
+        Args:
+            filename (str): The path to the JSON file, as written by
+                save_to_json_file or to_json_file.
+
+        Returns:
+            StudentTable: The new table.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+            KeyError: If a record lacks one of the three keys.
+        """
+        with open(filename, 'r', encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_json_lines(cls, filename):
+        """
+        Create a table from a JSON Lines file, one record per line.
+
+        Lines are decoded in batches of a thousand, as one JSON array per
+        batch, so that memory stays bounded by the table itself.
+        Blank lines are skipped.
+
+        Args:
+            filename (str): The path to the JSON Lines file, as written by
+                12-json_lines or to_json_lines.
+
+        Returns:
+            StudentTable: The new table.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            json.JSONDecodeError: If a line is not valid JSON.
+            KeyError: If a record lacks one of the three keys.
+        """
+        table = cls()
+        with open(filename, 'r', encoding="utf-8") as f:
+            lines = []
+            for line in f:
+                if line.strip():
+                    lines.append(line)
+                    if len(lines) == _CHUNK:
+                        table.extend(json.loads("[" + ",".join(lines) + "]"))
+                        lines = []
+            if lines:
+                table.extend(json.loads("[" + ",".join(lines) + "]"))
+        return table
+
+    def _name(self, value):
+        """Return the stored copy of a name, storing it on first sight."""
+        if value.__class__ is str:
+            return self.__names.setdefault(value, value)
+        return value
+
+    def _set_age(self, index, value):
+        """Store one age, turning the age array into a list if needed."""
+        try:
+            self.ages[index] = value
+        except (TypeError, OverflowError):
+            self.ages = list(self.ages)
+            self.ages[index] = value
+
+    def extend(self, records):
+        """
+        Append records at the end of the table.
+
+        Args:
+            records (iterable): Dictionaries with the keys first_name,
+                last_name and age.
+
+        Returns:
+            int: The number of rows added.
+
+        Raises:
+            KeyError: If a record lacks one of the three keys; the table
+                is left unchanged.
+        """
+        if not isinstance(records, list):
+            records = list(records)
+        names = self.__names
+        firsts = [r["first_name"] for r in records]
+        lasts = [r["last_name"] for r in records]
+        ages = [r["age"] for r in records]
+        for column in (firsts, lasts):
+            for i, name in enumerate(column):
+                if name.__class__ is str:
+                    column[i] = names.setdefault(name, name)
+        self.first_names.extend(firsts)
+        self.last_names.extend(lasts)
+        if isinstance(self.ages, array):
+            try:
+                ages = array('q', ages)
+            except (TypeError, OverflowError):
+                self.ages = list(self.ages)
+        self.ages.extend(ages)
+        return len(records)
+
+    def update(self, records, start=0):
+        """
+        Reload rows in place from a stream of dictionaries.
+
+        The n-th record updates row start + n, as reload_from_json would
+        update the n-th Student: first_name, last_name and age are set
+        from the keys present, and any other key is ignored.
+
+        Args:
+            records (iterable): Dictionaries, e.g. from read_json_lines.
+            start (int, optional): The row updated by the first record.
+                Defaults to 0.
+
+        Returns:
+            int: The number of rows updated.
+
+        Raises:
+            IndexError: If there are more records than rows after start;
+                the rows before are already updated.
+        """
+        firsts = self.first_names
+        lasts = self.last_names
+        ages = self.ages
+        size = len(firsts)
+        count = 0
+        for index, record in enumerate(records, start):
+            if index >= size:
+                raise IndexError("record {} is past the last row".format(
+                    index))
+            if "first_name" in record:
+                firsts[index] = self._name(record["first_name"])
+            if "last_name" in record:
+                lasts[index] = self._name(record["last_name"])
+            if "age" in record:
+                try:
+                    ages[index] = record["age"]
+                except (TypeError, OverflowError):
+                    self._set_age(index, record["age"])
+                    ages = self.ages
+            count += 1
+        return count
+
+    def update_row(self, index, record):
+        """
+        Reload one row in place, as Student.reload_from_json does.
+
+        Args:
+            index (int): The row to update.
+            record (dict): Attribute names and their new values; keys
+                other than first_name, last_name and age are ignored.
+        """
+        if "first_name" in record:
+            self.first_names[index] = self._name(record["first_name"])
+        if "last_name" in record:
+            self.last_names[index] = self._name(record["last_name"])
+        if "age" in record:
+            self._set_age(index, record["age"])
+
+    def rows(self):
+        """
+        Yield the dictionary of every row, in order.
+
+        Yields:
+            dict: {'first_name': ..., 'last_name': ..., 'age': ...}
+        """
+        for first_name, last_name, age in zip(self.first_names,
+                                              self.last_names, self.ages):
+            yield {"first_name": first_name, "last_name": last_name,
+                   "age": age}
+
+    def to_json_file(self, filename):
+        """
+        Save every row to a JSON file, as one list of records.
+
+        Args:
+            filename (str): The path to the JSON file.
+
+        Returns:
+            int: The number of rows saved.
+        """
+        with open(filename, 'w', encoding="utf-8") as f:
+            return Student.to_json_many(self, stream=f)
+
+    def to_json_lines(self, filename):
+        """
+        Save every row to a JSON Lines file, one record per line.
+
+        Args:
+            filename (str): The path to the JSON Lines file.
+
+        Returns:
+            int: The number of rows saved.
+        """
+        with open(filename, 'w', encoding="utf-8") as f:
+            lines = []
+            for row in self.rows():
+                lines.append(json.dumps(row) + "\n")
+                if len(lines) == _CHUNK:
+                    f.write("".join(lines))
+                    lines = []
+            f.write("".join(lines))
+        return len(self)
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self.first_names)
+
+    def __getitem__(self, index):
+        """
+        Return a view of one row.
+
+        Args:
+            index (int): The row, negative values counting from the end.
+
+        Returns:
+            StudentView: A Student reading and writing that row.
+
+        Raises:
+            IndexError: If index is out of range.
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("StudentTable index out of range")
+        return StudentView(self, index)
+
+    def __iter__(self):
+        """Yield a view of every row, in order."""
+        for index in range(len(self)):
+            yield StudentView(self, index)
+
+
+class StudentView(Student):
+    """
+    Student whose attributes live in one row of a StudentTable.
+
+    The view holds no copy of the data: reading first_name, last_name or
+    age reads the table, and setting them, including through
+    reload_from_json, writes the table. to_json returns a new dictionary,
+    so changing it does not change the row.
+
+    Attributes:
+        table (StudentTable): The table of the row.
+        index (int): The row of the student in the table.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        """
+        Initialize a view of one row.
+
+        Args:
+            table (StudentTable): The table of the row.
+            index (int): The row of the student.
+        """
+        self.table = table
+        self.index = index
+
+    @property
+    def __dict__(self):
+        """
+        A new dictionary of the row, in the layout of a Student's.
+
+        The inherited to_json, to_json_many and reload_from_json read it,
+        so they work on views unchanged.
+        """
+        table = self.table
+        index = self.index
+        return {"first_name": table.first_names[index],
+                "last_name": table.last_names[index],
+                "age": table.ages[index]}
+
+    @property
+    def first_name(self):
+        """The first name of the row."""
+        return self.table.first_names[self.index]
+
+    @first_name.setter
+    def first_name(self, value):
+        self.table.first_names[self.index] = self.table._name(value)
+
+    @property
+    def last_name(self):
+        """The last name of the row."""
+        return self.table.last_names[self.index]
+
+    @last_name.setter
+    def last_name(self, value):
+        self.table.last_names[self.index] = self.table._name(value)
+
+    @property
+    def age(self):
+        """The age of the row."""
+        return self.table.ages[self.index]
+
+    @age.setter
+    def age(self, value):
+        self.table._set_age(self.index, value)
@@ -4,9 +4,15 @@ Module for file appending utilities using write mode.
 
 This module provides utilities for appending text content to files using
 write mode with manual seek positioning, UTF-8 encoding, and character
-count reporting.
+count reporting. For frequent appends to the same file, the Appender
+class keeps the file open and batches writes in memory.
 """
 
+import os
+import threading
+import time
+import weakref
+
 
 def append_write(filename="", text=""):
     """
@@ -52,4 +58,228 @@ def append_write(filename="", text=""):
         0
     """
     with open(filename, 'a', encoding="utf-8") as f:
-        return f.write(text)
\ No newline at end of file
+        return f.write(text)
+
+
+class Appender:
+    """
+    Long-lived, buffered appender to one text file.
+
+    Each write only adds the text to an in-memory buffer; the buffer is
+    written to the file when it holds buffer_size characters, when
+    flush_interval seconds have passed since the last flush, and on
+    flush() or close(). A background thread flushes the buffer on time
+    even when no more writes come in. All methods may be called from
+    several threads at once. Use it as a context manager, or call close()
+    when done. An appender that is never closed is still flushed and
+    closed when it is garbage collected or at interpreter exit, so no
+    write is lost; the background thread only holds a weak reference to
+    it.
+
+    With fsync=True, write only returns once its text is on disk. Writers
+    waiting at the same time share a single os.fsync (group commit), so
+    durability costs one disk flush per batch instead of one per write.
+
+    Attributes:
+        filename (str): The path to the file appended to.
+        buffer_size (int): Number of buffered characters triggering a flush.
+        flush_interval (float): Largest age, in seconds, of buffered text,
+            or None to flush on size and on demand only.
+        fsync (bool): True if every write is made durable before returning.
+    """
+
+    def __init__(self, filename="", buffer_size=65536, flush_interval=1.0,
+                 fsync=False):
+        """
+        Open filename for appending.
+
+        Args:
+            filename (str, optional): The path to the file, created if it
+                doesn't exist. Defaults to an empty string.
+            buffer_size (int, optional): Characters buffered before a
+                flush. Defaults to 65536.
+            flush_interval (float, optional): Seconds after which buffered
+                text is flushed, or None. Defaults to 1.0.
+            fsync (bool, optional): Make every write durable, using group
+                commit. Defaults to False.
+
+        Raises:
+            ValueError: If buffer_size < 0 or flush_interval <= 0.
+        """
+        if buffer_size < 0:
+            raise ValueError("buffer_size must be >= 0")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.__file = open(filename, 'a', encoding="utf-8")
+        self.__lock = threading.Lock()
+        self.__sync_lock = threading.Lock()
+        self.__chunks = []
+        self.__size = 0
+        self.__written = 0
+        self.__synced = 0
+        self.__last_flush = time.monotonic()
+        self.__closed = threading.Event()
+        self.__finalizer = weakref.finalize(
+            self, Appender.__release, self.__file, self.__lock,
+            self.__chunks, self.__closed, fsync)
+        self.__flusher = None
+        if flush_interval is not None:
+            self.__flusher = threading.Thread(
+                target=Appender.__flush_on_time,
+                args=(weakref.ref(self), self.__closed, flush_interval),
+                daemon=True)
+            self.__flusher.start()
+
+    def write(self, text=""):
+        """
+        Append text to the file.
+
+        Args:
+            text (str, optional): The text content to append.
+                Defaults to an empty string.
+
+        Returns:
+            int: The number of characters added, as append_write returns.
+
+        Raises:
+            ValueError: If the appender is closed.
+        """
+        with self.__lock:
+            if self.__file is None:
+                raise ValueError("I/O operation on closed Appender")
+            self.__chunks.append(text)
+            self.__size += len(text)
+            self.__written += 1
+            seq = self.__written
+            if (self.__size >= self.buffer_size or
+                    (self.flush_interval is not None and
+                     time.monotonic() - self.__last_flush >=
+                     self.flush_interval)):
+                self.__flush_locked()
+        if self.fsync:
+            self.__sync(seq)
+        return len(text)
+
+    def __flush_locked(self):
+        """Write the buffer to the file; the caller holds the lock."""
+        if self.__chunks:
+            self.__file.write("".join(self.__chunks))
+            self.__chunks.clear()
+            self.__size = 0
+        self.__file.flush()
+        self.__last_flush = time.monotonic()
+
+    def __sync(self, seq):
+        """Make the first seq writes durable, sharing fsyncs if possible."""
+        with self.__sync_lock:
+            if self.__synced >= seq:
+                return
+            with self.__lock:
+                if self.__file is None:
+                    return
+                self.__flush_locked()
+                seq = self.__written
+                fd = self.__file.fileno()
+            os.fsync(fd)
+            self.__synced = seq
+
+    @staticmethod
+    def __flush_on_time(ref, closed, interval):
+        """
+        Flush the buffer every interval seconds until closed.
+
+        Runs in the background thread, which only keeps a weak reference
+        to the appender between two checks, so that an appender dropped
+        without close() can still be collected and finalized.
+
+        Args:
+            ref (weakref.ref): Weak reference to the appender.
+            closed (threading.Event): Set when the appender is closed.
+            interval (float): Seconds between two checks.
+        """
+        while not closed.wait(interval):
+            appender = ref()
+            if appender is None:
+                return
+            appender.__flush_if_due()
+            del appender
+
+    def __flush_if_due(self):
+        """Flush the buffer if its oldest text is flush_interval old."""
+        with self.__lock:
+            if (self.__file is not None and self.__chunks and
+                    time.monotonic() - self.__last_flush >=
+                    self.flush_interval):
+                self.__flush_locked()
+
+    @staticmethod
+    def __release(file, lock, chunks, closed, fsync):
+        """
+        Flush and close the file of an appender that was never closed.
+
+        Called by weakref.finalize when the appender is garbage collected
+        or at interpreter exit; it only uses the appender's parts, not the
+        appender itself.
+
+        Args:
+            file (file): The open file.
+            lock (threading.Lock): The appender's lock.
+            chunks (list): The appender's buffer.
+            closed (threading.Event): Set to stop the background thread.
+            fsync (bool): Whether to fsync the file before closing it.
+        """
+        closed.set()
+        with lock:
+            if file.closed:
+                return
+            try:
+                if chunks:
+                    file.write("".join(chunks))
+                    chunks.clear()
+                file.flush()
+                if fsync:
+                    os.fsync(file.fileno())
+            finally:
+                file.close()
+
+    def flush(self):
+        """Write the buffered text to the file."""
+        with self.__lock:
+            if self.__file is not None:
+                self.__flush_locked()
+
+    def sync(self):
+        """Write the buffered text and wait until it is on disk."""
+        with self.__lock:
+            seq = self.__written
+        self.__sync(seq)
+
+    def close(self):
+        """Write the buffered text and close the file."""
+        self.__finalizer.detach()
+        self.__closed.set()
+        with self.__sync_lock, self.__lock:
+            if self.__file is None:
+                return
+            try:
+                self.__flush_locked()
+                if self.fsync:
+                    os.fsync(self.__file.fileno())
+            finally:
+                self.__file.close()
+                self.__file = None
+        if (self.__flusher is not None and
+                self.__flusher is not threading.current_thread()):
+            self.__flusher.join()
+
+    def __enter__(self):
+        """Return the appender."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the appender when leaving a with block."""
+        self.close()
@@ -8,8 +8,10 @@ using the standard json library with automatic file handling.
 
 import json
 
+atomic_open = __import__('1-write_file').atomic_open
 
-def save_to_json_file(my_obj, filename):
+
+def save_to_json_file(my_obj, filename, atomic=False):
     """
     Save a Python object to a JSON file.
     
@@ -22,6 +24,10 @@ def save_to_json_file(my_obj, filename):
         my_obj: A JSON-serializable Python object (dict, list, str, int,
                 float, bool, None, or combinations thereof) to be saved.
         filename (str): The path to the file where the JSON data will be saved.
+        atomic (bool, optional): Replace the file atomically, so that a
+                                 crash or a failed serialization never
+                                 leaves it empty or half-written.
+                                 Defaults to False.
     
     Raises:
         TypeError: If the object contains non-JSON-serializable types
@@ -42,5 +48,9 @@ def save_to_json_file(my_obj, filename):
         >>> save_to_json_file("Hello World", "message.json")
         # Creates message.json with: "Hello World"
     """
+    if atomic:
+        with atomic_open(filename, 'w') as f:
+            json.dump(my_obj, f)
+        return
     with open(filename, 'w') as f:
-        json.dump(my_obj, f)
\ No newline at end of file
+        json.dump(my_obj, f)
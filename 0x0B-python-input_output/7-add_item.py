@@ -4,33 +4,130 @@ Script for managing a persistent JSON list with command line arguments.
 
 This script maintains a persistent list stored in a JSON file. It handles
 different scenarios: when no arguments are provided (resets the list to empty),
-and when arguments are provided (adds them to existing items). The script
-loads existing items from the file if it exists, processes command line
-arguments, and saves the updated list back to the file.
+and when arguments are provided (adds them to existing items).
+
+New items are appended in place: the closing bracket at the end of the
+file is overwritten with the new items and a new bracket, so each call
+costs O(new items) instead of reloading and rewriting the whole list. An
+exclusive advisory lock (fcntl.flock) on the file serializes concurrent
+invocations, so none of them loses the items of another. Files that do
+not end like a JSON list are still loaded, extended and saved whole.
 """
 
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+
+_WHITESPACE = b" \t\r\n"
+_TAIL = 64
+
+
+@contextmanager
+def _locked(path):
+    """
+    Open path for reading and writing, creating it, under an exclusive lock.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Yields:
+        int: The file descriptor, locked until the with block ends.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield fd
+    finally:
+        os.close(fd)
+
+
+def _closing_bracket(fd):
+    """
+    Find the closing bracket of the JSON list held in a file.
+
+    Args:
+        fd (int): Descriptor of the file, open for reading.
+
+    Returns:
+        tuple: (offset of the final "]", True if the list is empty), or
+            None if the file is empty or does not end like a JSON list.
+    """
+    size = os.fstat(fd).st_size
+    start = max(0, size - _TAIL)
+    tail = os.pread(fd, size - start, start).rstrip(_WHITESPACE)
+    if not tail.endswith(b"]"):
+        return None
+    inner = tail[:-1].rstrip(_WHITESPACE)
+    if not inner and start:
+        return None
+    return start + len(tail) - 1, inner.endswith(b"[")
+
+
+def add_items(items, path="add_item.json"):
+    """
+    Append items to the JSON list saved in path, in place and under lock.
+
+    The file is left exactly as save_to_json_file would write the whole
+    list. A missing or empty file is created with the items alone.
+
+    Args:
+        items (list): JSON-serializable items to add.
+        path (str, optional): The path to the JSON file.
+                              Defaults to "add_item.json".
+
+    Returns:
+        int: The number of items added.
+
+    Raises:
+        TypeError: If an item is not JSON serializable, or the file holds
+                   JSON that is not a list.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    text = ", ".join(json.dumps(item) for item in items)
+    with _locked(path) as fd:
+        if not os.fstat(fd).st_size:
+            os.write(fd, "[{}]".format(text).encode("utf-8"))
+            return len(items)
+        found = _closing_bracket(fd)
+        if found is None:
+            save_to_json_file = __import__(
+                '5-save_to_json_file').save_to_json_file
+            load_from_json_file = __import__(
+                '6-load_from_json_file').load_from_json_file
+            save_to_json_file(load_from_json_file(path) + list(items), path)
+            return len(items)
+        if not items:
+            return 0
+        offset, empty = found
+        data = "{}{}]".format("" if empty else ", ", text).encode("utf-8")
+        os.pwrite(fd, data, offset)
+        os.ftruncate(fd, offset + len(data))
+    return len(items)
+
+
+def reset_items(path="add_item.json"):
+    """
+    Replace the list saved in path by an empty list, under lock.
+
+    Args:
+        path (str, optional): The path to the JSON file.
+                              Defaults to "add_item.json".
+    """
+    with _locked(path) as fd:
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, b"[]", 0)
+
+
 if __name__ == "__main__":
-    import os
     from sys import argv
-    save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
-    load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
-    
+
     # Define the path to the JSON file for persistent storage
     path = "add_item.json"
 
-    # If no arguments provided, reset the list to empty
+    # If no arguments provided, reset the list to empty; otherwise append
+    # the command line arguments (excluding script name) to the list
     if len(argv) == 1:
-        save_to_json_file([], path)
-
-    # Load existing list from file if it exists, otherwise start with empty list
-    if os.path.exists(path):
-        list1 = load_from_json_file(path)
+        reset_items(path)
     else:
-        list1 = []
-    
-    # Combine existing list with new command line arguments (excluding script name)
-    res = list1 + argv[1:]
-    
-    # Save the updated list back to the JSON file
-    save_to_json_file(res, path)
-    
\ No newline at end of file
+        add_items(argv[1:], path)
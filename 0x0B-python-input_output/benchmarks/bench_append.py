@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""Benchmark many small appends to one file.
+
+Compares one append_write call per line, which opens and closes the file
+every time, with an Appender, buffered and with fsync group commit. The
+group commit run uses several writer threads, as concurrent loggers do.
+
+Usage:
+    $ ./benchmarks/bench_append.py [count] [threads]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+append_module = __import__('2-append_write')
+append_write = append_module.append_write
+Appender = append_module.Appender
+
+
+def one_shot(filename, lines, threads):
+    """Append every line with its own append_write call."""
+    for line in lines:
+        append_write(filename, line)
+
+
+def run_threads(appender, lines, threads):
+    """Write lines through appender from several threads."""
+    def worker(part):
+        for line in part:
+            appender.write(line)
+    workers = [threading.Thread(target=worker, args=(lines[i::threads],))
+               for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+
+def buffered(filename, lines, threads):
+    """Append every line through one buffered Appender."""
+    with Appender(filename) as appender:
+        run_threads(appender, lines, threads)
+
+
+def group_commit(filename, lines, threads):
+    """Append every line durably, sharing fsyncs between threads."""
+    with Appender(filename, fsync=True) as appender:
+        run_threads(appender, lines, threads)
+
+
+def main(count, threads):
+    """Print lines per second for every path."""
+    lines = ["event {} happened\n".format(i) for i in range(count)]
+    expected = sum(len(line.encode("utf-8")) for line in lines)
+    print("{:<16}{:>14}".format("path", "lines/sec"))
+    with tempfile.TemporaryDirectory() as directory:
+        for name, func in (("append_write", one_shot),
+                           ("Appender", buffered),
+                           ("Appender fsync", group_commit)):
+            filename = os.path.join(directory, name + ".txt")
+            start = time.perf_counter()
+            func(filename, lines, threads)
+            elapsed = time.perf_counter() - start
+            if os.path.getsize(filename) != expected:
+                raise AssertionError("{} lost data".format(name))
+            print("{:<16}{:>14,.0f}".format(name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 4)
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""Benchmark the overhead of atomic writes.
+
+Times write_file and save_to_json_file with and without atomic=True, for
+a small and a large payload. Most of the atomic overhead is the fsync of
+the data and of the directory, which depends on the file system.
+
+Usage:
+    $ ./benchmarks/bench_atomic.py [count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+write_file = __import__('1-write_file').write_file
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+
+
+def write_text(filename, text, obj, atomic):
+    """Write the text payload with write_file."""
+    write_file(filename, text, atomic)
+
+
+def save_json(filename, text, obj, atomic):
+    """Write the object payload with save_to_json_file."""
+    save_to_json_file(obj, filename, atomic)
+
+
+def main(count):
+    """Print milliseconds per call for every function, payload and mode."""
+    payloads = (("small", "x" * 100, list(range(10))),
+                ("1 MB", "x" * 2 ** 20, list(range(150000))))
+    print("{:<20}{:<8}{:>12}{:>12}{:>8}".format(
+        "function", "payload", "plain (ms)", "atomic (ms)", "ratio"))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "out")
+        for size, text, obj in payloads:
+            for name, func in (("write_file", write_text),
+                               ("save_to_json_file", save_json)):
+                times = []
+                for atomic in (False, True):
+                    start = time.perf_counter()
+                    for _ in range(count):
+                        func(filename, text, obj, atomic)
+                    times.append((time.perf_counter() - start) / count * 1000)
+                print("{:<20}{:<8}{:>12.3f}{:>12.3f}{:>8.1f}".format(
+                    name, size, times[0], times[1], times[1] / times[0]))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
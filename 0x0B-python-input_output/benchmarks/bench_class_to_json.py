@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""Benchmark writing many instances as JSON.
+
+For a plain class (8-my_class_2.MyClass) and a slotted class, compares
+json.dumps(class_to_json(obj)) called per instance, json.dumps of the
+list of class_to_json dictionaries, and dump_objects writing to a
+stream. Each path is timed as the best of three runs.
+
+Usage:
+    $ ./benchmarks/bench_class_to_json.py [count]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+class_to_json = __import__('8-class_to_json').class_to_json
+dump_objects = __import__('8-class_to_json').dump_objects
+MyClass = __import__('8-my_class_2').MyClass
+
+REPEAT = 3
+
+
+class SlottedClass:
+    """Slotted counterpart of MyClass."""
+
+    __slots__ = ("__name", "number", "is_team_red")
+
+    def __init__(self, name, number=4):
+        """Set the three slots."""
+        self.__name = name
+        self.number = number
+        self.is_team_red = (self.number % 2) == 0
+
+
+def dumps_each(objs, stream):
+    """Encode every instance with its own json.dumps call."""
+    stream.write("[" + ", ".join(json.dumps(class_to_json(obj))
+                                 for obj in objs) + "]")
+
+
+def dumps_list(objs, stream):
+    """Encode the list of class_to_json dictionaries at once."""
+    stream.write(json.dumps([class_to_json(obj) for obj in objs]))
+
+
+def main(count):
+    """Print instances per second for every path and class."""
+    print("{:<14}{:<22}{:>16}".format("class", "path", "objects/sec"))
+    for cls in (MyClass, SlottedClass):
+        objs = [cls("student{}".format(i), i) for i in range(count)]
+        expected = None
+        for name, func in (("json.dumps each", dumps_each),
+                           ("json.dumps list", dumps_list),
+                           ("dump_objects", dump_objects)):
+            elapsed = float("inf")
+            for _ in range(REPEAT):
+                stream = io.StringIO()
+                start = time.perf_counter()
+                func(objs, stream)
+                elapsed = min(elapsed, time.perf_counter() - start)
+            if expected is None:
+                expected = stream.getvalue()
+            elif stream.getvalue() != expected:
+                raise AssertionError("{} output differs".format(name))
+            print("{:<14}{:<22}{:>16,.0f}".format(
+                cls.__name__, name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Benchmark Student.to_json with attribute filters.
+
+Compares the former getattr-based filter of to_json with the current
+one, one call per student, and with to_json_many, both as a list and
+written to a stream as JSON.
+Each path is timed as the best of three runs.
+
+Usage:
+    $ ./benchmarks/bench_student.py [count]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+Student = __import__('11-student').Student
+
+REPEAT = 3
+
+
+class FormerStudent(Student):
+    """Student with the former key-by-key to_json."""
+
+    def to_json(self, attrs=None):
+        """Filter the attributes key by key, the way to_json used to."""
+        if isinstance(attrs, list):
+            dic = {}
+            for i in attrs:
+                if i in self.__dict__:
+                    dic[i] = getattr(self, i)
+            return dic
+        return self.__dict__
+
+
+def filter_per_key(students, attrs):
+    """Call the former to_json once per student."""
+    return [FormerStudent.to_json(student, attrs) for student in students]
+
+
+def to_json_each(students, attrs):
+    """Call the current to_json once per student."""
+    return [Student.to_json(student, attrs) for student in students]
+
+
+def to_json_many(students, attrs):
+    """Convert all students with one to_json_many call."""
+    return Student.to_json_many(students, attrs)
+
+
+def main(count):
+    """Print students per second for every path."""
+    students = [Student("first{}".format(i), "last{}".format(i), i % 90)
+                for i in range(count)]
+    attrs = ["first_name", "age"]
+    expected = filter_per_key(students, attrs)
+    print("{:<24}{:>16}".format("path", "students/sec"))
+    for name, func in (("former to_json", filter_per_key),
+                       ("to_json", to_json_each),
+                       ("to_json_many", to_json_many)):
+        elapsed = float("inf")
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            result = func(students, attrs)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        if result != expected:
+            raise AssertionError("{} output differs".format(name))
+        print("{:<24}{:>16,.0f}".format(name, count / elapsed))
+
+    elapsed = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        text = json.dumps(filter_per_key(students, attrs))
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print("{:<24}{:>16,.0f}".format("former + json.dumps", count / elapsed))
+    elapsed = float("inf")
+    for _ in range(REPEAT):
+        stream = io.StringIO()
+        start = time.perf_counter()
+        Student.to_json_many(students, attrs, stream)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    if stream.getvalue() != text:
+        raise AssertionError("streamed JSON differs")
+    print("{:<24}{:>16,.0f}".format("to_json_many stream", count / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
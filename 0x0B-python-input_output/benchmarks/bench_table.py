@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""Benchmark a StudentTable against a list of Student objects.
+
+Saves count student records to a JSON file, then for both layouts times
+loading the file and reloading every student in place from a stream of
+dictionaries, and reports the memory held by the loaded students
+(measured with tracemalloc in a separate load, decoded records
+freed).
+
+Usage:
+    $ ./benchmarks/bench_table.py [count]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+Student = __import__('11-student').Student
+StudentTable = __import__('13-student_table').StudentTable
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+
+
+def load_students(filename):
+    """Load the file as a list of Student objects."""
+    students = []
+    for record in load_from_json_file(filename):
+        student = Student(None, None, None)
+        student.reload_from_json(record)
+        students.append(student)
+    return students
+
+
+def reload_students(students, records):
+    """Reload every Student from its record."""
+    for student, record in zip(students, records):
+        student.reload_from_json(record)
+
+
+def reload_table(table, records):
+    """Reload every row of the table from its record."""
+    table.update(records)
+
+
+def measure(load, reload, filename, updates):
+    """Return load time, reload time and retained KiB of one layout."""
+    gc.collect()
+    start = time.perf_counter()
+    students = load(filename)
+    loaded = time.perf_counter()
+    reload(students, updates)
+    reloaded = time.perf_counter()
+    del students
+    gc.collect()
+    tracemalloc.start()
+    students = load(filename)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return loaded - start, reloaded - loaded, size / 1024
+
+
+def main(count):
+    """Print load time, reload time and memory of both layouts."""
+    first_names = ["John", "Bob", "Alice", "Carol", "Dave", "Eve"]
+    last_names = ["Doe", "Dylan", "Smith", "Jones", "Brown"]
+    records = [{"first_name": first_names[i % 6],
+                "last_name": "{}{}".format(last_names[i % 5], i % 1000),
+                "age": 18 + i % 60} for i in range(count)]
+    updates = [{"age": record["age"] + 1} for record in records]
+    print("{:<16}{:>10}{:>12}{:>14}".format(
+        "layout", "load (s)", "reload (s)", "memory (KiB)"))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "students.json")
+        save_to_json_file(records, filename)
+        del records
+        for name, load, reload in (
+                ("list of Student", load_students, reload_students),
+                ("StudentTable", StudentTable.from_json_file, reload_table)):
+            print("{:<16}{:>10.3f}{:>12.3f}{:>14,.0f}".format(
+                name, *measure(load, reload, filename, updates)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,14 @@
+#!/usr/bin/python3
+""" 19-main """
+from models.rectangle import Rectangle
+
+if __name__ == "__main__":
+
+    rectangles = (Rectangle(i + 1, i + 2, i, i, i + 1) for i in range(3))
+    print(Rectangle.save_to_file_stream(rectangles))
+
+    with open("Rectangle.json", "r") as file:
+        print(file.read())
+
+    for rect in Rectangle.load_from_file_stream(chunk_size=8):
+        print(rect)
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Benchmark the binary shape format against JSON.
+
+Saves and reloads the same list of rectangles with Base.save_to_file and
+Base.load_from_file in both formats, checks that both give back the same
+dictionaries, and prints file size and encode/decode throughput. A second
+table times the codecs alone on the dictionaries, without building or
+reading Rectangle objects.
+
+Usage:
+    $ ./benchmarks/bench_binary.py [count]
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models import binary_format  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    """Return (result, seconds) of one call to func."""
+    start = time.perf_counter()
+    res = func(*args, **kwargs)
+    return res, time.perf_counter() - start
+
+
+def main(count):
+    """Run both formats in a temporary directory and print the results."""
+    shapes = [Rectangle(i % 97 + 1, i % 89 + 1, i % 13, i % 7, i + 1)
+              for i in range(count)]
+    print("{:<8}{:>14}{:>18}{:>18}".format(
+        "format", "bytes", "encode objs/s", "decode objs/s"))
+    loaded = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("json", "binary"):
+            filename = os.path.join(tmp, "Rectangle." + fmt)
+            _, encode = timed(Rectangle.save_to_file, shapes, filename, fmt)
+            objs, decode = timed(Rectangle.load_from_file,
+                                 filename=filename, fmt=fmt)
+            loaded[fmt] = [obj.to_dictionary() for obj in objs]
+            print("{:<8}{:>14,}{:>18,.0f}{:>18,.0f}".format(
+                fmt, os.path.getsize(filename), count / encode,
+                count / decode))
+    if loaded["json"] != loaded["binary"]:
+        raise AssertionError("binary and JSON files differ")
+
+    dicts = loaded["json"]
+    text, json_encode = timed(json.dumps, dicts)
+    _, json_decode = timed(json.loads, text)
+    buf = io.BytesIO()
+    _, bin_encode = timed(binary_format.dump_iter, "Rectangle", dicts, buf)
+    _, bin_decode = timed(
+        lambda: list(binary_format.iter_records("Rectangle", buf.getvalue())))
+    print()
+    print("codec only")
+    for fmt, encode, decode in (("json", json_encode, json_decode),
+                                ("binary", bin_encode, bin_decode)):
+        print("{:<8}{:>14}{:>18,.0f}{:>18,.0f}".format(
+            fmt, "", count / encode, count / decode))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Benchmark building shapes from dictionaries.
+
+Compares the former create path (build a dummy instance, then update it),
+Base.create and the bulk Base.from_dicts on the same dictionaries, and
+reports objects per second and how many automatic ids each path used.
+
+Usage:
+    $ ./benchmarks/bench_create.py [count]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.base import Base  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+from models.square import Square  # noqa: E402
+
+
+def dummy_then_update(cls, dictionaries):
+    """Build instances the way Base.create used to."""
+    res = []
+    for dictionary in dictionaries:
+        obj = cls(1, 1) if cls is Rectangle else cls(1)
+        obj.update(**dictionary)
+        res.append(obj)
+    return res
+
+
+def create_each(cls, dictionaries):
+    """Build instances with one Base.create call per dictionary."""
+    return [cls.create(**dictionary) for dictionary in dictionaries]
+
+
+def measure(func, cls, dictionaries):
+    """Return (objects per second, ids allocated) for one run."""
+    first = Base().id
+    start = time.perf_counter()
+    func(cls, dictionaries)
+    elapsed = time.perf_counter() - start
+    return len(dictionaries) / elapsed, Base().id - first - 1
+
+
+def main(count):
+    """Print one line per class and construction path."""
+    paths = (("dummy + update", dummy_then_update),
+             ("create", create_each),
+             ("from_dicts", lambda cls, dicts: cls.from_dicts(dicts)))
+    print("{:<11}{:<16}{:>14}{:>12}".format(
+        "class", "path", "objs/sec", "ids used"))
+    for cls in (Rectangle, Square):
+        dictionaries = [cls.create(id=i + 1, width=i % 50 + 1,
+                                   height=i % 50 + 1, x=i % 7,
+                                   y=i % 3).to_dictionary()
+                        for i in range(count)]
+        for name, func in paths:
+            rate, used = measure(func, cls, dictionaries)
+            print("{:<11}{:<16}{:>14,.0f}{:>12,}".format(
+                cls.__name__, name, rate, used))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
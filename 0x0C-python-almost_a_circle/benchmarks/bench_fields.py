@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""Benchmark construction with the code generated by models.fields.
+
+Compares building instances through the property setters, as __init__
+used to, with the generated __init__, and the validated from_dicts with
+from_dicts(trusted=True), reporting objects per second for each.
+
+Usage:
+    $ ./benchmarks/bench_fields.py [count]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.base import Base  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+from models.square import Square  # noqa: E402
+
+
+def through_setters(cls, rows):
+    """Build instances the way __init__ used to, one setter per field."""
+    res = []
+    for width, height, x, y, id in rows:
+        obj = cls.__new__(cls)
+        obj.width = width
+        obj.height = height
+        obj.x = x
+        obj.y = y
+        Base.__init__(obj, id)
+        res.append(obj)
+    return res
+
+
+def generated_init(cls, rows):
+    """Build instances with the generated __init__."""
+    if cls is Square:
+        return [cls(width, x, y, id) for width, _, x, y, id in rows]
+    return [cls(*row) for row in rows]
+
+
+def validated_dicts(cls, dictionaries):
+    """Build instances with from_dicts, validating every value."""
+    return cls.from_dicts(dictionaries)
+
+
+def trusted_dicts(cls, dictionaries):
+    """Build instances with from_dicts, skipping validation."""
+    return cls.from_dicts(dictionaries, trusted=True)
+
+
+def main(count):
+    """Print objects per second for every class and path."""
+    print("{:<11}{:<22}{:>14}".format("class", "path", "objs/sec"))
+    for cls in (Rectangle, Square):
+        rows = [(i % 50 + 1, i % 50 + 1, i % 7, i % 3, i + 1)
+                for i in range(count)]
+        dictionaries = [obj.to_dictionary()
+                        for obj in generated_init(cls, rows)]
+        paths = (("setters", through_setters, rows),
+                 ("generated __init__", generated_init, rows),
+                 ("from_dicts", validated_dicts, dictionaries),
+                 ("from_dicts trusted", trusted_dicts, dictionaries))
+        for name, func, data in paths:
+            start = time.perf_counter()
+            func(cls, data)
+            print("{:<11}{:<22}{:>14,.0f}".format(
+                cls.__name__, name, count / (time.perf_counter() - start)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
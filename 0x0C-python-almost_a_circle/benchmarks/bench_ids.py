@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Benchmark id allocation throughput under thread contention.
+
+Runs the same total number of allocations split across 1, 4 and 16
+threads, for several allocator block sizes, checks that no id was handed
+out twice, and prints ids per second for each combination.
+
+Usage:
+    $ ./benchmarks/bench_ids.py [total_ids]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.id_allocator import IdAllocator  # noqa: E402
+
+THREADS = (1, 4, 16)
+BLOCK_SIZES = (1, 64, 1024)
+
+
+def run(allocator, threads, total):
+    """Allocate total ids from threads threads; return ids per second."""
+    per_thread = total // threads
+    results = [None] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(slot):
+        allocate = allocator.allocate
+        barrier.wait()
+        results[slot] = [allocate() for _ in range(per_thread)]
+
+    workers = [threading.Thread(target=worker, args=(i,))
+               for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    ids = [i for chunk in results for i in chunk]
+    if len(set(ids)) != len(ids):
+        raise AssertionError("duplicate ids handed out")
+    return len(ids) / elapsed
+
+
+def main(total):
+    """Print one row per block size with a column per thread count."""
+    print("{:<12}".format("block_size") +
+          "".join("{:>16}".format("{} threads".format(n)) for n in THREADS))
+    for block_size in BLOCK_SIZES:
+        row = [run(IdAllocator(block_size=block_size), n, total)
+               for n in THREADS]
+        print("{:<12}".format(block_size) +
+              "".join("{:>16,.0f}".format(rate) for rate in row))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 480000)
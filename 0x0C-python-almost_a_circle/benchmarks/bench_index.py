@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""Benchmark point lookups through a saved index against a full reload.
+
+Saves rectangles with index=True in both formats, then times fetching
+random ids through an open index, through Base.load_by_id (which opens
+and closes the files on every call) and through one Base.load_from_file.
+
+Usage:
+    $ ./benchmarks/bench_index.py [count] [lookups]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.rectangle import Rectangle  # noqa: E402
+
+
+def per_call(func, args):
+    """Return the average seconds of func(arg) over args."""
+    start = time.perf_counter()
+    for arg in args:
+        func(arg)
+    return (time.perf_counter() - start) / len(args)
+
+
+def main(count, lookups):
+    """Print microseconds per lookup for each format and access path."""
+    shapes = [Rectangle(i % 97 + 1, i % 89 + 1, i % 13, i % 7, i + 1)
+              for i in range(count)]
+    ids = [random.randint(1, count) for _ in range(lookups)]
+    print("{:<8}{:>16}{:>16}{:>20}".format(
+        "format", "open index us", "load_by_id us", "load_from_file us"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, ext in (("json", ".json"), ("binary", ".bin")):
+            filename = os.path.join(tmp, "Rectangle" + ext)
+            Rectangle.save_to_file(shapes, filename, fmt, index=True)
+            with Rectangle.open_index(filename) as idx:
+                indexed = per_call(idx.get, ids)
+            single = per_call(
+                lambda i: Rectangle.load_by_id(i, filename), ids)
+            full = per_call(
+                lambda _: Rectangle.load_from_file(filename=filename), [0])
+            print("{:<8}{:>16.1f}{:>16.1f}{:>20,.0f}".format(
+                fmt, indexed * 1e6, single * 1e6, full * 1e6))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*(args + [200000, 10000][len(args):]))
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""Benchmark eager against lazy loading of a large file.
+
+Saves count rectangles, then times load_from_file with and without
+lazy=True, followed by reading the area of every hundredth shape, as a
+consumer touching a few objects would.
+
+Usage:
+    $ ./benchmarks/bench_lazy.py [count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.rectangle import Rectangle  # noqa: E402
+
+
+def main(count):
+    """Print load and first-use times for both modes."""
+    print("{:<8}{:>12}{:>14}{:>12}".format(
+        "mode", "load (s)", "touch 1% (s)", "total (s)"))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "Rectangle.json")
+        Rectangle.save_to_file([Rectangle(i % 20 + 1, i % 5 + 1, i % 4,
+                                          i % 2, i + 1)
+                                for i in range(count)], filename)
+        totals = []
+        for lazy in (False, True):
+            start = time.perf_counter()
+            shapes = Rectangle.load_from_file(filename=filename, lazy=lazy)
+            loaded = time.perf_counter()
+            totals.append(sum(shape.area() for shape in shapes[::100]))
+            touched = time.perf_counter()
+            print("{:<8}{:>12.3f}{:>14.3f}{:>12.3f}".format(
+                "lazy" if lazy else "eager", loaded - start,
+                touched - loaded, touched - start))
+        if totals[0] != totals[1]:
+            raise AssertionError("lazy shapes differ from eager ones")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
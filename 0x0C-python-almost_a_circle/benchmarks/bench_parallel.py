@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""Benchmark saving and loading several classes with Base.save_all.
+
+Times one save_to_file/load_from_file per class in a row against
+Base.save_all/load_all with a growing number of workers, in a temporary
+directory. Scaling is bounded by the number of CPUs and by the GIL for
+the thread-only paths; os.cpu_count() is printed alongside the results.
+
+Usage:
+    $ ./benchmarks/bench_parallel.py [count] [max_workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.base import Base  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+from models.square import Square  # noqa: E402
+
+
+def save_sequential(groups, directory):
+    """Save every class one after the other."""
+    for cls, objs in groups.items():
+        cls.save_to_file(objs, os.path.join(directory, cls.__name__ + ".json"))
+
+
+def load_sequential(groups, directory):
+    """Load every class one after the other."""
+    for cls in groups:
+        cls.load_from_file(
+            filename=os.path.join(directory, cls.__name__ + ".json"))
+
+
+def main(count, max_workers):
+    """Print save and load wall-clock times per worker count."""
+    groups = {Rectangle: [Rectangle(i % 20 + 1, i % 5 + 1, i % 4, i % 2, i)
+                          for i in range(1, count + 1)],
+              Square: [Square(i % 20 + 1, i % 4, i % 2, i)
+                       for i in range(1, count + 1)]}
+    print("cpus: {}, objects per class: {:,}".format(os.cpu_count(), count))
+    print("{:<20}{:>12}{:>12}".format("path", "save (s)", "load (s)"))
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        save_sequential(groups, directory)
+        saved = time.perf_counter()
+        load_sequential(groups, directory)
+        loaded = time.perf_counter()
+        print("{:<20}{:>12.3f}{:>12.3f}".format(
+            "sequential", saved - start, loaded - saved))
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            Base.save_all(groups, directory, workers=workers,
+                          process_threshold=count // 2)
+            saved = time.perf_counter()
+            Base.load_all(groups, directory, workers=workers)
+            loaded = time.perf_counter()
+            print("{:<20}{:>12.3f}{:>12.3f}".format(
+                "save_all/load_all x{}".format(workers),
+                saved - start, loaded - saved))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 4)
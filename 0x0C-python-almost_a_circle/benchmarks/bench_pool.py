@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""Benchmark short-lived shapes with and without a ShapePool.
+
+Simulates a pipeline stage that builds a batch of temporary rectangles,
+reads them and drops them, over and over. Compares Rectangle.create with
+ShapePool.acquire/release, reporting objects per second and the number
+of garbage collector runs each path triggered.
+
+Usage:
+    $ ./benchmarks/bench_pool.py [count] [batch]
+"""
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.pool import ShapePool  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+
+
+def with_create(count, batch):
+    """Build and drop count rectangles, batch at a time, with create."""
+    total = 0
+    for start in range(0, count, batch):
+        shapes = [Rectangle.create(width=i % 9 + 1, height=2, x=i % 3)
+                  for i in range(start, min(start + batch, count))]
+        total += sum(shape.area() for shape in shapes)
+    return total
+
+
+def with_pool(count, batch):
+    """Same work as with_create, recycling rectangles through a pool."""
+    pool = ShapePool(Rectangle, batch)
+    total = 0
+    for start in range(0, count, batch):
+        shapes = [pool.acquire(width=i % 9 + 1, height=2, x=i % 3)
+                  for i in range(start, min(start + batch, count))]
+        total += sum(shape.area() for shape in shapes)
+        pool.release_many(shapes)
+    return total
+
+
+def collections():
+    """Return the number of collections run so far, all generations."""
+    return sum(stats["collections"] for stats in gc.get_stats())
+
+
+def main(count, batch):
+    """Print throughput and garbage collector runs for both paths."""
+    print("{:<10}{:>14}{:>14}".format("path", "objs/sec", "gc runs"))
+    results = []
+    for name, func in (("create", with_create), ("pool", with_pool)):
+        gc.collect()
+        runs = collections()
+        start = time.perf_counter()
+        results.append(func(count, batch))
+        elapsed = time.perf_counter() - start
+        print("{:<10}{:>14,.0f}{:>14,}".format(
+            name, count / elapsed, collections() - runs))
+    if results[0] != results[1]:
+        raise AssertionError("pooled shapes differ from created ones")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
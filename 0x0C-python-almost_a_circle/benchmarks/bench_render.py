@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""Benchmark drawing many shapes to a stream.
+
+Compares printing the drawings row by row with print, as display used
+to, against render.display_many, which writes everything in one call.
+Output goes to an unbuffered file on os.devnull so that every write is a
+system call, as for a terminal or pipe.
+
+Usage:
+    $ ./benchmarks/bench_render.py [count]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models import render  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+
+
+def print_per_line(shapes, stream):
+    """Draw the shapes the way display used to, one print per row."""
+    for shape in shapes:
+        print("\n" * shape.y, end="", file=stream)
+        for _ in range(shape.height):
+            print(" " * shape.x + "#" * shape.width, file=stream)
+
+
+def main(count):
+    """Print shapes per second for both paths."""
+    shapes = [Rectangle(i % 20 + 1, i % 5 + 1, i % 4, i % 2)
+              for i in range(count)]
+    raw = open(os.devnull, "wb", buffering=0)
+    stream = io.TextIOWrapper(raw, write_through=True)
+    expected = io.StringIO()
+    print_per_line(shapes, expected)
+    if render.render_many(shapes) != expected.getvalue():
+        raise AssertionError("renderer output differs from print path")
+
+    print("{:<16}{:>16}".format("path", "shapes/sec"))
+    for name, func in (("print per row", print_per_line),
+                       ("display_many", render.display_many)):
+        start = time.perf_counter()
+        func(shapes, stream)
+        print("{:<16}{:>16,.0f}".format(
+            name, count / (time.perf_counter() - start)))
+    stream.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Benchmark the memory footprint and construction rate of the models.
+
+Compares the slotted Rectangle and Square classes against equivalent
+subclasses that bring back a per-instance ``__dict__``, reporting bytes
+per instance (measured with tracemalloc) and instances built per second.
+
+Usage:
+    $ ./benchmarks/bench_slots.py [count]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.rectangle import Rectangle  # noqa: E402
+from models.square import Square  # noqa: E402
+
+
+class DictRectangle(Rectangle):
+    """Rectangle with a per-instance __dict__, as before slotting."""
+
+
+class DictSquare(Square):
+    """Square with a per-instance __dict__, as before slotting."""
+
+
+def bytes_per_instance(factory, count):
+    """Return the average traced allocation size of one instance."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return (after - before) / count
+
+
+def construction_rate(factory, count):
+    """Return how many instances per second factory builds."""
+    start = time.perf_counter()
+    for i in range(count):
+        factory(i)
+    return count / (time.perf_counter() - start)
+
+
+def main(count):
+    """Run every case and print one line per class."""
+    cases = [
+        ("Rectangle", lambda i: Rectangle(3, 4, 1, 2, i + 1)),
+        ("DictRectangle", lambda i: DictRectangle(3, 4, 1, 2, i + 1)),
+        ("Square", lambda i: Square(3, 1, 2, i + 1)),
+        ("DictSquare", lambda i: DictSquare(3, 1, 2, i + 1)),
+    ]
+    print("{:<15}{:>12}{:>16}".format("class", "bytes/obj", "objs/sec"))
+    for name, factory in cases:
+        print("{:<15}{:>12.1f}{:>16,.0f}".format(
+            name, bytes_per_instance(factory, count),
+            construction_rate(factory, count)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
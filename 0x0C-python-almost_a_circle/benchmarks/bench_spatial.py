@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Benchmark GridIndex queries against a linear scan as data grows.
+
+Shapes are spread uniformly over a square whose area grows with their
+number, so the density stays constant. For each size the script prints
+the average time of a range, point and nearest query through the index,
+and of the same range query done by scanning every shape.
+
+Usage:
+    $ ./benchmarks/bench_spatial.py [max_count]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.rectangle import Rectangle  # noqa: E402
+from models.spatial_index import GridIndex  # noqa: E402
+
+
+def per_query(func, queries):
+    """Return the average microseconds of func(*q) over queries."""
+    start = time.perf_counter()
+    for query in queries:
+        func(*query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def scan(shapes, x0, y0, x1, y1):
+    """Return the shapes overlapping the region by checking every shape."""
+    return [s for s in shapes if s.x < x1 and x0 < s.x + s.width and
+            s.y < y1 and y0 < s.y + s.height]
+
+
+def main(max_count):
+    """Print per-query microseconds for sizes 10^4 up to max_count."""
+    print("{:>10}{:>12}{:>12}{:>12}{:>14}".format(
+        "shapes", "range us", "point us", "nearest us", "scan us"))
+    count = 10000
+    while count <= max_count:
+        side = int(math.sqrt(count) * 32)
+        rnd = random.Random(count)
+        shapes = [Rectangle(rnd.randint(1, 32), rnd.randint(1, 32),
+                            rnd.randrange(side), rnd.randrange(side), i + 1)
+                  for i in range(count)]
+        index = GridIndex(32, shapes)
+        points = [(rnd.randrange(side), rnd.randrange(side))
+                  for _ in range(1000)]
+        regions = [(x, y, x + 64, y + 64) for x, y in points]
+        print("{:>10,}{:>12.1f}{:>12.1f}{:>12.1f}{:>14,.0f}".format(
+            count,
+            per_query(index.query_range, regions),
+            per_query(index.query_point, points),
+            per_query(index.nearest, points),
+            per_query(lambda *r: scan(shapes, *r), regions[:5])))
+        count *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
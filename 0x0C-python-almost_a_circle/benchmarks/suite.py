@@ -0,0 +1,234 @@
+#!/usr/bin/python3
+"""Benchmark suite for the main entry points of the models package.
+
+Measures Base.to_json_string, save_to_file, load_from_file, create,
+update and display on Rectangle instances at every requested size, and
+reports for each:
+
+    ops/sec   objects handled per second, best of --repeat runs
+    peak KiB  peak memory traced by tracemalloc during one run
+    blocks    memory blocks still allocated after the run, i.e. retained
+              by its result (sys.getallocatedblocks difference)
+
+With --save the results are stored in a baseline JSON file, replacing
+earlier results for the same cases and sizes. Every run compares against
+that file and flags each case whose throughput dropped, or whose peak
+memory grew, by more than --threshold. The exit status is 1 if any case
+regressed. Baselines are machine specific, so record one on
+the machine the suite is run on.
+
+Files are written in a temporary directory. Sizes up to 10^7 are
+supported, but need several GB of memory and minutes per case.
+
+Usage:
+    $ ./benchmarks/suite.py [--sizes N [N ...]] [--cases NAME [NAME ...]]
+                            [--repeat R] [--baseline FILE] [--save]
+                            [--threshold FRACTION]
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+
+from models.base import Base  # noqa: E402
+from models.rectangle import Rectangle  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "baseline.json")
+
+
+def make_shapes(count):
+    """Return count small rectangles with explicit ids."""
+    return [Rectangle(i % 3 + 1, i % 2 + 1, i % 4, i % 2, i + 1)
+            for i in range(count)]
+
+
+def setup_dictionaries(count):
+    """State for the cases that start from dictionaries."""
+    return [shape.to_dictionary() for shape in make_shapes(count)]
+
+
+def setup_saved(count):
+    """State for load_from_file: a saved Rectangle.json."""
+    Rectangle.save_to_file(make_shapes(count))
+    return count
+
+
+def run_to_json_string(dictionaries):
+    """Encode all dictionaries into one JSON string."""
+    return Base.to_json_string(dictionaries)
+
+
+def run_save_to_file(shapes):
+    """Save all shapes to Rectangle.json."""
+    Rectangle.save_to_file(shapes)
+
+
+def run_load_from_file(count):
+    """Load every shape back from Rectangle.json."""
+    return Rectangle.load_from_file()
+
+
+def run_create(dictionaries):
+    """Create one shape per dictionary."""
+    create = Rectangle.create
+    return [create(**dictionary) for dictionary in dictionaries]
+
+
+def run_update(shapes):
+    """Give every shape a new width, alternating between runs."""
+    width = 5 if shapes[0].width != 5 else 6
+    for shape in shapes:
+        shape.update(width=width)
+
+
+def run_display(shapes):
+    """Draw every shape to an in-memory text stream."""
+    stream = io.StringIO()
+    for shape in shapes:
+        shape.display(stream)
+    return stream
+
+
+CASES = (
+    ("to_json_string", setup_dictionaries, run_to_json_string),
+    ("save_to_file", make_shapes, run_save_to_file),
+    ("load_from_file", setup_saved, run_load_from_file),
+    ("create", setup_dictionaries, run_create),
+    ("update", make_shapes, run_update),
+    ("display", make_shapes, run_display),
+)
+
+
+def measure(run, state, count, repeat):
+    """
+    Measure one case at one size.
+
+    Args:
+        run (function): The case, called with state.
+        state: What the case's setup returned.
+        count (int): Number of objects the case handles.
+        repeat (int): Number of timed runs; the fastest one counts.
+
+    Returns:
+        dict: "ops_per_sec", "peak_kib" and "blocks".
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    gc.collect()
+    before = sys.getallocatedblocks()
+    result = run(state)
+    blocks = sys.getallocatedblocks() - before
+    del result
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"ops_per_sec": count / best if best else float("inf"),
+            "peak_kib": peak / 1024, "blocks": blocks}
+
+
+def regressions(result, base, threshold):
+    """Return the reasons result is worse than base by over threshold."""
+    reasons = []
+    if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+        reasons.append("ops/sec {:+.1%}".format(
+            result["ops_per_sec"] / base["ops_per_sec"] - 1))
+    if result["peak_kib"] > base["peak_kib"] * (1 + threshold) + 1:
+        reasons.append("peak {:+.1%}".format(
+            result["peak_kib"] / max(base["peak_kib"], 1) - 1))
+    return reasons
+
+
+def parse_args(argv):
+    """Return the parsed command line options."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the models package entry points.")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10 ** 3, 10 ** 4, 10 ** 5],
+                        help="object counts (default: 1000 10000 100000)")
+    parser.add_argument("--cases", nargs="+", default=None,
+                        choices=[case[0] for case in CASES],
+                        help="cases to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (default: 3)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline file (default: %(default)s)")
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="tolerated slowdown or memory growth, as a "
+                        "fraction (default: 0.1)")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    """Run the suite and return the exit status."""
+    args = parse_args(argv)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    results = {}
+    failed = 0
+    print("{:<16}{:>10}{:>16}{:>12}{:>12}  {}".format(
+        "case", "objects", "ops/sec", "peak KiB", "blocks", "vs baseline"))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for name, setup, run in CASES:
+                if args.cases and name not in args.cases:
+                    continue
+                for count in args.sizes:
+                    state = setup(count)
+                    result = measure(run, state, count, args.repeat)
+                    del state
+                    key = "{}:{}".format(name, count)
+                    results[key] = result
+                    if key not in baseline:
+                        status = "-"
+                    else:
+                        reasons = regressions(result, baseline[key],
+                                              args.threshold)
+                        failed += bool(reasons)
+                        status = ("REGRESSION " + ", ".join(reasons)
+                                  if reasons else "ok")
+                    print("{:<16}{:>10,}{:>16,.0f}{:>12,.0f}{:>12,}  {}"
+                          .format(name, count, result["ops_per_sec"],
+                                  result["peak_kib"], result["blocks"],
+                                  status))
+        finally:
+            os.chdir(cwd)
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print("baseline saved to {}".format(args.baseline))
+    elif failed:
+        print("{} regression(s) beyond {:.0%}".format(failed, args.threshold))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
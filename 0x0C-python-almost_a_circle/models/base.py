@@ -6,6 +6,11 @@ JSON serialization functionality for derived classes.
 """
 
 import json
+import os
+
+from . import binary_format, change_log, file_index, json_stream, parallel_io
+from .lazy import LazyShape, LazyShapeList
+from .id_allocator import ClassCounterAllocator
 
 
 class Base:
@@ -15,19 +20,48 @@ class Base:
     serialization. It automatically assigns unique IDs to instances and provides
     static methods for JSON string conversion.
     
+    Instances are slotted: the only per-instance storage is the ``id``
+    slot, and subclasses that declare their own ``__slots__`` stay free of
+    a per-instance ``__dict__``.
+
+    Automatic ids come from a pluggable allocator shared by every
+    subclass. The default one is thread-safe and still counts in
+    ``__nb_objects``, so resetting that attribute restarts numbering; see
+    set_id_allocator to share numbering between worker processes.
+
+    Each instance also records which of its fields changed since it was
+    last saved (see dirty_fields), as a bit mask in the ``_dirty`` slot.
+    Fields are described by two class attributes that subclasses extend:
+    ``_field_bits`` maps field names to their dirty bits and
+    ``_field_checks`` maps them to validator functions, or None for fields
+    that accept any value.
+
     Attributes:
-        __nb_objects (int): Class variable tracking the total number of objects created.
+        __nb_objects (int): Class variable holding the last automatic id
+            handed out by the default allocator.
+        __id_allocator (IdAllocator): Class variable handing out the ids of
+            instances created without an explicit id.
         id (int): Unique identifier for each instance.
     """
-    
+
+    __slots__ = ("id", "_dirty")
     __nb_objects = 0
+    __id_allocator = None
+    __registry = {}
+    _field_bits = {"id": 1}
+    _field_checks = {"id": None}
+
+    def __init_subclass__(cls, **kwargs):
+        """Register every subclass by name for save_all and load_all."""
+        super().__init_subclass__(**kwargs)
+        Base.__registry[cls.__name__] = cls
 
     def __init__(self, id=None):
         """Initialize a Base instance with an ID.
         
         Creates a new Base instance with either a provided ID or an automatically
-        generated unique ID. If no ID is provided, assigns the next available ID
-        and increments the object counter.
+        generated unique ID. If no ID is provided, assigns the next ID handed
+        out by the class id allocator.
         
         Args:
             id (int, optional): The ID to assign to this instance. If None,
@@ -36,8 +70,186 @@ class Base:
         if id:
             self.id = id
         else:
-            self.id = Base.__nb_objects + 1
-            Base.__nb_objects += 1
+            self.id = Base.__id_allocator.allocate()
+        self._dirty = -1
+
+    def dirty_fields(self):
+        """Return the fields changed since the object was last saved.
+
+        Objects built with their constructor have never been saved, so all
+        their fields are dirty. Objects loaded or created from a dictionary
+        start clean. Changes made through update and update_many are
+        tracked; plain attribute assignment is not, use mark_dirty for it.
+
+        Returns:
+            frozenset: Names of the changed fields, as used by update.
+        """
+        dirty = self._dirty
+        return frozenset(name for name, bit in self._field_bits.items()
+                         if dirty & bit)
+
+    def is_dirty(self):
+        """Return True if any field changed since the object was saved."""
+        return self._dirty != 0
+
+    def mark_dirty(self, *names):
+        """Record that the named fields changed.
+
+        Args:
+            *names (str): Field names; with none, every field is marked.
+
+        Raises:
+            KeyError: If a name is not a field of the class.
+        """
+        if not names:
+            self._dirty = -1
+        for name in names:
+            self._dirty |= self._field_bits[name]
+
+    def mark_clean(self):
+        """Forget all recorded changes, e.g. after saving the object."""
+        self._dirty = 0
+
+    def _set_field(self, name, value):
+        """Set one field through its setter, tracking real changes only.
+
+        A value equal to the current one, and of the same type, is skipped
+        without running the setter.
+        """
+        current = getattr(self, name, None)
+        if type(current) is type(value) and current == value:
+            return
+        setattr(self, name, value)
+        self._dirty |= self._field_bits[name]
+
+    @classmethod
+    def _check_changes(cls, changes, checked):
+        """Validate a dictionary of field changes, return it as a list.
+
+        Args:
+            changes (dict): Field names and new values.
+            checked (set): (validator, type, value) triples already
+                validated, shared across calls so that repeated values are
+                checked once. Unhashable values are validated every time.
+
+        Returns:
+            list: (name, value) pairs, in the order given.
+
+        Raises:
+            AttributeError: If a name is not a field of the class.
+            TypeError, ValueError: As raised by the field's setter.
+        """
+        checks = cls._field_checks
+        res = []
+        for name, value in changes.items():
+            if name not in checks:
+                raise AttributeError("{} has no field '{}'".format(
+                    cls.__name__, name))
+            check = checks[name]
+            if check is not None:
+                try:
+                    key = (check, type(value), value)
+                    seen = key in checked
+                except TypeError:
+                    key, seen = None, False
+                if not seen:
+                    check(value)
+                    if key is not None:
+                        checked.add(key)
+            res.append((name, value))
+        return res
+
+    @classmethod
+    def update_many(cls, objs, changes):
+        """Apply field changes to many objects, validating them first.
+
+        Every change is validated before any object is modified, so either
+        all objects are updated or, if a value is invalid, none is. Each
+        object is checked against the fields of its own class, so a change
+        to "width" is rejected for a Square in the list. Each distinct
+        value is validated once per validator, however many objects
+        receive it. Unchanged values are skipped and changed fields are
+        recorded as dirty, exactly as with update.
+
+        Args:
+            objs (iterable): Instances of the calling class or of its
+                subclasses, or LazyShape proxies of them, which are
+                materialized.
+            changes (dict or iterable): Either one dictionary of changes
+                applied to every object, or one dictionary per object.
+
+        Returns:
+            int: The number of objects that had at least one field changed.
+
+        Raises:
+            AttributeError: If a change names a field that the class of
+                its object does not have.
+            TypeError, ValueError: If a value is rejected by its setter.
+            ValueError: If there is not one dictionary per object.
+        """
+        objs = [obj._materialize() if type(obj) is LazyShape else obj
+                for obj in objs]
+        checked = set()
+        if isinstance(changes, dict):
+            plans = {}
+            plan = []
+            for obj in objs:
+                klass = type(obj)
+                items = plans.get(klass)
+                if items is None:
+                    items = klass._check_changes(changes, checked)
+                    plans[klass] = items
+                plan.append(items)
+        else:
+            changes = list(changes)
+            if len(changes) != len(objs):
+                raise ValueError("changes must hold one dictionary per object")
+            plan = [type(obj)._check_changes(c, checked)
+                    for obj, c in zip(objs, changes)]
+        changed = 0
+        for obj, items in zip(objs, plan):
+            before = obj._dirty
+            obj._dirty = 0
+            for name, value in items:
+                obj._set_field(name, value)
+            if obj._dirty:
+                changed += 1
+            obj._dirty |= before
+        return changed
+
+    @staticmethod
+    def get_id_allocator():
+        """Return the allocator used for automatic ids.
+
+        Returns:
+            IdAllocator: The allocator shared by Base and its subclasses.
+        """
+        return Base.__id_allocator
+
+    @staticmethod
+    def set_id_allocator(allocator):
+        """Replace the allocator used for automatic ids.
+
+        Install a ProcessIdAllocator created in the parent process in every
+        worker so that workers never hand out the same id, or an
+        IdAllocator with a larger block_size to cut lock traffic between
+        threads.
+
+        The opt-in allocators keep their own counters and ignore
+        ``__nb_objects``; installing a fresh one also restarts numbering.
+
+        Args:
+            allocator (IdAllocator): Any object with allocate() and
+                advance_past(max_id) methods.
+        """
+        Base.__id_allocator = allocator
+
+    @staticmethod
+    def _resume_ids(ids):
+        """Advance the id allocator past the largest integer of ids."""
+        max_id = max((id for id in ids if type(id) is int), default=None)
+        if max_id is not None:
+            Base.__id_allocator.advance_past(max_id)
 
     @staticmethod
     def to_json_string(list_dictionaries):
@@ -60,28 +272,161 @@ class Base:
         return res
 
     @classmethod
-    def save_to_file(cls, list_objs):
+    def _file_and_format(cls, filename=None, fmt=None):
+        """Resolve the file name and format used by save and load.
+
+        The format defaults to "binary" for names ending in ".bin" and to
+        "json" otherwise; the name defaults to the class name with the
+        extension of the format.
+
+        Raises:
+            ValueError: If fmt is neither "json" nor "binary".
+        """
+        if fmt is None:
+            fmt = "binary" if filename and filename.endswith(".bin") else "json"
+        if fmt not in ("json", "binary"):
+            raise ValueError("fmt must be 'json' or 'binary'")
+        if filename is None:
+            filename = cls.__name__ + (".bin" if fmt == "binary" else ".json")
+        return filename, fmt
+
+    @classmethod
+    def save_to_file(cls, list_objs, filename=None, fmt=None, index=False):
         """Save a list of objects to a JSON file.
         
         Converts a list of objects to their dictionary representations and saves
         them as JSON to a file. The filename is based on the class name with
         a .json extension.
+
+        With fmt="binary", or a filename ending in ".bin", the dictionaries
+        are written in the fixed-width format of models.binary_format
+        instead, which is smaller and much faster to encode and decode.
         
         Args:
             list_objs (list): A list of objects that have a to_dictionary method.
                 Can be None or an empty list, in which case an empty JSON array
                 is written to the file.
+            filename (str, optional): File to write. Defaults to the class
+                name with the extension of the format.
+            fmt (str, optional): "json" or "binary". Defaults to the format
+                matching filename, or "json".
+            index (bool, optional): If True, also write an id to byte
+                offset index next to the file (e.g. "Rectangle.json.idx")
+                for load_by_id, load_many and open_index. Defaults to False.
+
+        Raises:
+            ValueError: If fmt is unknown, a binary record holds a value
+                that is not a 64-bit integer, or index is True and an id
+                is not an integer.
+
+        Note:
+            The file is a full snapshot, so any change log left by
+            save_changes is deleted once it has been written.
         """
-        with open(cls.__name__ + ".json", "w") as f:
-            if list_objs:
-                list_1 = []
-                for i in list_objs:
-                    list_1.append(cls.to_dictionary(i))
-                f.write(cls.to_json_string(list_1))
-            else:
-                f.write(cls.to_json_string([]))
+        filename, fmt = cls._file_and_format(filename, fmt)
+        if index:
+            ids = []
+            spans = []
+            dictionaries = cls._saved_dictionaries(list_objs or (), ids)
+            with open(filename, "wb" if fmt == "binary" else "w") as f:
+                if fmt == "binary":
+                    binary_format.dump_iter(cls.__name__, dictionaries, f,
+                                            spans)
+                else:
+                    json_stream.dump_iter(dictionaries, f, spans)
+            file_index.write_index(filename, fmt, ids, spans)
+        elif fmt == "binary":
+            with open(filename, "wb") as f:
+                binary_format.dump_iter(
+                    cls.__name__, cls._saved_dictionaries(list_objs or ()), f)
+            file_index.remove_index(filename)
+        else:
+            with open(filename, "w") as f:
+                if list_objs:
+                    list_1 = []
+                    for i in list_objs:
+                        list_1.append(cls.to_dictionary(i))
+                        i._dirty = 0
+                    f.write(cls.to_json_string(list_1))
+                else:
+                    f.write(cls.to_json_string([]))
+            file_index.remove_index(filename)
+        change_log.remove_log(filename)
+
+    @classmethod
+    def _saved_dictionaries(cls, list_objs, ids=None):
+        """Yield each object's dictionary and mark the object clean.
+
+        Dictionaries are built with the calling class's to_dictionary, as
+        save_to_file does, so a Square saved in a Rectangle file is written
+        with width and height, not size.
+
+        If ids is a list, each object's id is appended to it.
+        """
+        to_dictionary = cls.to_dictionary
+        for obj in list_objs:
+            dictionary = to_dictionary(obj)
+            if ids is not None:
+                ids.append(dictionary["id"])
+            obj._dirty = 0
+            yield dictionary
+
+    @classmethod
+    def open_index(cls, filename=None, fmt=None):
+        """Open a file saved with index=True for repeated lookups by id.
+
+        The data file and its index stay memory-mapped until the returned
+        object is closed, so every lookup only decodes the record asked
+        for.
+
+        Args:
+            filename (str, optional): The data file. Defaults to the class
+                name with the extension of the format.
+            fmt (str, optional): "json" or "binary", used to pick the
+                default filename. Defaults to "json".
+
+        Returns:
+            ShapeIndex: An open index; use it in a with block.
+
+        Raises:
+            FileNotFoundError: If the file or its index does not exist.
+            ValueError: If the index is older than the file.
+        """
+        filename, fmt = cls._file_and_format(filename, fmt)
+        return file_index.ShapeIndex(cls, filename)
+
+    @classmethod
+    def load_by_id(cls, id, filename=None, fmt=None):
+        """Load the single instance saved with the given id.
+
+        Args:
+            id (int): The id to look up.
+            filename (str, optional): The data file, see open_index.
+            fmt (str, optional): "json" or "binary", see open_index.
+
+        Returns:
+            object: A new instance, or None if no record has this id.
+        """
+        with cls.open_index(filename, fmt) as idx:
+            return idx.get(id)
+
+    @classmethod
+    def load_many(cls, ids, filename=None, fmt=None):
+        """Load the instances saved with the given ids.
+
+        Args:
+            ids (iterable): The ids to look up.
+            filename (str, optional): The data file, see open_index.
+            fmt (str, optional): "json" or "binary", see open_index.
+
+        Returns:
+            list: One entry per requested id, in the same order; entries
+                for unknown ids are None.
+        """
+        with cls.open_index(filename, fmt) as idx:
+            return idx.get_many(ids)
 
-    @staticmethod     
+    @staticmethod
     def from_json_string(json_string):
         """Convert a JSON string to a list of dictionaries.
         
@@ -106,10 +451,11 @@ class Base:
     def create(cls, **dictionary):
         """Create an instance of the class with attributes set from a dictionary.
         
-        Creates a new instance of the calling class with dummy initial values,
-        then updates all attributes using the provided dictionary. This method
-        handles different class types (Rectangle and Square) by providing
-        appropriate initial parameters.
+        Builds the instance directly from the dictionary through
+        _init_from_dict: every attribute is validated once by its setter,
+        and an automatic id is only allocated when the dictionary has no
+        "id" key. Attributes missing from the dictionary get the same
+        defaults as before, e.g. a width and height of 1 for a Rectangle.
         
         Args:
             **dictionary: Arbitrary keyword arguments representing attribute
@@ -119,48 +465,369 @@ class Base:
             object: A new instance of the calling class with attributes updated
                 from the dictionary. Returns the instance even if dictionary
                 is empty or None.
-        
-        Note:
-            Rectangle instances are created with initial dimensions (1,1).
-            Square instances are created with initial size 1.
-        """
-        if dictionary and dictionary != {}:
-            if cls.__name__ == "Rectangle":
-                obj = cls(1,1)
-            elif cls.__name__ == "Square":
-                obj = cls(1)
-            obj.update(**dictionary)
+        """
+        obj = cls.__new__(cls)
+        obj._init_from_dict(dictionary)
         return obj
 
+    @classmethod
+    def from_dicts(cls, dictionaries, trusted=False):
+        """Create one instance per dictionary in a single pass.
+
+        The bulk counterpart of create, used by load_from_file: no throwaway
+        instance is built, each value is validated once, and ids are only
+        allocated for dictionaries without an "id" key.
+
+        Args:
+            dictionaries (iterable): Dictionaries in the to_dictionary
+                format, e.g. as read back from a saved file.
+            trusted (bool, optional): If True, the dictionaries are known
+                to be complete and valid, e.g. written by save_to_file,
+                and are stored without validation through _init_trusted.
+                Defaults to False.
+
+        Returns:
+            list: The new instances, in the same order.
+        """
+        new = cls.__new__
+        init = cls._init_trusted if trusted else cls._init_from_dict
+        res = []
+        for dictionary in dictionaries:
+            obj = new(cls)
+            init(obj, dictionary)
+            res.append(obj)
+        return res
+
+    def _init_from_dict(self, dictionary):
+        """Initialize a bare instance from a to_dictionary style mapping.
+
+        Subclasses set their own attributes from the mapping and then call
+        this method, which takes "id" from the mapping or, if it is absent,
+        from the id allocator, and marks the instance clean.
+
+        Args:
+            dictionary (dict): Attribute names and values.
+        """
+        if "id" in dictionary:
+            self.id = dictionary["id"]
+        else:
+            self.id = Base.__id_allocator.allocate()
+        self._dirty = 0
+
+    def _init_trusted(self, dictionary):
+        """Initialize a bare instance from a complete, valid mapping.
+
+        Subclasses replace this with a version that skips validation; by
+        default it is the same as _init_from_dict.
+
+        Args:
+            dictionary (dict): Attribute names and values.
+        """
+        self._init_from_dict(dictionary)
 
     @classmethod
-    def load_from_file(cls):
+    def load_from_file(cls, resume_ids=False, filename=None, fmt=None,
+                       trusted=False, lazy=False):
         """Load a list of instances from a JSON file.
         
         Reads a JSON file named after the class (e.g., "Rectangle.json") and
-        creates instances of the class from the data. Each dictionary in the
-        JSON file is converted to an instance using the create method.
+        creates instances of the class from the data. The dictionaries in the
+        JSON file are converted to instances in one pass by from_dicts.
+
+        Args:
+            resume_ids (bool, optional): If True, automatic ids handed out
+                afterwards continue from the largest id found in the file,
+                so new objects never collide with loaded ones.
+                Defaults to False.
+            filename (str, optional): File to read. Defaults to the class
+                name with the extension of the format.
+            fmt (str, optional): "json" or "binary". Defaults to the format
+                matching filename, or "json". Binary files are read through
+                a memory map.
+            trusted (bool, optional): If True, the file is known to have
+                been written by save_to_file and its records are not
+                validated again (see from_dicts). Defaults to False.
+            lazy (bool, optional): If True, return a read-only
+                models.lazy.LazyShapeList of proxies that only build and
+                validate their instance when it is first used.
+                Defaults to False.
         
         Returns:
             list: A list of class instances created from the JSON file data.
                 Returns an empty list if the file doesn't exist or if the
-                file is empty.
+                file is empty. With lazy=True, a LazyShapeList instead.
         
         Note:
             The filename is automatically determined as "{ClassName}.json".
             If the file is not found, an empty list is returned instead of
-            raising an exception.
+            raising an exception. Changes appended by save_changes since
+            the last full save are replayed on top of the file.
+        """
+        filename, fmt = cls._file_and_format(filename, fmt)
+        try:
+            if fmt == "binary":
+                listdict = binary_format.load(cls.__name__, filename)
+            else:
+                with open(filename, "r") as f:
+                    listdict = cls.from_json_string(f.read())
+        except FileNotFoundError:
+            listdict = []
+        changes = change_log.read_changes(filename)
+        if changes:
+            listdict = change_log.replay(listdict, changes)
+        if lazy:
+            res = LazyShapeList(cls, listdict, trusted)
+            if resume_ids:
+                Base._resume_ids(res.ids())
+            return res
+        res = cls.from_dicts(listdict, trusted)
+        if resume_ids:
+            Base._resume_ids(obj.id for obj in res)
+        return res
+
+    @classmethod
+    def save_to_file_stream(cls, list_objs):
+        """Save objects to the class JSON file one record at a time.
+
+        Produces exactly the same file as save_to_file, but encodes and
+        writes each object's dictionary as it is reached instead of building
+        the whole list and JSON string first. Any iterable, including a
+        generator, is accepted, so peak memory stays flat however many
+        objects are written. Like save_to_file, it drops any index and
+        change log of the file.
+
+        Args:
+            list_objs (iterable): Objects that have a to_dictionary method.
+                Can be None or empty, in which case an empty JSON array is
+                written to the file.
+
+        Returns:
+            int: The number of objects written.
         """
         filename = cls.__name__ + ".json"
-        res = []
+        with open(filename, "w") as f:
+            if list_objs is None:
+                list_objs = ()
+            count = json_stream.dump_iter(
+                cls._saved_dictionaries(list_objs), f)
+        file_index.remove_index(filename)
+        change_log.remove_log(filename)
+        return count
+
+    @classmethod
+    def load_from_file_stream(cls, chunk_size=65536, resume_ids=False):
+        """Yield instances from the class JSON file one record at a time.
+
+        Reads the file written by save_to_file or save_to_file_stream in
+        fixed-size chunks and creates each instance as soon as its record
+        has been decoded, so only one record is held in memory at once.
+
+        Args:
+            chunk_size (int, optional): Number of characters read from the
+                file per chunk. Defaults to 65536.
+            resume_ids (bool, optional): If True, once the file has been
+                read to the end, automatic ids continue from the largest id
+                found in it. Defaults to False.
+
+        Yields:
+            object: Instances of the calling class, in file order, with
+                the change log of the file applied. Nothing is yielded if
+                neither the file nor its log exists.
+        """
+        filename = cls.__name__ + ".json"
+        changes = change_log.read_changes(filename)
+        max_id = None
         try:
-            with open(filename, "r") as f:
-                strlist = f.read()
-                listdict = cls.from_json_string(strlist)
-                for i in listdict:
-                    obj = cls.create(**i)
-                    res.append(obj)
+            f = open(filename, "r")
         except FileNotFoundError:
-            res = []
+            f = None
+        try:
+            dictionaries = json_stream.load_iter(f, chunk_size) if f else ()
+            for dictionary in change_log.replay(dictionaries, changes):
+                obj = cls.create(**dictionary)
+                if type(obj.id) is int and (max_id is None or obj.id > max_id):
+                    max_id = obj.id
+                yield obj
         finally:
-            return res
\ No newline at end of file
+            if f:
+                f.close()
+        if resume_ids and max_id is not None:
+            Base.__id_allocator.advance_past(max_id)
+
+    @classmethod
+    def save_changes(cls, updated=(), deleted=(), filename=None, fmt=None,
+                     compact_ratio=1.0):
+        """Record changed and deleted objects without rewriting the file.
+
+        Appends one JSON line per change to the change log next to the
+        file (e.g. "Rectangle.json.log"), so the cost is proportional to
+        the number of changes. load_from_file replays the log on top of the
+        file, and the log is folded into the file by compact, which runs
+        automatically once the log outgrows the file.
+
+        Args:
+            updated (iterable): New or modified objects; each replaces the
+                saved record with the same id, or is added after them.
+            deleted (iterable): Ids of saved records to remove.
+            filename (str, optional): The snapshot file. Defaults to the
+                class name with the extension of the format.
+            fmt (str, optional): "json" or "binary". Defaults to the format
+                matching filename, or "json".
+            compact_ratio (float, optional): Compact once the log is larger
+                than this many times the file (or 64 KiB, if larger). None
+                never compacts automatically. Defaults to 1.0.
+        """
+        filename, fmt = cls._file_and_format(filename, fmt)
+        log_size = change_log.append(
+            filename, cls._saved_dictionaries(updated), deleted)
+        if compact_ratio is None:
+            return
+        try:
+            size = os.path.getsize(filename)
+        except FileNotFoundError:
+            size = 0
+        if log_size > compact_ratio * max(size, 65536):
+            cls.compact(filename, fmt)
+
+    @classmethod
+    def compact(cls, filename=None, fmt=None):
+        """Fold the change log of a saved file back into the file.
+
+        The file is read and rewritten record by record into a temporary
+        file, which then replaces it before the log is deleted; if that
+        last step is interrupted, replaying the leftover log is harmless.
+        Records are copied as dictionaries, without building objects.
+
+        Args:
+            filename (str, optional): The snapshot file. Defaults to the
+                class name with the extension of the format.
+            fmt (str, optional): "json" or "binary". Defaults to the format
+                matching filename, or "json".
+
+        Returns:
+            int: The number of records in the compacted file.
+        """
+        filename, fmt = cls._file_and_format(filename, fmt)
+        changes = change_log.read_changes(filename)
+        tmp = filename + ".tmp"
+        if fmt == "binary":
+            try:
+                listdict = binary_format.load(cls.__name__, filename)
+            except FileNotFoundError:
+                listdict = []
+            with open(tmp, "wb") as out:
+                count = binary_format.dump_iter(
+                    cls.__name__, change_log.replay(listdict, changes), out)
+        else:
+            try:
+                f = open(filename, "r")
+            except FileNotFoundError:
+                f = None
+            try:
+                with open(tmp, "w") as out:
+                    count = json_stream.dump_iter(change_log.replay(
+                        json_stream.load_iter(f) if f else (), changes), out)
+            finally:
+                if f:
+                    f.close()
+        os.replace(tmp, filename)
+        file_index.remove_index(filename)
+        change_log.remove_log(filename)
+        return count
+
+    @classmethod
+    def save_dirty(cls, list_objs, filename=None, fmt=None,
+                   compact_ratio=1.0):
+        """Append only the objects with unsaved changes to the change log.
+
+        Args:
+            list_objs (iterable): Objects to check; clean ones are skipped.
+            filename (str, optional): See save_changes.
+            fmt (str, optional): See save_changes.
+            compact_ratio (float, optional): See save_changes.
+
+        Returns:
+            int: The number of objects written.
+        """
+        dirty = [obj for obj in list_objs if obj._dirty]
+        if dirty:
+            cls.save_changes(dirty, (), filename, fmt, compact_ratio)
+        return len(dirty)
+
+    @staticmethod
+    def _registered_class(key):
+        """Return the subclass named key, or key itself if it is a class."""
+        if isinstance(key, type):
+            return key
+        try:
+            return Base.__registry[key]
+        except KeyError:
+            raise ValueError("Unknown class: {}".format(key)) from None
+
+    @staticmethod
+    def save_all(objects, directory=None, fmt=None, workers=None,
+                 process_threshold=100000):
+        """Save the objects of several classes, one file per class, at once.
+
+        Every class is written to the file save_to_file gives it (e.g.
+        "Rectangle.json" and "Square.json") inside directory, with the
+        same content, by a pool of threads. JSON lists of at least
+        process_threshold objects are also split into chunks that a pool
+        of processes encodes in parallel, since encoding in threads is
+        serialized by the GIL.
+
+        Args:
+            objects: A mapping of classes (or class names) to lists of
+                their instances, or an iterable of instances that is
+                grouped by exact type.
+            directory (str, optional): Directory to write to. Defaults to
+                the current directory.
+            fmt (str, optional): "json" or "binary". Defaults to "json".
+            workers (int, optional): Maximum number of threads, and of
+                processes. Defaults to the executor defaults.
+            process_threshold (int, optional): Smallest JSON list encoded
+                by the process pool. Defaults to 100000.
+
+        Returns:
+            list: The written file names, sorted by class name.
+
+        Raises:
+            ValueError: If fmt or a class name is unknown.
+        """
+        groups = {Base._registered_class(cls): objs for cls, objs in
+                  parallel_io.group_by_class(objects).items()}
+        return parallel_io.save_all(groups, directory or os.curdir, fmt,
+                                    workers, process_threshold)
+
+    @staticmethod
+    def load_all(classes=None, directory=None, fmt=None, workers=None):
+        """Load the files of several classes at once.
+
+        Args:
+            classes (iterable, optional): Classes or class names to load.
+                Defaults to every subclass of Base whose file exists in
+                directory.
+            directory (str, optional): Directory to read from. Defaults to
+                the current directory.
+            fmt (str, optional): "json" or "binary". Defaults to "json".
+            workers (int, optional): Maximum number of threads. Defaults to
+                the executor default.
+
+        Returns:
+            dict: Class names to the lists load_from_file returns for them,
+                in class name order. Missing files give empty lists.
+
+        Raises:
+            ValueError: If fmt or a class name is unknown.
+        """
+        directory = directory or os.curdir
+        if classes is None:
+            classes = [cls for cls in Base.__registry.values()
+                       if os.path.exists(os.path.join(
+                           directory, cls._file_and_format(None, fmt)[0]))]
+        else:
+            classes = [Base._registered_class(cls) for cls in classes]
+        return parallel_io.load_all(classes, directory, fmt, workers)
+
+
+Base.set_id_allocator(ClassCounterAllocator(Base, "_Base__nb_objects"))
@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+"""Fixed-width binary encoding for lists of shape dictionaries.
+
+A binary shape file starts with a header followed by ``count`` records,
+each made of one little-endian signed 64-bit integer per field::
+
+    magic     4 bytes   b"SHPB"
+    version   1 byte    1
+    name_len  1 byte    length of the class name
+    name      name_len  class name, ASCII (e.g. b"Rectangle")
+    fields    1 byte    number of fields per record
+    names     ...       one length byte and ASCII name per field
+    count     8 bytes   number of records, unsigned
+    records   count * fields * 8 bytes
+
+Field names are taken from the first object's to_dictionary keys, so a
+file decodes back into exactly the dictionaries the JSON path would give.
+"""
+
+import mmap
+import struct
+from operator import itemgetter
+
+MAGIC = b"SHPB"
+VERSION = 1
+_COUNT = struct.Struct("<Q")
+
+
+def record_struct(fields):
+    """Return the Struct packing one record of len(fields) integers."""
+    return struct.Struct("<{}q".format(len(fields)))
+
+
+def _encode_header(class_name, fields, count):
+    """Return the header bytes for a file of count records."""
+    name = class_name.encode("ascii")
+    header = bytearray(MAGIC)
+    header += bytes((VERSION, len(name))) + name + bytes((len(fields),))
+    for field in fields:
+        field = field.encode("ascii")
+        header += bytes((len(field),)) + field
+    return bytes(header + _COUNT.pack(count))
+
+
+def decode_header(buf):
+    """
+    Parse the header at the start of a binary shape file.
+
+    Args:
+        buf (bytes-like): The file contents, or at least its header.
+
+    Returns:
+        tuple: (class_name, fields, count, data_offset).
+
+    Raises:
+        ValueError: If buf does not start with a valid header.
+    """
+    if bytes(buf[:4]) != MAGIC:
+        raise ValueError("Not a binary shape file")
+    if buf[4] != VERSION:
+        raise ValueError("Unsupported binary shape file version {}".format(
+            buf[4]))
+    pos = 6 + buf[5]
+    class_name = bytes(buf[6:pos]).decode("ascii")
+    fields = []
+    nfields = buf[pos]
+    pos += 1
+    for _ in range(nfields):
+        size = buf[pos]
+        fields.append(bytes(buf[pos + 1:pos + 1 + size]).decode("ascii"))
+        pos += 1 + size
+    count = _COUNT.unpack_from(buf, pos)[0]
+    return class_name, tuple(fields), count, pos + _COUNT.size
+
+
+def dump_iter(class_name, dictionaries, f, spans=None):
+    """
+    Write dictionaries to a binary file opened in "wb" mode.
+
+    The record count is patched into the header once every record has
+    been written, so dictionaries may be any iterable, including a
+    generator.
+
+    Args:
+        class_name (str): Name of the class stored in the header.
+        dictionaries (iterable): Dictionaries with the same keys, whose
+            values are all integers.
+        f (file): A seekable binary file object opened for writing.
+        spans (list, optional): If given, the (offset, length) of each
+            record relative to the start of the header is appended to it.
+
+    Returns:
+        int: The number of records written.
+
+    Raises:
+        ValueError: If a dictionary has different keys from the first one
+            or a value that is not a 64-bit integer.
+    """
+    it = iter(dictionaries)
+    first = next(it, None)
+    fields = tuple(first) if first is not None else ()
+    header = _encode_header(class_name, fields, 0)
+    f.write(header)
+    if first is None:
+        return 0
+
+    record = record_struct(fields)
+    pack = record.pack
+    if len(fields) == 1:
+        def values(dic, key=fields[0]):
+            return (dic[key],)
+    else:
+        values = itemgetter(*fields)
+    count = 0
+    for dic in _chain(first, it):
+        if len(dic) != len(fields):
+            raise ValueError("All records must have the fields {}".format(
+                ", ".join(fields)))
+        try:
+            f.write(pack(*values(dic)))
+        except KeyError as e:
+            raise ValueError("Missing field {}".format(e)) from None
+        except struct.error:
+            raise ValueError(
+                "Binary format only stores 64-bit integers") from None
+        if spans is not None:
+            spans.append((len(header) + count * record.size, record.size))
+        count += 1
+
+    end = f.tell()
+    f.seek(len(header) - _COUNT.size)
+    f.write(_COUNT.pack(count))
+    f.seek(end)
+    return count
+
+
+def _chain(first, rest):
+    """Yield first and then every item of rest."""
+    yield first
+    yield from rest
+
+
+def load(class_name, filename):
+    """
+    Read every record of a binary shape file through a memory map.
+
+    Args:
+        class_name (str): Class expected in the header.
+        filename (str): Path of the file to read.
+
+    Returns:
+        list: One dictionary per record, in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a binary file of class_name.
+    """
+    with open(filename, "rb") as f:
+        if not f.seek(0, 2):
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return list(iter_records(class_name, mm))
+
+
+def iter_records(class_name, buf):
+    """
+    Yield one dictionary per record from the contents of a binary file.
+
+    Args:
+        class_name (str): Class expected in the header.
+        buf (bytes-like): The file contents, e.g. an mmap object.
+
+    Yields:
+        dict: The fields of each record, in file order.
+
+    Raises:
+        ValueError: If buf is not a complete binary file of class_name.
+    """
+    name, fields, count, offset = decode_header(buf)
+    if name != class_name:
+        raise ValueError("File holds {} records, not {}".format(
+            name, class_name))
+    if not count:
+        return
+    record = record_struct(fields)
+    end = offset + count * record.size
+    if len(buf) < end:
+        raise ValueError("Truncated binary shape file")
+    with memoryview(buf) as view:
+        for values in record.iter_unpack(view[offset:end]):
+            yield dict(zip(fields, values))
@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""Append-only change logs for saved shape files.
+
+A change log sits next to its snapshot (``Rectangle.json.log`` for
+``Rectangle.json``) and holds one JSON object per line::
+
+    {"put": {"x": 0, "y": 0, "id": 7, "height": 2, "width": 3}}
+    {"delete": 4}
+
+A put replaces the snapshot record with the same id, or adds a new record
+after the snapshot ones; a delete removes it. Replaying is idempotent, so
+a log left behind by an interrupted compaction is harmless.
+"""
+
+import json
+import os
+
+
+def log_filename(filename):
+    """Return the name of the change log that goes with filename."""
+    return filename + ".log"
+
+
+def remove_log(filename):
+    """Delete the change log of filename, if any."""
+    try:
+        os.remove(log_filename(filename))
+    except FileNotFoundError:
+        pass
+
+
+def append(filename, dictionaries=(), deleted_ids=()):
+    """
+    Append puts and deletes to the change log of filename.
+
+    A torn last line, left by an interrupted append, is cut off first, so
+    that the new lines do not complete it into an invalid one.
+
+    Args:
+        filename (str): The snapshot file the log belongs to.
+        dictionaries (iterable): Records to add or replace, by id.
+        deleted_ids (iterable): Ids of records to remove.
+
+    Returns:
+        int: The size of the log, in bytes, after the append.
+    """
+    lines = ["{}\n".format(json.dumps({"put": dic})) for dic in dictionaries]
+    lines += ["{}\n".format(json.dumps({"delete": id})) for id in deleted_ids]
+    with open(log_filename(filename), "ab+") as f:
+        _drop_torn_line(f)
+        f.write("".join(lines).encode("utf-8"))
+        return f.tell()
+
+
+def _drop_torn_line(f):
+    """Truncate a log opened in binary mode to just after its last newline."""
+    size = f.seek(0, os.SEEK_END)
+    end = size
+    while end > 0:
+        start = max(end - 4096, 0)
+        f.seek(start)
+        chunk = f.read(end - start)
+        newline = chunk.rfind(b"\n")
+        if newline >= 0:
+            end = start + newline + 1
+            break
+        end = start
+    if end != size:
+        f.truncate(end)
+    f.seek(0, os.SEEK_END)
+
+
+def read_changes(filename):
+    """
+    Fold the change log of filename into its final state per id.
+
+    A last line without its newline is the trace of an interrupted append
+    and is ignored.
+
+    Args:
+        filename (str): The snapshot file the log belongs to.
+
+    Returns:
+        dict: id -> final record, or None if the record was deleted, in
+            order of first appearance in the log. Empty if there is no log.
+
+    Raises:
+        ValueError: If a complete line of the log is not a valid change.
+    """
+    changes = {}
+    try:
+        f = open(log_filename(filename), "r")
+    except FileNotFoundError:
+        return changes
+    with f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            change = json.loads(line)
+            if "put" in change:
+                changes[change["put"]["id"]] = change["put"]
+            elif "delete" in change:
+                changes[change["delete"]] = None
+            else:
+                raise ValueError("Invalid change log line: {}".format(
+                    line.rstrip()))
+    return changes
+
+
+def replay(dictionaries, changes):
+    """
+    Yield snapshot records with a folded change log applied.
+
+    Args:
+        dictionaries (iterable): The snapshot records, in file order.
+        changes (dict): The result of read_changes.
+
+    Yields:
+        dict: Every surviving record, replaced ones in their snapshot
+            position and new ones after the snapshot, in log order.
+    """
+    seen = set()
+    for dic in dictionaries:
+        id = dic.get("id")
+        if id in changes:
+            seen.add(id)
+            if changes[id] is not None:
+                yield changes[id]
+        else:
+            yield dic
+    for id, dic in changes.items():
+        if dic is not None and id not in seen:
+            yield dic
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+"""Declarative integer fields and the code generated from them.
+
+Rectangle and Square describe their fields once, as a tuple of Field
+entries, and this module compiles that spec into specialized functions:
+one validator per field, and the __init__, _init_from_dict and
+_init_trusted methods of the class. The generated methods check every
+value inline and write the private slots directly, so building an
+instance costs no property or helper calls. They skip the property
+setters, so a subclass that overrides a setter must also override the
+methods that build instances.
+
+Functions:
+    make_validator: Specialized check for one field.
+    field_checks: The _field_checks mapping of a spec.
+    compiled: Decorator replacing a method stub by generated code.
+"""
+
+import inspect
+from collections import namedtuple
+
+from .base import Base
+
+DIMENSION = "dimension"
+OFFSET = "offset"
+
+_KINDS = {
+    DIMENSION: ("<= 0", "must be > 0"),
+    OFFSET: ("< 0", "must be >= 0"),
+}
+
+
+class Field(namedtuple("Field", "name kind default required stores")):
+    """
+    Description of one integer field of a shape.
+
+    Attributes:
+        name (str): Name of the __init__ parameter and dictionary key.
+        kind (str): DIMENSION (must be > 0) or OFFSET (must be >= 0).
+        default (int): Value used when a dictionary has no such key, and
+            the __init__ default unless the field is required.
+        required (bool): True if __init__ has no default for it.
+        stores (tuple): Names of the properties the value is stored in,
+            e.g. ("width", "height") for the size of a Square. The first
+            one names the value in error messages.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, name, kind, default, required=False, stores=None):
+        """Create a field; stores defaults to the field name alone."""
+        if kind not in _KINDS:
+            raise ValueError("Unknown field kind: {}".format(kind))
+        return super().__new__(cls, name, kind, default, required,
+                               tuple(stores or (name,)))
+
+
+def _check_lines(var, label, kind):
+    """Return the source lines validating the variable var."""
+    test, requirement = _KINDS[kind]
+    lines = [
+        "if type({0}) is not int and not isinstance({0}, int):".format(var),
+        "    raise TypeError({!r})".format(label + " must be an integer"),
+        "elif {} {}:".format(var, test),
+        "    raise ValueError({!r})".format(label + " " + requirement),
+    ]
+    return ["    " + line for line in lines]
+
+
+def _compile(name, lines, namespace=None):
+    """Execute the source of one function and return the function."""
+    namespace = dict(namespace or {})
+    exec("\n".join(lines) + "\n", namespace)
+    return namespace[name]
+
+
+_validators = {}
+
+
+def make_validator(label, kind):
+    """
+    Return a function validating one value of a field.
+
+    Args:
+        label (str): Field name used in error messages.
+        kind (str): DIMENSION or OFFSET.
+
+    Returns:
+        function: Takes the value and raises TypeError if it is not an
+            integer, or ValueError if it is out of range. Validators are
+            shared between fields with the same label and kind.
+    """
+    key = (label, kind)
+    if key not in _validators:
+        _validators[key] = _compile(
+            "check", ["def check(val):"] + _check_lines("val", label, kind))
+    return _validators[key]
+
+
+def field_checks(spec):
+    """
+    Return the _field_checks mapping used by Base.update_many.
+
+    Args:
+        spec (tuple): The Field entries of a class.
+
+    Returns:
+        dict: "id" to None and every field name to its validator.
+    """
+    checks = {"id": None}
+    for field in spec:
+        checks[field.name] = make_validator(field.stores[0], field.kind)
+    return checks
+
+
+def _slot(owner, store):
+    """Return the mangled slot attribute of a property of owner."""
+    return "self._{}__{}".format(owner, store)
+
+
+def _make_init(spec, owner):
+    """Generate __init__(self, <fields>, id=None)."""
+    params = ["self"]
+    for field in spec:
+        params.append(field.name if field.required else
+                      "{}={!r}".format(field.name, field.default))
+    lines = ["def __init__({}, id=None):".format(", ".join(params))]
+    for field in spec:
+        lines += _check_lines(field.name, field.stores[0], field.kind)
+    for field in spec:
+        lines += ["    {} = {}".format(_slot(owner, store), field.name)
+                  for store in field.stores]
+    lines += ["    if id:",
+              "        self.id = id",
+              "    else:",
+              "        self.id = get_id_allocator().allocate()",
+              "    self._dirty = -1"]
+    return _compile("__init__", lines,
+                    {"get_id_allocator": Base.get_id_allocator})
+
+
+def _make_init_from_dict(spec, owner):
+    """Generate _init_from_dict(self, dictionary), validating each value."""
+    lines = ["def _init_from_dict(self, dictionary):",
+             "    get = dictionary.get"]
+    assign = []
+    for field in spec:
+        default = repr(field.default)
+        if field.stores != (field.name,):
+            lines.append("    v{} = get({!r}, {})".format(
+                len(assign), field.name, default))
+            default = "v{}".format(len(assign))
+        for store in field.stores:
+            var = "v{}_{}".format(len(assign), store)
+            lines.append("    {} = get({!r}, {})".format(var, store, default))
+            lines += _check_lines(var, store, field.kind)
+            assign.append((store, var))
+    lines += ["    {} = {}".format(_slot(owner, store), var)
+              for store, var in assign]
+    lines += ["    if \"id\" in dictionary:",
+              "        self.id = dictionary[\"id\"]",
+              "    else:",
+              "        self.id = get_id_allocator().allocate()",
+              "    self._dirty = 0"]
+    return _compile("_init_from_dict", lines,
+                    {"get_id_allocator": Base.get_id_allocator})
+
+
+def _make_init_trusted(spec, owner):
+    """Generate _init_trusted(self, dictionary), with no validation."""
+    lines = ["def _init_trusted(self, dictionary):"]
+    for field in spec:
+        targets = " = ".join(_slot(owner, store) for store in field.stores)
+        lines.append("    {} = dictionary[{!r}]".format(targets, field.name))
+    lines += ["    self.id = dictionary[\"id\"]",
+              "    self._dirty = 0"]
+    return _compile("_init_trusted", lines)
+
+
+_MAKERS = {
+    "__init__": _make_init,
+    "_init_from_dict": _make_init_from_dict,
+    "_init_trusted": _make_init_trusted,
+}
+
+
+def compiled(spec, owner):
+    """
+    Return a decorator replacing a method stub by code generated from spec.
+
+    The stub gives the method its name, signature and docstring; its body
+    is never run. Supported names are __init__, _init_from_dict and
+    _init_trusted.
+
+    Args:
+        spec (tuple): The Field entries of the class.
+        owner (str): Name of the class whose private slots hold the
+            values, e.g. "Rectangle" for both Rectangle and Square.
+
+    Returns:
+        function: The decorator.
+
+    Raises:
+        TypeError: If the stub's signature differs from the generated one.
+    """
+    def decorator(stub):
+        """Swap stub for its generated counterpart."""
+        func = _MAKERS[stub.__name__](spec, owner)
+        if inspect.signature(func) != inspect.signature(stub):
+            raise TypeError("{} signature does not match its spec".format(
+                stub.__qualname__))
+        func.__doc__ = stub.__doc__
+        func.__qualname__ = stub.__qualname__
+        func.__module__ = stub.__module__
+        return func
+    return decorator
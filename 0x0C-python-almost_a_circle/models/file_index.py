@@ -0,0 +1,233 @@
+#!/usr/bin/python3
+"""Id to byte-offset indexes for saved shape files.
+
+An index sits next to its data file (``Rectangle.json.idx`` for
+``Rectangle.json``) and lets single records be decoded straight out of a
+memory map of the data file, without parsing the rest of it::
+
+    magic      4 bytes   b"SHPI"
+    version    1 byte    1
+    format     1 byte    0 for JSON, 1 for binary
+    padding    2 bytes
+    data_size  8 bytes   size of the data file when the index was built
+    count      8 bytes   number of entries
+    reserved   8 bytes
+    ids        count * 8 bytes, sorted ascending
+    offsets    count * 8 bytes, byte offset of each record
+    lengths    count * 8 bytes, byte length of each record
+
+All integers are native-endian signed 64-bit values, so the three columns
+can be viewed in place with ``memoryview.cast("q")``.
+
+Classes:
+    ShapeIndex: Open index and data file answering lookups by id.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+
+from . import binary_format, change_log
+
+MAGIC = b"SHPI"
+VERSION = 1
+FORMATS = ("json", "binary")
+_HEADER = struct.Struct("=4sBB2xqq8x")
+
+
+def index_filename(filename):
+    """Return the name of the index file that goes with filename."""
+    return filename + ".idx"
+
+
+def remove_index(filename):
+    """Delete the index of filename, if any, once the file is rewritten."""
+    try:
+        os.remove(index_filename(filename))
+    except FileNotFoundError:
+        pass
+
+
+def write_index(filename, fmt, ids, spans):
+    """
+    Write the index of a data file that has just been saved.
+
+    Args:
+        filename (str): The data file the index describes.
+        fmt (str): "json" or "binary".
+        ids (list): The id of every record, in file order.
+        spans (list): The (offset, length) of every record, in file order.
+
+    Raises:
+        ValueError: If an id is not an integer.
+    """
+    if any(type(i) is not int for i in ids):
+        raise ValueError("Only integer ids can be indexed")
+    order = sorted(range(len(ids)), key=ids.__getitem__)
+    columns = (array("q", [ids[i] for i in order]),
+               array("q", [spans[i][0] for i in order]),
+               array("q", [spans[i][1] for i in order]))
+    with open(index_filename(filename), "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, FORMATS.index(fmt),
+                             os.path.getsize(filename), len(ids)))
+        for column in columns:
+            column.tofile(f)
+
+
+class ShapeIndex:
+    """
+    Memory-mapped index and data file of one saved shape class.
+
+    Keeping a ShapeIndex open makes each lookup a binary search in the
+    mapped id column followed by decoding one record, with no file system
+    calls. Use it as a context manager, or call close() when done.
+
+    Attributes:
+        cls (type): The class instances are created with.
+        filename (str): The data file.
+        fmt (str): "json" or "binary".
+    """
+
+    def __init__(self, cls, filename):
+        """
+        Open filename and its index.
+
+        Args:
+            cls (type): A Base subclass with a create class method.
+            filename (str): The data file written with index=True.
+
+        Raises:
+            FileNotFoundError: If the data file or its index is missing.
+            ValueError: If the index is invalid or older than the data file,
+                or the data file has a change log.
+        """
+        self.cls = cls
+        self.filename = filename
+        self._maps = []
+        try:
+            self._open()
+        except BaseException:
+            self.close()
+            raise
+
+    def _map(self, filename):
+        """Return a read-only mmap of filename, empty files as b""."""
+        with open(filename, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return b""
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mm)
+        return mm
+
+    def _open(self):
+        """Map both files and set up views of the index columns."""
+        idx = self._map(index_filename(self.filename))
+        if len(idx) < _HEADER.size:
+            raise ValueError("Invalid index file")
+        magic, version, fmt, data_size, count = _HEADER.unpack_from(idx)
+        if magic != MAGIC or version != VERSION or fmt >= len(FORMATS):
+            raise ValueError("Invalid index file")
+        if os.path.getsize(self.filename) != data_size:
+            raise ValueError("Index is out of date, save the file again")
+        if os.path.exists(change_log.log_filename(self.filename)):
+            raise ValueError("File has unsaved changes, compact it first")
+        self.fmt = FORMATS[fmt]
+        self._data = self._map(self.filename)
+
+        self._views = []
+        if count:
+            view = memoryview(idx)
+            columns = view[_HEADER.size:_HEADER.size + 24 * count].cast("q")
+            self._views += [view, columns]
+        else:
+            columns = []
+        self._ids = columns[:count]
+        self._offsets = columns[count:2 * count]
+        self._lengths = columns[2 * count:]
+        self._views += [self._ids, self._offsets, self._lengths]
+
+        if self.fmt == "binary" and count:
+            name, fields, _, _ = binary_format.decode_header(self._data)
+            if name != self.cls.__name__:
+                raise ValueError("File holds {} records, not {}".format(
+                    name, self.cls.__name__))
+            self._fields = fields
+            self._record = binary_format.record_struct(fields)
+
+    def __len__(self):
+        """Return the number of indexed records."""
+        return len(self._ids)
+
+    def __contains__(self, id):
+        """Return True if a record with this id is indexed."""
+        pos = bisect_left(self._ids, id)
+        return pos < len(self._ids) and self._ids[pos] == id
+
+    def get_dictionary(self, id):
+        """
+        Decode the record with the given id.
+
+        Args:
+            id (int): The id to look up.
+
+        Returns:
+            dict: The record, or None if the id is not in the index.
+        """
+        ids = self._ids
+        pos = bisect_left(ids, id)
+        if pos == len(ids) or ids[pos] != id:
+            return None
+        offset = self._offsets[pos]
+        if self.fmt == "binary":
+            return dict(zip(self._fields,
+                            self._record.unpack_from(self._data, offset)))
+        return json.loads(self._data[offset:offset + self._lengths[pos]])
+
+    def get(self, id):
+        """
+        Create the instance saved with the given id.
+
+        Args:
+            id (int): The id to look up.
+
+        Returns:
+            object: A new instance of cls, or None if the id is unknown.
+        """
+        dictionary = self.get_dictionary(id)
+        if dictionary is None:
+            return None
+        return self.cls.create(**dictionary)
+
+    def get_many(self, ids):
+        """
+        Create the instances saved with the given ids.
+
+        Args:
+            ids (iterable): The ids to look up.
+
+        Returns:
+            list: One entry per requested id, in the same order; entries
+                for unknown ids are None.
+        """
+        return [self.get(id) for id in ids]
+
+    def close(self):
+        """Release the memory maps of both files."""
+        for view in reversed(getattr(self, "_views", ())):
+            if isinstance(view, memoryview):
+                view.release()
+        self._views = []
+        self._ids = self._offsets = self._lengths = []
+        while self._maps:
+            self._maps.pop().close()
+
+    def __enter__(self):
+        """Return the open index."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the index when leaving a with block."""
+        self.close()
@@ -0,0 +1,242 @@
+#!/usr/bin/python3
+"""Module for allocating unique ids to Base instances.
+
+This module provides the allocators that Base uses to number instances
+created without an explicit id. Ids are handed out from per-thread blocks
+reserved from a shared counter, so threads only synchronize when their
+block runs out, and the shared counter can live in shared memory so that
+worker processes never hand out the same id twice.
+
+Classes:
+    IdAllocator: Thread-safe allocator for a single process.
+    ClassCounterAllocator: IdAllocator counting in a class attribute.
+    ProcessIdAllocator: Allocator shared between multiprocessing workers.
+"""
+
+import multiprocessing
+import os
+import threading
+import weakref
+
+
+def _after_fork(ref):
+    """Reset the allocator behind a weak reference in a forked child."""
+    allocator = ref()
+    if allocator is not None:
+        allocator._lock = threading.Lock()
+        allocator._generation += 1
+
+
+class IdAllocator:
+    """
+    Thread-safe allocator of increasing integer ids.
+
+    Each thread draws ids from its own block of ``block_size`` consecutive
+    ids, reserved under a lock from the shared counter. Within a block no
+    lock is taken. With a single thread ids are always consecutive, which
+    keeps the classic 1, 2, 3... numbering of Base.
+
+    Attributes:
+        block_size (int): Number of ids reserved per thread at a time.
+    """
+
+    def __init__(self, start=1, block_size=1):
+        """
+        Initialize an allocator whose first id is start.
+
+        Args:
+            start (int, optional): The first id handed out. Defaults to 1.
+            block_size (int, optional): Ids reserved per thread at a time.
+                Larger blocks reduce lock traffic between threads, at the
+                cost of ids not being globally ordered by creation time.
+                Defaults to 1.
+
+        Raises:
+            TypeError: If start or block_size is not an integer.
+            ValueError: If block_size <= 0.
+        """
+        if not isinstance(start, int) or not isinstance(block_size, int):
+            raise TypeError("start and block_size must be integers")
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next = start
+        self._generation = 0
+        self._local = threading.local()
+        if hasattr(os, "register_at_fork"):
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: _after_fork(ref))
+
+    def _take(self, count):
+        """Advance the shared counter by count and return the old value."""
+        with self._lock:
+            first = self._next
+            self._next += count
+            return first
+
+    def _raise_floor(self, floor):
+        """Move the shared counter to at least floor; True if it moved."""
+        with self._lock:
+            if self._next < floor:
+                self._next = floor
+                return True
+            return False
+
+    def reserve(self, count):
+        """
+        Reserve count consecutive ids at once.
+
+        Useful to pre-assign ids to a batch of objects, or to hand a
+        range to another worker.
+
+        Args:
+            count (int): Number of ids to reserve (must be > 0).
+
+        Returns:
+            range: The reserved ids.
+
+        Raises:
+            ValueError: If count <= 0.
+        """
+        if count <= 0:
+            raise ValueError("count must be > 0")
+        first = self._take(count)
+        return range(first, first + count)
+
+    def allocate(self):
+        """
+        Return the next id for the calling thread.
+
+        Returns:
+            int: An id never returned before by this allocator.
+        """
+        local = self._local
+        if getattr(local, "generation", None) == self._generation:
+            if local.next < local.end:
+                res = local.next
+                local.next = res + 1
+                return res
+        res = self._take(self.block_size)
+        local.next = res + 1
+        local.end = res + self.block_size
+        local.generation = self._generation
+        return res
+
+    def advance_past(self, max_id):
+        """
+        Make sure every future id is greater than max_id.
+
+        Blocks already reserved by threads could hold smaller ids, so they
+        are discarded and each thread reserves a fresh block on its next
+        allocation.
+
+        Args:
+            max_id (int): The largest id already in use.
+        """
+        if self._raise_floor(max_id + 1):
+            with self._lock:
+                self._generation += 1
+
+
+class ClassCounterAllocator(IdAllocator):
+    """
+    Thread-safe allocator whose counter is an attribute of a class.
+
+    The attribute holds the last id handed out, like the classic
+    ``__nb_objects`` counter of Base, which is what this allocator keeps
+    by default. It is read under the lock on every reservation, so
+    assigning it from outside, e.g. ``Base._Base__nb_objects = 0``,
+    restarts numbering from the next id on. With a block_size above 1,
+    blocks already reserved by threads are used up first.
+
+    Attributes:
+        owner (type): The class holding the counter.
+        name (str): The name of the counter attribute.
+        block_size (int): Number of ids reserved per thread at a time.
+    """
+
+    def __init__(self, owner, name, block_size=1):
+        """
+        Initialize an allocator counting in owner.name.
+
+        Args:
+            owner (type): The class holding the counter.
+            name (str): The attribute name, mangled if it is private.
+            block_size (int, optional): Ids reserved per thread at a time.
+                Defaults to 1.
+        """
+        super().__init__(block_size=block_size)
+        self.owner = owner
+        self.name = name
+
+    def _take(self, count):
+        """Advance the class counter by count and return the first id."""
+        with self._lock:
+            first = getattr(self.owner, self.name) + 1
+            setattr(self.owner, self.name, first + count - 1)
+            return first
+
+    def _raise_floor(self, floor):
+        """Move the class counter to at least floor - 1; True if it moved."""
+        with self._lock:
+            if getattr(self.owner, self.name) < floor - 1:
+                setattr(self.owner, self.name, floor - 1)
+                return True
+            return False
+
+
+class ProcessIdAllocator(IdAllocator):
+    """
+    Allocator whose counter is shared by multiprocessing workers.
+
+    The counter lives in a ``multiprocessing.Value``, so every process
+    reserves its blocks from the same sequence. Create it in the parent
+    and install it in each worker, for example from a Pool initializer::
+
+        alloc = ProcessIdAllocator(block_size=1024)
+        Pool(initializer=Base.set_id_allocator, initargs=(alloc,))
+
+    Attributes:
+        block_size (int): Number of ids reserved per thread at a time.
+    """
+
+    def __init__(self, start=1, block_size=1024, shared=None):
+        """
+        Initialize an allocator backed by a shared counter.
+
+        Args:
+            start (int, optional): The first id handed out. Ignored when
+                shared is given. Defaults to 1.
+            block_size (int, optional): Ids reserved per thread at a time.
+                Defaults to 1024.
+            shared (multiprocessing.Value, optional): An existing shared
+                counter to attach to. Defaults to a new one.
+        """
+        super().__init__(start, block_size)
+        if shared is None:
+            shared = multiprocessing.Value("q", start)
+        self._shared = shared
+
+    def __getstate__(self):
+        """Only the shared counter and block size cross process bounds."""
+        return {"shared": self._shared, "block_size": self.block_size}
+
+    def __setstate__(self, state):
+        """Rebuild the per-process state around the shared counter."""
+        self.__init__(block_size=state["block_size"], shared=state["shared"])
+
+    def _take(self, count):
+        """Advance the shared counter by count and return the old value."""
+        with self._shared.get_lock():
+            first = self._shared.value
+            self._shared.value = first + count
+            return first
+
+    def _raise_floor(self, floor):
+        """Move the shared counter to at least floor; True if it moved."""
+        with self._shared.get_lock():
+            if self._shared.value < floor:
+                self._shared.value = floor
+                return True
+            return False
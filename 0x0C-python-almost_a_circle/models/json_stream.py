@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+"""Streaming helpers for JSON arrays of dictionaries.
+
+This module writes and reads the same ``[{...}, {...}]`` layout produced by
+``Base.to_json_string``, but one record at a time, so the memory needed to
+save or load a file does not grow with the number of records in it.
+"""
+
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_DECODER = json.JSONDecoder()
+
+
+def dump_iter(dictionaries, f, spans=None):
+    """Write an iterable of dictionaries to a text file as a JSON array.
+
+    The output is byte for byte what ``json.dumps(list(dictionaries))``
+    would produce, but only one record is encoded at any time.
+
+    Args:
+        dictionaries (iterable): The dictionaries to write, in order.
+        f (file): A text file object opened for writing.
+        spans (list, optional): If given, the (offset, length) of each
+            record relative to the start of the array is appended to it.
+            The encoder escapes all non-ASCII characters, so offsets in
+            characters are also offsets in bytes.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    pos = 1
+    f.write("[")
+    for dic in dictionaries:
+        if count:
+            f.write(", ")
+            pos += 2
+        text = json.dumps(dic)
+        f.write(text)
+        if spans is not None:
+            spans.append((pos, len(text)))
+        pos += len(text)
+        count += 1
+    f.write("]")
+    return count
+
+
+def load_iter(f, chunk_size=65536):
+    """Yield the elements of a JSON array read incrementally from a file.
+
+    The file is read in chunks of ``chunk_size`` characters and each element
+    is decoded as soon as it is complete, so only one element (plus one
+    chunk) is held in memory at a time. An empty file yields nothing, to
+    match ``Base.from_json_string``. Elements may be any JSON values,
+    including numbers cut by a chunk boundary, and nothing but whitespace
+    may follow the closing bracket.
+
+    Args:
+        f (file): A text file object opened for reading.
+        chunk_size (int, optional): Number of characters read per call.
+            Defaults to 65536.
+
+    Yields:
+        object: Each decoded element of the top-level array.
+
+    Raises:
+        ValueError: If the file does not contain a single JSON array; for
+            text after the array, only once every element has been yielded.
+    """
+    buf = f.read(chunk_size)
+    pos = 0
+    eof = not buf
+    started = False
+    expect_value = True
+    after_comma = False
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                if started:
+                    raise ValueError("Unterminated JSON array")
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+
+        char = buf[pos]
+        if not started:
+            if char != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            pos += 1
+        elif char == "]":
+            if after_comma:
+                raise ValueError("Trailing comma in JSON array")
+            pos += 1
+            while True:
+                pos = _WHITESPACE.match(buf, pos).end()
+                if pos < len(buf):
+                    raise ValueError("Extra data after JSON array")
+                if eof:
+                    return
+                buf = f.read(chunk_size)
+                eof = not buf
+                pos = 0
+        elif char == ",":
+            if expect_value:
+                raise ValueError("Unexpected ',' in JSON array")
+            expect_value = True
+            after_comma = True
+            pos += 1
+        else:
+            if not expect_value:
+                raise ValueError("Expected ',' or ']' in JSON array")
+            try:
+                value, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = len(buf)
+            # A value ending at the end of the buffer, or followed by a
+            # character that could continue a number, may have been cut
+            # by the chunk boundary: decode it again with more text.
+            if not eof and (end == len(buf) or buf[end] in _NUMBER_CHARS):
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield value
+            expect_value = False
+            after_comma = False
+            pos = end
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""Lazy stand-ins for shapes loaded from a file.
+
+Base.load_from_file(lazy=True) returns a LazyShapeList holding the
+decoded records. Indexing it gives a LazyShape proxy, created on first
+access, and the real Rectangle or Square behind a proxy is only built,
+and its values validated, the first time an attribute or method other
+than ``id`` is used; from then on the proxy forwards everything to it.
+Loading a large file then costs little more than decoding it, and only
+the shapes actually used are ever built.
+
+Classes:
+    LazyShape: Proxy of one saved record.
+    LazyShapeList: Read-only sequence of the proxies of a file.
+"""
+
+from collections.abc import Sequence
+
+_setattr = object.__setattr__
+
+
+class LazyShape:
+    """
+    Proxy building an instance of cls from its record on first use.
+
+    ``isinstance(proxy, Rectangle)`` holds for a proxy of a Rectangle
+    record, and ``str(proxy)`` is the string of the instance. Reading
+    ``id`` does not build the instance when the record has one.
+
+    Invalid values are only reported when the instance is built, by the
+    TypeError or ValueError that create would raise.
+    """
+
+    __slots__ = ("_cls", "_record", "_obj", "_trusted")
+
+    def __init__(self, cls, record, trusted=False):
+        """
+        Initialize a proxy of one record.
+
+        Args:
+            cls (type): The class of the instance to build.
+            record (dict): The record, in the to_dictionary format.
+            trusted (bool, optional): If True, build the instance without
+                validating the record (see Base.from_dicts).
+                Defaults to False.
+        """
+        _setattr(self, "_cls", cls)
+        _setattr(self, "_record", record)
+        _setattr(self, "_obj", None)
+        _setattr(self, "_trusted", trusted)
+
+    def _materialize(self):
+        """Return the instance, building it on the first call."""
+        obj = self._obj
+        if obj is None:
+            cls = self._cls
+            obj = cls.__new__(cls)
+            if self._trusted:
+                obj._init_trusted(self._record)
+            else:
+                obj._init_from_dict(self._record)
+            _setattr(self, "_obj", obj)
+            _setattr(self, "_record", None)
+        return obj
+
+    def is_materialized(self):
+        """Return True if the instance has been built."""
+        return self._obj is not None
+
+    @property
+    def __class__(self):
+        """Report the class of the instance, for isinstance checks."""
+        return self._cls
+
+    @property
+    def id(self):
+        """The id of the record, read without building the instance."""
+        if self._obj is None and "id" in self._record:
+            return self._record["id"]
+        return self._materialize().id
+
+    @id.setter
+    def id(self, value):
+        """Set the id of the instance."""
+        self._materialize().id = value
+
+    def __getattr__(self, name):
+        """Forward any other attribute lookup to the instance."""
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name, value):
+        """Forward attribute assignments to the instance."""
+        setattr(self._materialize(), name, value)
+
+    def __str__(self):
+        """Return the string of the instance."""
+        return str(self._materialize())
+
+
+class LazyShapeList(Sequence):
+    """
+    Read-only sequence of LazyShape proxies over a list of records.
+
+    Each proxy is created the first time its index is accessed, and the
+    same proxy is returned afterwards. Slicing returns a list of proxies.
+    """
+
+    def __init__(self, cls, records, trusted=False):
+        """
+        Initialize the sequence.
+
+        Args:
+            cls (type): The class of the instances to build.
+            records (iterable): Records in the to_dictionary format.
+            trusted (bool, optional): Passed on to every proxy.
+                Defaults to False.
+        """
+        self._cls = cls
+        self._records = list(records)
+        self._proxies = [None] * len(self._records)
+        self._trusted = trusted
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._records)
+
+    def __getitem__(self, index):
+        """Return the proxy at index, or a list of proxies for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        proxy = self._proxies[index]
+        if proxy is None:
+            proxy = LazyShape(self._cls, self._records[index], self._trusted)
+            self._proxies[index] = proxy
+        return proxy
+
+    def ids(self):
+        """
+        Return the ids of the records, without creating any proxy.
+
+        Returns:
+            list: One id per record, or None for records without one.
+        """
+        return [record.get("id") for record in self._records]
+
+    def materialize(self):
+        """
+        Build every instance.
+
+        Returns:
+            list: The real instances, in order.
+        """
+        return [proxy._materialize() for proxy in self]
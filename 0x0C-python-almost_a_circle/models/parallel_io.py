@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+"""Concurrent saving and loading of several model classes.
+
+Base.save_all and Base.load_all delegate to this module. Each class keeps
+its own file, named exactly as save_to_file names it, and files are
+handled concurrently by a thread pool. Large JSON lists are additionally
+encoded in chunks by a process pool, since encoding holds the GIL; the
+chunks are written back in order, so the output is byte for byte what
+save_to_file produces.
+
+The process pool is started with the forkserver method (spawn where it
+is unavailable), never fork: the workers are started while the saving
+threads are running, and forking a multi-threaded process can deadlock.
+"""
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import change_log, file_index
+
+CHUNK_SIZE = 20000
+
+
+def _process_context():
+    """Return the multiprocessing context used for the process pool."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _encode_chunk(dictionaries):
+    """Return the JSON array items of dictionaries, without the brackets."""
+    return json.dumps(dictionaries)[1:-1]
+
+
+def _save_json_chunked(cls, list_objs, filename, processes):
+    """Save a large list like save_to_file, encoding chunks in processes."""
+    dictionaries = cls._saved_dictionaries(list_objs)
+    chunks = []
+    chunk = []
+    for dictionary in dictionaries:
+        chunk.append(dictionary)
+        if len(chunk) == CHUNK_SIZE:
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    with open(filename, "w") as f:
+        f.write("[")
+        for i, text in enumerate(processes.map(_encode_chunk, chunks)):
+            if i:
+                f.write(", ")
+            f.write(text)
+        f.write("]")
+    file_index.remove_index(filename)
+    change_log.remove_log(filename)
+
+
+def group_by_class(objects):
+    """
+    Return {class: [objects]} for a mapping or a flat iterable.
+
+    Args:
+        objects: Either a mapping of classes to lists of their instances,
+            or an iterable of instances grouped here by exact type.
+
+    Returns:
+        dict: Classes to lists of instances.
+    """
+    if hasattr(objects, "items"):
+        return {cls: list(objs or ()) for cls, objs in objects.items()}
+    groups = {}
+    for obj in objects:
+        groups.setdefault(type(obj), []).append(obj)
+    return groups
+
+
+def save_all(groups, directory, fmt, workers, process_threshold):
+    """
+    Save every class of groups to its own file concurrently.
+
+    Args:
+        groups (dict): Classes to lists of instances.
+        directory (str): Directory the files are written to.
+        fmt (str): "json" or "binary", or None for JSON.
+        workers (int): Maximum number of threads and of processes.
+        process_threshold (int): JSON lists at least this long are encoded
+            by the process pool; shorter ones by their thread.
+
+    Returns:
+        list: The written file names, sorted.
+    """
+    jobs = []
+    for cls in sorted(groups, key=lambda c: c.__name__):
+        filename, fmt_used = cls._file_and_format(None, fmt)
+        objs = groups[cls]
+        big = fmt_used == "json" and len(objs) >= process_threshold
+        jobs.append((cls, objs, os.path.join(directory, filename),
+                     fmt_used, big))
+    processes = None
+    if any(job[4] for job in jobs):
+        processes = ProcessPoolExecutor(workers,
+                                        mp_context=_process_context())
+    try:
+        with ThreadPoolExecutor(workers) as threads:
+            futures = []
+            for cls, objs, filename, fmt_used, big in jobs:
+                if big:
+                    futures.append(threads.submit(
+                        _save_json_chunked, cls, objs, filename, processes))
+                else:
+                    futures.append(threads.submit(
+                        cls.save_to_file, objs, filename, fmt_used))
+            for future in futures:
+                future.result()
+    finally:
+        if processes is not None:
+            processes.shutdown()
+    return [job[2] for job in jobs]
+
+
+def load_all(classes, directory, fmt, workers):
+    """
+    Load the file of every class concurrently.
+
+    Args:
+        classes (iterable): The classes to load.
+        directory (str): Directory the files are read from.
+        fmt (str): "json" or "binary", or None for JSON.
+        workers (int): Maximum number of threads.
+
+    Returns:
+        dict: Class names to lists of instances, in class name order.
+    """
+    classes = sorted(classes, key=lambda c: c.__name__)
+    with ThreadPoolExecutor(workers) as threads:
+        futures = []
+        for cls in classes:
+            filename, fmt_used = cls._file_and_format(None, fmt)
+            futures.append(threads.submit(
+                cls.load_from_file, filename=os.path.join(directory, filename),
+                fmt=fmt_used))
+        return {cls.__name__: future.result()
+                for cls, future in zip(classes, futures)}
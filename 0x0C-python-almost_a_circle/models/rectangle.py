@@ -12,8 +12,16 @@ Classes:
     Rectangle: Represents a geometric rectangle with width, height, and (x, y) position.
 """
 
+import sys
+
+from . import fields, render
 from .base import Base
 
+_check_width = fields.make_validator("width", fields.DIMENSION)
+_check_height = fields.make_validator("height", fields.DIMENSION)
+_check_x = fields.make_validator("x", fields.OFFSET)
+_check_y = fields.make_validator("y", fields.OFFSET)
+
 
 class Rectangle(Base):
     """
@@ -28,8 +36,27 @@ class Rectangle(Base):
         x (int): The horizontal offset of the rectangle (must be >= 0).
         y (int): The vertical offset of the rectangle (must be >= 0).
         id (int): Identifier for the instance, managed by the Base class.
+
+    The private attributes are stored in ``__slots__`` rather than in a
+    per-instance ``__dict__``, which keeps each instance small.
+
+    The fields are declared once in ``_spec``, from which models.fields
+    generates __init__, _init_from_dict and _init_trusted, along with the
+    validators used by the setters and update_many.
     """
 
+    __slots__ = ("__width", "__height", "__x", "__y")
+    _spec = (
+        fields.Field("width", fields.DIMENSION, 1, required=True),
+        fields.Field("height", fields.DIMENSION, 1, required=True),
+        fields.Field("x", fields.OFFSET, 0),
+        fields.Field("y", fields.OFFSET, 0),
+    )
+    _fields = ("id", "width", "height", "x", "y")
+    _field_bits = {"id": 1, "width": 2, "height": 4, "x": 8, "y": 16}
+    _field_checks = fields.field_checks(_spec)
+
+    @fields.compiled(_spec, "Rectangle")
     def __init__(self, width, height, x=0, y=0, id=None):
         """
         Initialize a Rectangle instance with the given dimensions and position.
@@ -45,11 +72,39 @@ class Rectangle(Base):
             TypeError: If any provided argument is not an integer.
             ValueError: If width or height <= 0, or if x or y < 0.
         """
-        self.width = width
-        self.height = height
-        self.x = x
-        self.y = y
-        super().__init__(id)
+
+    @fields.compiled(_spec, "Rectangle")
+    def _init_from_dict(self, dictionary):
+        """
+        Initialize a bare instance from a to_dictionary style mapping.
+
+        Used by Base.create and Base.from_dicts. Each value is validated
+        once; missing values default to a width and height of 1 and an x
+        and y of 0.
+
+        Args:
+            dictionary (dict): Attribute names and values.
+
+        Raises:
+            TypeError: If any provided value is not an integer.
+            ValueError: If width or height <= 0, or if x or y < 0.
+        """
+
+    @fields.compiled(_spec, "Rectangle")
+    def _init_trusted(self, dictionary):
+        """
+        Initialize a bare instance from a complete, already valid mapping.
+
+        Used by Base.from_dicts with trusted=True, for records written by
+        save_to_file: the values are stored without any check.
+
+        Args:
+            dictionary (dict): The "id", "width", "height", "x" and "y"
+                values.
+
+        Raises:
+            KeyError: If a value is missing.
+        """
 
     @property
     def width(self):
@@ -73,10 +128,7 @@ class Rectangle(Base):
             TypeError: If val is not an integer.
             ValueError: If val <= 0.
         """
-        if not isinstance(val, int):
-            raise TypeError("{} must be an integer".format("width"))
-        elif val <= 0:
-            raise ValueError("{} must be > 0".format("width"))
+        _check_width(val)
         self.__width = val
 
     @property
@@ -101,10 +153,7 @@ class Rectangle(Base):
             TypeError: If val is not an integer.
             ValueError: If val <= 0.
         """
-        if not isinstance(val, int):
-            raise TypeError("{} must be an integer".format("height"))
-        elif val <= 0:
-            raise ValueError("{} must be > 0".format("height"))
+        _check_height(val)
         self.__height = val
 
     @property
@@ -129,10 +178,7 @@ class Rectangle(Base):
             TypeError: If val is not an integer.
             ValueError: If val < 0.
         """
-        if not isinstance(val, int):
-            raise TypeError("{} must be an integer".format("x"))
-        elif val < 0:
-            raise ValueError("{} must be >= 0".format("x"))
+        _check_x(val)
         self.__x = val
 
     @property
@@ -157,10 +203,7 @@ class Rectangle(Base):
             TypeError: If val is not an integer.
             ValueError: If val < 0.
         """
-        if not isinstance(val, int):
-            raise TypeError("{} must be an integer".format("y"))
-        elif val < 0:
-            raise ValueError("{} must be >= 0".format("y"))
+        _check_y(val)
         self.__y = val
 
     def area(self):
@@ -172,16 +215,21 @@ class Rectangle(Base):
         """
         return self.height * self.width
 
-    def display(self):
+    def display(self, stream=None):
         """
         Print a text-based representation of the rectangle.
 
         The rectangle is represented by the '#' character, with vertical
-        and horizontal offsets determined by y and x respectively.
+        and horizontal offsets determined by y and x respectively. The
+        whole drawing is built first and written with a single call.
+
+        Args:
+            stream (file, optional): Text stream to write to. Defaults to
+                sys.stdout.
         """
-        print("\n" * self.y, end="")
-        for i in range(self.height):
-            print(" " * self.x + "#" * self.width)
+        if stream is None:
+            stream = sys.stdout
+        stream.write(render.render(self))
 
     def __str__(self):
         """
@@ -214,25 +262,22 @@ class Rectangle(Base):
                 4: y
             **kwargs: Arbitrary keyword arguments matching attribute names.
 
+        Values equal to the current ones are skipped, and the fields that
+        really change are recorded as dirty (see Base.dirty_fields).
+
         Example:
             r.update(10, 20, 30, 5, 5)
             r.update(id=10, width=20, height=30, x=5, y=5)
         """
         if args:
-            for i in range(len(args)):
-                if i == 0:
-                    self.id = args[0]
-                if i == 1:
-                    self.width = args[1]
-                if i == 2:
-                    self.height = args[2]
-                if i == 3:
-                    self.x = args[3]
-                if i == 4:
-                    self.y = args[4]
+            for name, value in zip(self._fields, args):
+                self._set_field(name, value)
         elif kwargs:
+            bits = self._field_bits
             for i in kwargs:
-                if hasattr(self, i):
+                if i in bits:
+                    self._set_field(i, kwargs[i])
+                elif hasattr(self, i):
                     setattr(self, i, kwargs[i])
 
     def to_dictionary(self):
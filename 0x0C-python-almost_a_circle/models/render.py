@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""Text rendering of rectangles and squares.
+
+This module builds the '#' drawings printed by Rectangle.display, and the
+[Rectangle]/[Square] summary lines of __str__, as whole strings so that
+any number of shapes can be written to a stream with a single write call
+instead of one print per row.
+
+Functions:
+    render: Drawing of one shape, as printed by display.
+    render_many: Drawings of several shapes, one after the other.
+    render_canvas: Several shapes composed on one shared grid.
+    display_many: Write the drawings of several shapes in one call.
+    print_many: Write the __str__ lines of several shapes in one call.
+"""
+
+import sys
+
+
+def render(shape, char="#"):
+    """
+    Return the drawing of a shape, exactly as display prints it.
+
+    Args:
+        shape (Rectangle): The shape to draw.
+        char (str, optional): Character used to fill it. Defaults to "#".
+
+    Returns:
+        str: y empty lines, then height rows of x spaces followed by width
+            fill characters, each ending with a newline.
+    """
+    row = " " * shape.x + char * shape.width + "\n"
+    return "\n" * shape.y + row * shape.height
+
+
+def render_many(shapes, char="#"):
+    """
+    Return the drawings of several shapes, one after the other.
+
+    Args:
+        shapes (iterable): The shapes to draw, in order.
+        char (str, optional): Character used to fill them. Defaults to "#".
+
+    Returns:
+        str: The concatenation of render(shape) for every shape.
+    """
+    return "".join([render(shape, char) for shape in shapes])
+
+
+def render_canvas(shapes, width=None, height=None, char="#"):
+    """
+    Return several shapes drawn on one grid at their x/y positions.
+
+    Overlapping shapes simply merge. Trailing blanks are stripped from
+    every row.
+
+    Args:
+        shapes (iterable): The shapes to draw.
+        width (int, optional): Number of columns. Defaults to the right
+            edge of the rightmost shape; wider shapes are clipped.
+        height (int, optional): Number of rows. Defaults to the bottom
+            edge of the lowest shape; taller shapes are clipped.
+        char (str, optional): A single ASCII fill character.
+            Defaults to "#".
+
+    Returns:
+        str: The rows of the canvas, each ending with a newline.
+    """
+    shapes = list(shapes)
+    if width is None:
+        width = max((s.x + s.width for s in shapes), default=0)
+    if height is None:
+        height = max((s.y + s.height for s in shapes), default=0)
+    fill = char.encode("ascii")
+    rows = [bytearray(b" " * width) for _ in range(height)]
+    for shape in shapes:
+        left = min(shape.x, width)
+        right = min(shape.x + shape.width, width)
+        span = fill * (right - left)
+        for row in rows[shape.y:shape.y + shape.height]:
+            row[left:right] = span
+    return "".join([row.rstrip().decode("ascii") + "\n" for row in rows])
+
+
+def display_many(shapes, stream=None, char="#"):
+    """
+    Write the drawings of several shapes with a single write call.
+
+    Args:
+        shapes (iterable): The shapes to draw, in order.
+        stream (file, optional): Text stream to write to. Defaults to
+            sys.stdout.
+        char (str, optional): Character used to fill them. Defaults to "#".
+
+    Returns:
+        int: The number of characters written.
+    """
+    if stream is None:
+        stream = sys.stdout
+    return stream.write(render_many(shapes, char))
+
+
+def print_many(shapes, stream=None):
+    """
+    Write the __str__ line of several shapes with a single write call.
+
+    Args:
+        shapes (iterable): The shapes to describe, in order.
+        stream (file, optional): Text stream to write to. Defaults to
+            sys.stdout.
+
+    Returns:
+        int: The number of characters written.
+    """
+    if stream is None:
+        stream = sys.stdout
+    return stream.write("".join([str(shape) + "\n" for shape in shapes]))
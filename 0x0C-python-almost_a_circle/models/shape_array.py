@@ -0,0 +1,317 @@
+#!/usr/bin/python3
+"""Module for columnar collections of rectangles and squares.
+
+This module provides the ShapeArray class, which stores the id, width,
+height, x and y of many shapes in parallel typed arrays instead of one
+Python object per shape. Bulk queries such as total area, filtering,
+sorting and bounding boxes then run over whole columns at once, using
+NumPy when it is installed and the standard ``array`` module otherwise.
+
+Classes:
+    ShapeArray: A column-oriented collection of Rectangle or Square data.
+"""
+
+from array import array
+from operator import mul
+
+from .rectangle import Rectangle
+from .square import Square
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ShapeArray:
+    """
+    Column-oriented storage for a homogeneous collection of shapes.
+
+    Every shape in a ShapeArray is of the same class, either Rectangle or
+    Square, which decides the dictionary format used by to_dictionaries
+    and the class built by to_shapes. Columns are ``array('q')`` objects,
+    so they can be shared with NumPy without copying.
+
+    Attributes:
+        shape_cls (type): Rectangle or Square.
+        id (array): The id column.
+        width (array): The width column.
+        height (array): The height column.
+        x (array): The horizontal offset column.
+        y (array): The vertical offset column.
+    """
+
+    COLUMNS = ("id", "width", "height", "x", "y")
+
+    def __init__(self, shape_cls=Rectangle):
+        """
+        Initialize an empty ShapeArray.
+
+        Args:
+            shape_cls (type, optional): Rectangle or Square. Defaults to
+                Rectangle.
+
+        Raises:
+            TypeError: If shape_cls is not Rectangle or a subclass of it.
+        """
+        if not (isinstance(shape_cls, type) and
+                issubclass(shape_cls, Rectangle)):
+            raise TypeError("shape_cls must be Rectangle or a subclass")
+        self.shape_cls = shape_cls
+        for name in self.COLUMNS:
+            setattr(self, name, array("q"))
+
+    @classmethod
+    def from_shapes(cls, shapes, shape_cls=None):
+        """
+        Build a ShapeArray from Rectangle or Square instances.
+
+        Args:
+            shapes (iterable): The shapes to copy into columns.
+            shape_cls (type, optional): Class of the collection. Defaults
+                to the class of the first shape, or Rectangle if empty.
+
+        Returns:
+            ShapeArray: A new collection holding one row per shape.
+        """
+        shapes = list(shapes)
+        if shape_cls is None:
+            shape_cls = shapes[0].__class__ if shapes else Rectangle
+        res = cls(shape_cls)
+        for shape in shapes:
+            res.append(shape)
+        return res
+
+    @classmethod
+    def from_dictionaries(cls, dictionaries, shape_cls=Rectangle):
+        """
+        Build a ShapeArray from dictionaries in the to_dictionary format.
+
+        Values go through the same validation as the shape's setters, and
+        Square dictionaries may use ``size`` in place of width and height.
+
+        Args:
+            dictionaries (iterable): Dictionaries as returned by
+                to_dictionary or loaded from a saved JSON file.
+            shape_cls (type, optional): Rectangle or Square. Defaults to
+                Rectangle.
+
+        Returns:
+            ShapeArray: A new collection holding one row per dictionary.
+        """
+        res = cls(shape_cls)
+        for dic in dictionaries:
+            res.append(shape_cls.create(**dic))
+        return res
+
+    def append(self, shape):
+        """
+        Append one shape's values as a new row.
+
+        Args:
+            shape (Rectangle): The shape to copy.
+
+        Raises:
+            TypeError: If shape is not an instance of the collection class.
+        """
+        if not isinstance(shape, self.shape_cls):
+            raise TypeError("shape must be a {}".format(
+                self.shape_cls.__name__))
+        self.id.append(shape.id)
+        self.width.append(shape.width)
+        self.height.append(shape.height)
+        self.x.append(shape.x)
+        self.y.append(shape.y)
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self.id)
+
+    def __getitem__(self, index):
+        """
+        Return the shape stored at index, built as a new instance.
+
+        Args:
+            index (int): Row position, negative values count from the end.
+
+        Returns:
+            Rectangle: A new instance of the collection class.
+        """
+        return self._build(self.id[index], self.width[index],
+                           self.height[index], self.x[index], self.y[index])
+
+    def _build(self, id, width, height, x, y):
+        """Create one instance of the collection class from row values."""
+        if issubclass(self.shape_cls, Square):
+            return self.shape_cls(width, x, y, id)
+        return self.shape_cls(width, height, x, y, id)
+
+    def to_shapes(self):
+        """
+        Materialize every row as a Rectangle or Square.
+
+        Returns:
+            list: One new instance per row, in row order.
+        """
+        return [self._build(*row) for row in zip(
+            self.id, self.width, self.height, self.x, self.y)]
+
+    def to_dictionaries(self):
+        """
+        Return the rows in the same format as the shapes' to_dictionary.
+
+        Returns:
+            list: One dictionary per row, ready for Base.to_json_string.
+        """
+        if issubclass(self.shape_cls, Square):
+            return [{'id': i, 'x': x, 'size': w, 'y': y}
+                    for i, w, x, y in zip(self.id, self.width,
+                                          self.x, self.y)]
+        return [{'x': x, 'y': y, 'id': i, 'height': h, 'width': w}
+                for i, w, h, x, y in zip(self.id, self.width, self.height,
+                                         self.x, self.y)]
+
+    def _column(self, name):
+        """Return a column as a NumPy view when available, else the array."""
+        col = getattr(self, name)
+        if numpy is not None:
+            return numpy.frombuffer(col, dtype=numpy.int64) if col else \
+                numpy.zeros(0, dtype=numpy.int64)
+        return col
+
+    def area(self):
+        """
+        Compute the area of every row at once.
+
+        Returns:
+            array: ``array('q')`` of width * height, one value per row.
+        """
+        if numpy is not None:
+            return array("q", (self._column("width") *
+                               self._column("height")).tobytes())
+        return array("q", map(mul, self.width, self.height))
+
+    def total_area(self):
+        """
+        Return the sum of the areas of all rows.
+
+        Returns:
+            int: The total area, 0 for an empty collection.
+        """
+        if numpy is not None:
+            return int(numpy.dot(self._column("width"),
+                                 self._column("height")))
+        return sum(map(mul, self.width, self.height))
+
+    def take(self, indices):
+        """
+        Return a new ShapeArray with the rows at the given positions.
+
+        Args:
+            indices (iterable): Row positions, in the order wanted. With
+                NumPy, an integer or boolean ndarray selects the rows
+                without any per-row Python code.
+
+        Returns:
+            ShapeArray: A new collection of the same class.
+        """
+        res = type(self)(self.shape_cls)
+        if numpy is not None:
+            if not isinstance(indices, numpy.ndarray):
+                indices = numpy.fromiter(indices, dtype=numpy.intp)
+            for name in self.COLUMNS:
+                setattr(res, name, array(
+                    "q", self._column(name)[indices].tobytes()))
+            return res
+        indices = list(indices)
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            setattr(res, name, array("q", [col[i] for i in indices]))
+        return res
+
+    def filter(self, mask):
+        """
+        Return the rows selected by a mask or predicate.
+
+        Args:
+            mask: Either an iterable of booleans with one entry per row,
+                or a callable taking the area column and returning such
+                an iterable, e.g. ``lambda areas: [a > 10 for a in areas]``
+                or, with NumPy, ``lambda areas: areas > 10``.
+
+        Returns:
+            ShapeArray: A new collection with the selected rows.
+
+        Raises:
+            ValueError: If the mask length differs from the row count.
+        """
+        if callable(mask):
+            areas = self.area()
+            if numpy is not None:
+                areas = numpy.frombuffer(areas, dtype=numpy.int64) \
+                    if areas else numpy.zeros(0, dtype=numpy.int64)
+            mask = mask(areas)
+        if numpy is not None:
+            if not isinstance(mask, numpy.ndarray):
+                mask = numpy.fromiter(mask, dtype=bool)
+            if mask.shape != (len(self),):
+                raise ValueError("mask must have one entry per row")
+            return self.take(mask.astype(bool, copy=False))
+        mask = list(mask)
+        if len(mask) != len(self):
+            raise ValueError("mask must have one entry per row")
+        return self.take(i for i, keep in enumerate(mask) if keep)
+
+    def sort(self, key="area", reverse=False):
+        """
+        Return the rows sorted by a column or by area.
+
+        Args:
+            key (str, optional): "area" or one of the column names.
+                Defaults to "area".
+            reverse (bool, optional): Sort in descending order.
+                Defaults to False.
+
+        Returns:
+            ShapeArray: A new collection with the rows reordered.
+
+        Raises:
+            ValueError: If key is not "area" or a column name.
+        """
+        if key == "area":
+            values = self.area()
+        elif key in self.COLUMNS:
+            values = getattr(self, key)
+        else:
+            raise ValueError("key must be 'area' or one of {}".format(
+                ", ".join(self.COLUMNS)))
+        if numpy is not None and len(values):
+            values = numpy.frombuffer(values, dtype=numpy.int64)
+            order = numpy.argsort(-values if reverse else values,
+                                  kind="stable")
+        else:
+            order = sorted(range(len(values)), key=values.__getitem__,
+                           reverse=reverse)
+        return self.take(order)
+
+    def bounding_box(self):
+        """
+        Return the smallest box that contains every row.
+
+        A shape covers x to x + width horizontally and y to y + height
+        vertically, matching the output of Rectangle.display.
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y), or None if empty.
+        """
+        if not len(self):
+            return None
+        if numpy is not None:
+            x = self._column("x")
+            y = self._column("y")
+            return (int(x.min()), int(y.min()),
+                    int((x + self._column("width")).max()),
+                    int((y + self._column("height")).max()))
+        return (min(self.x), min(self.y),
+                max(map(sum, zip(self.x, self.width))),
+                max(map(sum, zip(self.y, self.height))))
@@ -0,0 +1,296 @@
+#!/usr/bin/python3
+"""Module for spatial queries over rectangles and squares.
+
+This module provides the GridIndex class, a uniform grid over the plane
+in which every shape is registered in each cell its area touches. Range,
+point and nearest-neighbour queries then only look at the shapes of the
+few cells around the query instead of scanning every shape.
+
+A shape covers the half-open box [x, x + width) x [y, y + height), the
+same cells Rectangle.display fills with '#'.
+
+Classes:
+    GridIndex: Uniform grid index of Rectangle and Square instances.
+"""
+
+import heapq
+import math
+
+
+def _box(shape):
+    """Return the (x0, y0, x1, y1) box covered by shape."""
+    return (shape.x, shape.y, shape.x + shape.width, shape.y + shape.height)
+
+
+def _distance(box, px, py):
+    """Return the Euclidean distance from (px, py) to box, 0 if inside."""
+    x0, y0, x1, y1 = box
+    dx = x0 - px if px < x0 else (px - x1 + 1 if px >= x1 else 0)
+    dy = y0 - py if py < y0 else (py - y1 + 1 if py >= y1 else 0)
+    return math.hypot(dx, dy)
+
+
+class GridIndex:
+    """
+    Uniform grid index of shapes for overlap, point and nearest queries.
+
+    The index remembers the box under which each shape was inserted, so
+    after changing a shape's position or size (e.g. with update()) call
+    update(shape) to move it to its new cells.
+
+    Attributes:
+        cell_size (int): Width and height of one grid cell. Queries are
+            fastest when it is close to the typical shape size.
+    """
+
+    def __init__(self, cell_size=64, shapes=()):
+        """
+        Initialize an index, optionally filled with shapes.
+
+        Args:
+            cell_size (int, optional): Side of a grid cell (must be > 0).
+                Defaults to 64.
+            shapes (iterable, optional): Shapes to insert. Defaults to none.
+
+        Raises:
+            TypeError: If cell_size is not an integer.
+            ValueError: If cell_size <= 0.
+        """
+        if not isinstance(cell_size, int):
+            raise TypeError("cell_size must be an integer")
+        if cell_size <= 0:
+            raise ValueError("cell_size must be > 0")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._boxes = {}
+        self._extent = None
+        self._extent_stale = False
+        for shape in shapes:
+            self.insert(shape)
+
+    def _cell_range(self, x0, y0, x1, y1):
+        """Yield the keys of the cells touched by the box [x0, x1) x [y0, y1).
+        """
+        size = self.cell_size
+        rows = range(y0 // size, (max(y1, y0 + 1) - 1) // size + 1)
+        for cx in range(x0 // size, (max(x1, x0 + 1) - 1) // size + 1):
+            for cy in rows:
+                yield cx, cy
+
+    def __len__(self):
+        """Return the number of indexed shapes."""
+        return len(self._boxes)
+
+    def __contains__(self, shape):
+        """Return True if shape is in the index."""
+        return shape in self._boxes
+
+    def insert(self, shape):
+        """
+        Add a shape to the index.
+
+        Args:
+            shape (Rectangle): The shape to add. Inserting a shape that is
+                already indexed moves it to its current box.
+        """
+        if shape in self._boxes:
+            self.remove(shape)
+        box = _box(shape)
+        self._boxes[shape] = box
+        self._grow_extent(box)
+        cells = self._cells
+        for key in self._cell_range(*box):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = bucket = set()
+            bucket.add(shape)
+
+    def _cell_box(self, box):
+        """Return the (x0, y0, x1, y1) keys of the corner cells of box."""
+        size = self.cell_size
+        return (box[0] // size, box[1] // size,
+                (max(box[2], box[0] + 1) - 1) // size,
+                (max(box[3], box[1] + 1) - 1) // size)
+
+    def _grow_extent(self, box):
+        """Widen the range of used cell keys to include box."""
+        if self._extent_stale:
+            return
+        x0, y0, x1, y1 = self._cell_box(box)
+        if self._extent is None:
+            self._extent = (x0, y0, x1, y1)
+        else:
+            ex0, ey0, ex1, ey1 = self._extent
+            self._extent = (min(x0, ex0), min(y0, ey0),
+                            max(x1, ex1), max(y1, ey1))
+
+    def remove(self, shape):
+        """
+        Remove a shape from the index.
+
+        Args:
+            shape (Rectangle): A shape previously inserted.
+
+        Raises:
+            KeyError: If shape is not in the index.
+        """
+        box = self._boxes.pop(shape)
+        cells = self._cells
+        for key in self._cell_range(*box):
+            bucket = cells[key]
+            bucket.discard(shape)
+            if not bucket:
+                del cells[key]
+        if not cells:
+            self._extent = None
+            self._extent_stale = False
+        elif not self._extent_stale:
+            x0, y0, x1, y1 = self._cell_box(box)
+            ex0, ey0, ex1, ey1 = self._extent
+            if x0 == ex0 or y0 == ey0 or x1 == ex1 or y1 == ey1:
+                self._extent_stale = True
+
+    def _current_extent(self):
+        """Return the (x0, y0, x1, y1) range of the non-empty cell keys.
+
+        After a removal at the edge of the range it is recomputed from the
+        cells, once, on the next call.
+        """
+        if self._extent_stale:
+            xs = [key[0] for key in self._cells]
+            ys = [key[1] for key in self._cells]
+            self._extent = (min(xs), min(ys), max(xs), max(ys))
+            self._extent_stale = False
+        return self._extent
+
+    def update(self, shape):
+        """
+        Move a shape to the cells of its current position and size.
+
+        Args:
+            shape (Rectangle): A shape previously inserted.
+
+        Raises:
+            KeyError: If shape is not in the index.
+        """
+        if self._boxes[shape] != _box(shape):
+            self.remove(shape)
+            self.insert(shape)
+
+    def query_range(self, x0, y0, x1, y1):
+        """
+        Return the shapes overlapping the region [x0, x1) x [y0, y1).
+
+        Args:
+            x0 (int): Left edge of the region.
+            y0 (int): Top edge of the region.
+            x1 (int): Right edge of the region, excluded.
+            y1 (int): Bottom edge of the region, excluded.
+
+        Returns:
+            list: The overlapping shapes, in no particular order.
+        """
+        if x1 <= x0 or y1 <= y0:
+            return []
+        cells = self._cells
+        boxes = self._boxes
+        found = set()
+        for key in self._cell_range(x0, y0, x1, y1):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return [shape for shape in found
+                if boxes[shape][0] < x1 and x0 < boxes[shape][2] and
+                boxes[shape][1] < y1 and y0 < boxes[shape][3]]
+
+    def query_point(self, px, py):
+        """
+        Return the shapes containing the point (px, py).
+
+        Args:
+            px (int): Horizontal coordinate.
+            py (int): Vertical coordinate.
+
+        Returns:
+            list: The shapes whose box contains the point.
+        """
+        bucket = self._cells.get((px // self.cell_size, py // self.cell_size))
+        if not bucket:
+            return []
+        boxes = self._boxes
+        return [shape for shape in bucket
+                if boxes[shape][0] <= px < boxes[shape][2] and
+                boxes[shape][1] <= py < boxes[shape][3]]
+
+    def nearest(self, px, py, k=1):
+        """
+        Return the k shapes closest to the point (px, py).
+
+        The distance is measured from the point to the nearest cell of a
+        shape's box, so shapes containing the point are at distance 0.
+        Cells are searched in growing square rings around the point,
+        starting at the first ring that reaches the used cells and clipped
+        to them, so the cost does not depend on how far the point is from
+        the shapes. The search stops as soon as no unvisited cell can hold
+        a closer shape.
+
+        Args:
+            px (int): Horizontal coordinate.
+            py (int): Vertical coordinate.
+            k (int, optional): Number of shapes wanted. Defaults to 1.
+
+        Returns:
+            list: Up to k (distance, shape) pairs, closest first.
+        """
+        if k <= 0 or not self._cells:
+            return []
+        size = self.cell_size
+        cx, cy = px // size, py // size
+        extent = self._current_extent()
+        ex0, ey0, ex1, ey1 = extent
+        max_ring = max(cx - ex0, ex1 - cx, cy - ey0, ey1 - cy)
+        min_ring = max(ex0 - cx, cx - ex1, ey0 - cy, cy - ey1, 0)
+
+        boxes = self._boxes
+        seen = set()
+        best = []
+        tie = 0
+        for ring in range(min_ring, max_ring + 1):
+            for key in self._ring(cx, cy, ring, extent):
+                for shape in self._cells.get(key, ()):
+                    if shape in seen:
+                        continue
+                    seen.add(shape)
+                    tie += 1
+                    item = (-_distance(boxes[shape], px, py), tie, shape)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+            if len(best) == k and -best[0][0] <= ring * size:
+                break
+        best.sort(reverse=True)
+        return [(-dist, shape) for dist, _, shape in best]
+
+    @staticmethod
+    def _ring(cx, cy, ring, extent):
+        """Yield the cell keys at Chebyshev distance ring from (cx, cy).
+
+        Only the keys inside extent, the (x0, y0, x1, y1) range of used
+        cells, are yielded.
+        """
+        ex0, ey0, ex1, ey1 = extent
+        if ring == 0:
+            if ex0 <= cx <= ex1 and ey0 <= cy <= ey1:
+                yield cx, cy
+            return
+        xs = range(max(cx - ring, ex0), min(cx + ring, ex1) + 1)
+        for y in (cy - ring, cy + ring):
+            if ey0 <= y <= ey1:
+                for x in xs:
+                    yield x, y
+        ys = range(max(cy - ring + 1, ey0), min(cy + ring - 1, ey1) + 1)
+        for x in (cx - ring, cx + ring):
+            if ex0 <= x <= ex1:
+                for y in ys:
+                    yield x, y
@@ -9,6 +9,7 @@ size property getters/setters, updating attributes dynamically, and provides
 a formatted string representation.
 """
 
+from . import fields
 from .rectangle import Rectangle
 
 
@@ -24,8 +25,22 @@ class Square(Rectangle):
         x (int): Horizontal offset from the origin (must be >= 0).
         y (int): Vertical offset from the origin (must be >= 0).
         id (int): Unique identifier for the instance, handled by Base.
+
+    Square adds no storage of its own, so it declares empty ``__slots__``.
     """
 
+    __slots__ = ()
+    _spec = (
+        fields.Field("size", fields.DIMENSION, 1, required=True,
+                     stores=("width", "height")),
+        fields.Field("x", fields.OFFSET, 0),
+        fields.Field("y", fields.OFFSET, 0),
+    )
+    _fields = ("id", "size", "x", "y")
+    _field_bits = {"id": 1, "size": 6, "x": 8, "y": 16}
+    _field_checks = fields.field_checks(_spec)
+
+    @fields.compiled(_spec, "Rectangle")
     def __init__(self, size, x=0, y=0, id=None):
         """
         Initialize a Square instance with a given size and position.
@@ -40,7 +55,38 @@ class Square(Rectangle):
             TypeError: If size, x, or y is not an integer.
             ValueError: If size <= 0, or if x or y < 0.
         """
-        super().__init__(size, size, x, y, id)
+
+    @fields.compiled(_spec, "Rectangle")
+    def _init_from_dict(self, dictionary):
+        """
+        Initialize a bare instance from a to_dictionary style mapping.
+
+        Used by Base.create and Base.from_dicts. The side length is taken
+        from "size", defaulting to 1, unless "width" or "height" are given
+        explicitly.
+
+        Args:
+            dictionary (dict): Attribute names and values.
+
+        Raises:
+            TypeError: If any provided value is not an integer.
+            ValueError: If size <= 0, or if x or y < 0.
+        """
+
+    @fields.compiled(_spec, "Rectangle")
+    def _init_trusted(self, dictionary):
+        """
+        Initialize a bare instance from a complete, already valid mapping.
+
+        Used by Base.from_dicts with trusted=True: the "id", "size", "x"
+        and "y" values are stored without any check.
+
+        Args:
+            dictionary (dict): Attribute names and values.
+
+        Raises:
+            KeyError: If a value is missing.
+        """
 
     def __str__(self):
         """
@@ -96,6 +142,8 @@ class Square(Rectangle):
             4. y (int)
 
         Or by using keyword arguments (**kwargs) with matching attribute names.
+        As for Rectangle, unchanged values are skipped and changed fields
+        are recorded as dirty.
 
         Args:
             *args: Variable-length positional arguments in the order above.
@@ -105,21 +153,7 @@ class Square(Rectangle):
             square.update(10, 5, 2, 3)
             square.update(id=10, size=5, x=2, y=3)
         """
-        if args:
-            for i in range(len(args)):
-                if i == 0:
-                    self.id = args[0]
-                if i == 1:
-                    self.width = args[1]
-                    self.height = args[1]
-                if i == 2:
-                    self.x = args[2]
-                if i == 3:
-                    self.y = args[3]
-        elif kwargs:
-            for key, value in kwargs.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+        super().update(*args, **kwargs)
           
     def to_dictionary(self):
         """Convert the square to a dictionary representation.
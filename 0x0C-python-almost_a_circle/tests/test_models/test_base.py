@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+"""Unittest for models.base.Base.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from models.base import Base
+from models.id_allocator import IdAllocator
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestIdReset(unittest.TestCase):
+    """Automatic ids restart when the counter or allocator is reset."""
+
+    def test_reset_counter(self):
+        """Resetting __nb_objects makes the next automatic id 1."""
+        saved = Base._Base__nb_objects
+        try:
+            Base(None)
+            Base._Base__nb_objects = 0
+            self.assertEqual(Rectangle(1, 1).id, 1)
+            self.assertEqual(Base().id, 2)
+            self.assertEqual(Base._Base__nb_objects, 2)
+        finally:
+            Base._Base__nb_objects = max(saved, Base._Base__nb_objects)
+
+    def test_reset_allocator(self):
+        """Installing a fresh allocator makes the next automatic id 1."""
+        previous = Base.get_id_allocator()
+        try:
+            Base(None)
+            Base.set_id_allocator(IdAllocator())
+            self.assertEqual(Base().id, 1)
+            self.assertEqual(Rectangle(1, 1).id, 2)
+        finally:
+            Base.set_id_allocator(previous)
+
+
+class TestSavePaths(unittest.TestCase):
+    """Every save path writes a mixed list like save_to_file does."""
+
+    def setUp(self):
+        """Work in a fresh temporary directory."""
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def shapes(self):
+        """Return a Rectangle and a Square, as saved by Rectangle."""
+        return [Rectangle(2, 3, 1, 1, 9), Square(5, 1, 1, 10)]
+
+    def expected(self):
+        """Return the dictionaries Rectangle.load_from_file should give."""
+        return [Rectangle.to_dictionary(obj) for obj in self.shapes()]
+
+    def loaded(self, **kwargs):
+        """Load the Rectangle file as dictionaries."""
+        return [obj.to_dictionary()
+                for obj in Rectangle.load_from_file(**kwargs)]
+
+    def test_save_to_file(self):
+        """The reference path writes width and height for a Square."""
+        Rectangle.save_to_file(self.shapes())
+        self.assertEqual(self.loaded(), self.expected())
+
+    def test_save_to_file_stream(self):
+        """save_to_file_stream writes the same file as save_to_file."""
+        Rectangle.save_to_file(self.shapes())
+        with open("Rectangle.json") as f:
+            reference = f.read()
+        Rectangle.save_to_file_stream(self.shapes())
+        with open("Rectangle.json") as f:
+            self.assertEqual(f.read(), reference)
+
+    def test_binary(self):
+        """The binary format accepts a mixed list."""
+        Rectangle.save_to_file(self.shapes(), fmt="binary")
+        self.assertEqual(self.loaded(fmt="binary"), self.expected())
+
+    def test_index(self):
+        """index=True writes the same records, in both formats."""
+        for fmt in ("json", "binary"):
+            Rectangle.save_to_file(self.shapes(), fmt=fmt, index=True)
+            self.assertEqual(self.loaded(fmt=fmt), self.expected())
+            self.assertEqual(Rectangle.load_by_id(10, fmt=fmt).to_dictionary(),
+                             self.expected()[1])
+
+    def test_save_changes(self):
+        """save_changes logs a Square as a Rectangle record."""
+        Rectangle.save_to_file([])
+        Rectangle.save_changes(self.shapes(), compact_ratio=None)
+        self.assertEqual(self.loaded(), self.expected())
+        Rectangle.compact()
+        self.assertEqual(self.loaded(), self.expected())
+
+    def test_save_all(self):
+        """save_all writes the same file with and without processes."""
+        Rectangle.save_to_file(self.shapes())
+        with open("Rectangle.json") as f:
+            reference = f.read()
+        for threshold in (1, 100):
+            Base.save_all({"Rectangle": self.shapes()},
+                          process_threshold=threshold)
+            with open("Rectangle.json") as f:
+                self.assertEqual(f.read(), reference)
+
+
+class TestUpdateMany(unittest.TestCase):
+    """update_many validates every object against its own class."""
+
+    def test_square_rejects_width(self):
+        """A Square in a Rectangle batch refuses width; nothing changes."""
+        rect = Rectangle(2, 3, 0, 0, 1)
+        square = Square(5, 0, 0, 2)
+        rect.mark_clean()
+        square.mark_clean()
+        with self.assertRaises(AttributeError):
+            Rectangle.update_many([rect, square], {"width": 4})
+        self.assertEqual(rect.width, 2)
+        self.assertEqual(square.size, 5)
+        self.assertFalse(rect.is_dirty() or square.is_dirty())
+
+    def test_shared_field(self):
+        """A field of both classes is set and marked dirty on both."""
+        rect = Rectangle(2, 3, 0, 0, 1)
+        square = Square(5, 0, 0, 2)
+        rect.mark_clean()
+        square.mark_clean()
+        self.assertEqual(Rectangle.update_many([rect, square], {"x": 4}), 2)
+        self.assertEqual((rect.x, square.x), (4, 4))
+        self.assertEqual(square.dirty_fields(), {"x"})
+
+    def test_per_object_changes(self):
+        """One dictionary per object uses each object's own fields."""
+        rect = Rectangle(2, 3, 0, 0, 1)
+        square = Square(5, 0, 0, 2)
+        Rectangle.update_many([rect, square], [{"width": 7}, {"size": 3}])
+        self.assertEqual((rect.width, square.size), (7, 3))
+        with self.assertRaises(ValueError):
+            Rectangle.update_many([rect, square], [{"width": -1},
+                                                   {"size": 3}])
+        self.assertEqual(rect.width, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""Unittest for models.binary_format and the binary save/load paths.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import io
+import os
+import tempfile
+import unittest
+
+from models import binary_format
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Binary files round-trip and reject foreign or broken files."""
+
+    def setUp(self):
+        """Work in a fresh temporary directory."""
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_rectangle_round_trip(self):
+        """Rectangles come back with the same dictionaries."""
+        rects = [Rectangle(2, 3, 1, 4, 7), Rectangle(10, 1, 0, 0, 8)]
+        Rectangle.save_to_file(rects, fmt="binary")
+        self.assertTrue(os.path.exists("Rectangle.bin"))
+        self.assertEqual([r.to_dictionary()
+                          for r in Rectangle.load_from_file(fmt="binary")],
+                         [r.to_dictionary() for r in rects])
+
+    def test_square_round_trip(self):
+        """Squares keep their size field and their class."""
+        squares = [Square(5, 1, 2, 3), Square(1, 0, 0, 4)]
+        Square.save_to_file(squares, "shapes.bin")
+        loaded = Square.load_from_file(filename="shapes.bin")
+        self.assertTrue(all(type(s) is Square for s in loaded))
+        self.assertEqual([s.to_dictionary() for s in loaded],
+                         [s.to_dictionary() for s in squares])
+
+    def test_empty(self):
+        """An empty list and a missing file both load as []."""
+        self.assertEqual(Square.load_from_file(fmt="binary"), [])
+        Square.save_to_file([], fmt="binary")
+        self.assertEqual(Square.load_from_file(fmt="binary"), [])
+
+    def test_wrong_class(self):
+        """A Square file is not read as Rectangles."""
+        Square.save_to_file([Square(2)], "shapes.bin")
+        with self.assertRaises(ValueError):
+            Rectangle.load_from_file(filename="shapes.bin")
+
+    def test_truncated(self):
+        """A file cut inside its records is an error."""
+        Rectangle.save_to_file([Rectangle(1, 1), Rectangle(2, 2)],
+                               fmt="binary")
+        with open("Rectangle.bin", "r+b") as f:
+            f.truncate(os.path.getsize("Rectangle.bin") - 8)
+        with self.assertRaises(ValueError):
+            Rectangle.load_from_file(fmt="binary")
+
+    def test_not_binary(self):
+        """A JSON file is not mistaken for a binary one."""
+        with open("Rectangle.bin", "w") as f:
+            f.write("[]")
+        with self.assertRaises(ValueError):
+            Rectangle.load_from_file(fmt="binary")
+
+    def test_non_integer_value(self):
+        """Values that are not 64-bit integers are refused."""
+        with self.assertRaises(ValueError):
+            binary_format.dump_iter("Rectangle", [{"id": "a", "x": 1}],
+                                    io.BytesIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""Unittest for models.change_log and Base.save_changes / compact.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from models import change_log
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestChangeLog(unittest.TestCase):
+    """Puts and deletes are replayed on load and folded by compact."""
+
+    def setUp(self):
+        """Work in a fresh temporary directory with a saved snapshot."""
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        Rectangle.save_to_file([Rectangle(1, 1, 0, 0, 1),
+                                Rectangle(2, 2, 0, 0, 2),
+                                Rectangle(3, 3, 0, 0, 3)])
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def loaded(self, **kwargs):
+        """Return (id, width) of every loaded Rectangle."""
+        return [(r.id, r.width) for r in Rectangle.load_from_file(**kwargs)]
+
+    def test_put_and_delete_replay(self):
+        """A put replaces in place or appends; a delete removes."""
+        Rectangle.save_changes([Rectangle(9, 9, 0, 0, 2),
+                                Rectangle(4, 4, 0, 0, 4)], [1],
+                               compact_ratio=None)
+        self.assertTrue(os.path.exists("Rectangle.json.log"))
+        self.assertEqual(self.loaded(), [(2, 9), (3, 3), (4, 4)])
+
+    def test_last_change_wins(self):
+        """Later lines of the log override earlier ones for an id."""
+        Rectangle.save_changes([Rectangle(5, 5, 0, 0, 3)], compact_ratio=None)
+        Rectangle.save_changes((), [3], compact_ratio=None)
+        Rectangle.save_changes([Rectangle(6, 6, 0, 0, 3)], compact_ratio=None)
+        self.assertEqual(self.loaded(), [(1, 1), (2, 2), (3, 6)])
+
+    def test_torn_last_line_ignored(self):
+        """A last line without its newline is an interrupted append."""
+        Rectangle.save_changes([Rectangle(7, 7, 0, 0, 1)], compact_ratio=None)
+        with open("Rectangle.json.log", "a") as f:
+            f.write('{"delete": 2')
+        self.assertEqual(self.loaded(), [(1, 7), (2, 2), (3, 3)])
+
+    def test_append_after_torn_line(self):
+        """An append after an interrupted one cuts the torn line off."""
+        Rectangle.save_changes([Rectangle(7, 7, 0, 0, 1)], compact_ratio=None)
+        with open("Rectangle.json.log", "a") as f:
+            f.write('{"put": {"x": 0')
+        Rectangle.save_changes([Rectangle(5, 5, 0, 0, 2)], compact_ratio=None)
+        self.assertEqual(self.loaded(), [(1, 7), (2, 5), (3, 3)])
+        with open("Rectangle.json.log") as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertEqual(Rectangle.compact(), 3)
+        self.assertEqual(self.loaded(), [(1, 7), (2, 5), (3, 3)])
+
+    def test_append_after_torn_only_line(self):
+        """A torn line with no newline before it is cut off entirely."""
+        with open("Rectangle.json.log", "w") as f:
+            f.write('{"delete": 1')
+        Rectangle.save_changes((), [3], compact_ratio=None)
+        self.assertEqual(self.loaded(), [(1, 1), (2, 2)])
+
+    def test_invalid_complete_line(self):
+        """A complete line that is not a change is an error."""
+        with open("Rectangle.json.log", "w") as f:
+            f.write('{"move": 2}\n')
+        with self.assertRaises(ValueError):
+            self.loaded()
+
+    def test_compact(self):
+        """compact folds the log into the file and deletes the log."""
+        Rectangle.save_changes([Rectangle(8, 8, 0, 0, 4)], [2],
+                               compact_ratio=None)
+        expected = self.loaded()
+        self.assertEqual(Rectangle.compact(), 3)
+        self.assertFalse(os.path.exists("Rectangle.json.log"))
+        self.assertEqual(self.loaded(), expected)
+        self.assertEqual(change_log.read_changes("Rectangle.json"), {})
+
+    def test_compact_binary(self):
+        """compact works the same on a binary snapshot."""
+        Rectangle.save_to_file([Rectangle(1, 1, 0, 0, 1)], fmt="binary")
+        Rectangle.save_changes([Rectangle(2, 2, 0, 0, 2)], fmt="binary",
+                               compact_ratio=None)
+        self.assertEqual(Rectangle.compact(fmt="binary"), 2)
+        self.assertEqual(self.loaded(fmt="binary"), [(1, 1), (2, 2)])
+
+    def test_automatic_compaction(self):
+        """The log is compacted once it outgrows the file."""
+        Rectangle.save_changes([Rectangle(2, 2, 0, 0, 5)], compact_ratio=0)
+        self.assertFalse(os.path.exists("Rectangle.json.log"))
+        self.assertEqual(self.loaded()[-1], (5, 2))
+
+    def test_save_dirty(self):
+        """Only objects with unsaved changes are logged."""
+        rects = Rectangle.load_from_file()
+        rects[0].update(width=10)
+        self.assertEqual(Rectangle.save_dirty(rects, compact_ratio=None), 1)
+        self.assertEqual(self.loaded(), [(1, 10), (2, 2), (3, 3)])
+
+    def test_full_save_drops_log(self):
+        """save_to_file writes a snapshot and removes the log."""
+        Rectangle.save_changes([Square(3, 0, 0, 1)], compact_ratio=None)
+        Rectangle.save_to_file(Rectangle.load_from_file())
+        self.assertFalse(os.path.exists("Rectangle.json.log"))
+        self.assertEqual(self.loaded(), [(1, 3), (2, 2), (3, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
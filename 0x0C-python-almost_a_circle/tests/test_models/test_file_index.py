@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""Unittest for models.file_index and the load_by_id paths.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestFileIndex(unittest.TestCase):
+    """Indexed files answer lookups by id and refuse stale indexes."""
+
+    def setUp(self):
+        """Work in a fresh temporary directory."""
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.squares = [Square(i, i, 0, 10 + i) for i in range(1, 6)]
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_lookups(self):
+        """load_by_id and load_many find records in both formats."""
+        for fmt in ("json", "binary"):
+            Square.save_to_file(self.squares, fmt=fmt, index=True)
+            square = Square.load_by_id(13, fmt=fmt)
+            self.assertIs(type(square), Square)
+            self.assertEqual(square.to_dictionary(),
+                             self.squares[2].to_dictionary())
+            found = Square.load_many([15, 11], fmt=fmt)
+            self.assertEqual([s.id for s in found], [15, 11])
+
+    def test_misses(self):
+        """Unknown ids give None, alone or among known ones."""
+        Square.save_to_file(self.squares, index=True)
+        self.assertIsNone(Square.load_by_id(99))
+        self.assertEqual([s and s.id for s in Square.load_many([99, 12])],
+                         [None, 12])
+        with Square.open_index() as idx:
+            self.assertEqual(len(idx), 5)
+            self.assertIn(11, idx)
+            self.assertNotIn(99, idx)
+
+    def test_empty(self):
+        """An empty indexed file has no records."""
+        Square.save_to_file([], index=True)
+        self.assertIsNone(Square.load_by_id(1))
+
+    def test_missing_index(self):
+        """A file saved without index=True cannot be opened by id."""
+        Square.save_to_file(self.squares)
+        with self.assertRaises(FileNotFoundError):
+            Square.load_by_id(11)
+
+    def test_stale_index(self):
+        """An index older than its file is refused."""
+        Square.save_to_file(self.squares, index=True)
+        with open("Square.json", "a") as f:
+            f.write(" ")
+        with self.assertRaises(ValueError):
+            Square.load_by_id(11)
+
+    def test_resave_drops_index(self):
+        """Saving again without index=True deletes the old index."""
+        Square.save_to_file(self.squares, index=True)
+        Square.save_to_file(self.squares[:2])
+        self.assertFalse(os.path.exists("Square.json.idx"))
+
+    def test_logged_file(self):
+        """A file with a change log must be compacted before lookups."""
+        Square.save_to_file(self.squares, index=True)
+        Square.save_changes([Square(9, 0, 0, 11)], compact_ratio=None)
+        with self.assertRaises(ValueError):
+            Square.load_by_id(11)
+        Square.compact()
+        Square.save_to_file(Square.load_from_file(), index=True)
+        self.assertEqual(Square.load_by_id(11).size, 9)
+
+    def test_wrong_class(self):
+        """A binary Square file is not read as Rectangles by id."""
+        Square.save_to_file(self.squares, "shapes.bin", index=True)
+        with self.assertRaises(ValueError):
+            Rectangle.load_by_id(11, "shapes.bin")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Unittest for models.json_stream.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import io
+import json
+import unittest
+
+from models.json_stream import dump_iter, load_iter
+
+
+def load(text, chunk_size):
+    """Return the elements load_iter reads from text."""
+    return list(load_iter(io.StringIO(text), chunk_size))
+
+
+class TestLoadIter(unittest.TestCase):
+    """load_iter reads any JSON array, whatever the chunk size."""
+
+    def test_values_across_chunks(self):
+        """Scalars and containers cut by chunk boundaries decode fully."""
+        text = ('[{"a": [1, 2.5e-3, -0.5], "b": "x]y"}, -12, 1E+9, '
+                'null, false, true, "q\\"", {}, 1.5e3]')
+        for chunk_size in range(1, 16):
+            self.assertEqual(load(text, chunk_size), json.loads(text))
+
+    def test_empty(self):
+        """An empty file and an empty array yield nothing."""
+        self.assertEqual(load("", 4), [])
+        self.assertEqual(load(" [ ] \n", 1), [])
+
+    def test_invalid(self):
+        """Malformed arrays and text after the array are rejected."""
+        for text in ("[1 2]", "[1,]", "[,1]", "[1", "x", "[tru]",
+                     "[1]x", "[1] ]"):
+            for chunk_size in (1, 3, 64):
+                with self.assertRaises(ValueError):
+                    load(text, chunk_size)
+
+    def test_round_trip(self):
+        """dump_iter writes what json.dumps writes, load_iter reads it."""
+        dictionaries = [{"id": i, "x": i * 2} for i in range(50)]
+        f = io.StringIO()
+        self.assertEqual(dump_iter(iter(dictionaries), f), 50)
+        self.assertEqual(f.getvalue(), json.dumps(dictionaries))
+        self.assertEqual(load(f.getvalue(), 7), dictionaries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+"""Unittest for models.lazy and the APIs that take its proxies.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from models.lazy import LazyShape
+from models.pool import ShapePool
+from models.rectangle import Rectangle
+from models.shape_array import ShapeArray
+from models.square import Square
+
+
+class TestLazyShape(unittest.TestCase):
+    """Lazy-loaded shapes work wherever loaded shapes do."""
+
+    def setUp(self):
+        """Work in a fresh temporary directory with saved shapes."""
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        Rectangle.save_to_file([Rectangle(1, 2, 0, 0, 1),
+                                Rectangle(3, 4, 1, 1, 2)])
+        Square.save_to_file([Square(5, 0, 0, 3)])
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_proxy_is_lazy(self):
+        """Reading id does not build the instance; other fields do."""
+        proxy = Rectangle.load_from_file(lazy=True)[1]
+        self.assertIs(type(proxy), LazyShape)
+        self.assertIsInstance(proxy, Rectangle)
+        self.assertEqual(proxy.id, 2)
+        self.assertFalse(proxy.is_materialized())
+        self.assertEqual(proxy.width, 3)
+        self.assertTrue(proxy.is_materialized())
+
+    def test_update_many(self):
+        """update_many updates and validates the shapes behind proxies."""
+        shapes = Rectangle.load_from_file(lazy=True)
+        self.assertEqual(Rectangle.update_many(shapes, {"width": 7}), 2)
+        self.assertEqual([r.width for r in shapes], [7, 7])
+        self.assertEqual(shapes[0].dirty_fields(), frozenset({"width"}))
+        with self.assertRaises(ValueError):
+            Rectangle.update_many(shapes, {"height": 0})
+        self.assertEqual([r.height for r in shapes], [2, 4])
+
+    def test_update_many_square_fields(self):
+        """A proxy is checked against the fields of its own class."""
+        squares = Square.load_from_file(lazy=True)
+        self.assertEqual(Square.update_many(squares, [{"size": 6}]), 1)
+        self.assertEqual(squares[0].size, 6)
+        with self.assertRaises(AttributeError):
+            Square.update_many(squares, {"width": 2})
+
+    def test_shape_array(self):
+        """ShapeArray.from_shapes takes its class from the proxies."""
+        squares = ShapeArray.from_shapes(Square.load_from_file(lazy=True))
+        self.assertIs(squares.shape_cls, Square)
+        self.assertEqual(squares.to_dictionaries(),
+                         [{"id": 3, "size": 5, "x": 0, "y": 0}])
+
+    def test_pool_release(self):
+        """A released proxy gives its instance back to the pool."""
+        pool = ShapePool(Rectangle)
+        shapes = Rectangle.load_from_file(lazy=True)
+        pool.release(shapes[0])
+        pool.release_many([shapes[1]])
+        self.assertEqual(len(pool), 2)
+        with self.assertRaises(ValueError):
+            pool.release(shapes[0])
+        with self.assertRaises(TypeError):
+            pool.release(Square.load_from_file(lazy=True)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
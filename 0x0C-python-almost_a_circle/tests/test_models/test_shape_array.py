@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""Unittest for models.shape_array.ShapeArray.
+
+The same tests run with NumPy, when it is installed, and with the
+standard array fallback.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import unittest
+from array import array
+from unittest import mock
+
+from models import shape_array
+from models.rectangle import Rectangle
+from models.shape_array import ShapeArray
+from models.square import Square
+
+
+class TestShapeArray(unittest.TestCase):
+    """Bulk queries give the same answers as the shapes themselves."""
+
+    def setUp(self):
+        """Build a collection of four rectangles."""
+        self.shapes = [Rectangle(2, 3, 1, 1, 1), Rectangle(1, 1, 0, 4, 2),
+                       Rectangle(5, 2, 3, 0, 3), Rectangle(3, 2, 0, 0, 4)]
+        self.array = ShapeArray.from_shapes(self.shapes)
+
+    def ids(self, shapes):
+        """Return the id column as a list."""
+        return list(shapes.id)
+
+    def test_area(self):
+        """area and total_area match the area of every shape."""
+        self.assertEqual(self.array.area(), array("q", [6, 1, 10, 6]))
+        self.assertEqual(self.array.total_area(), 23)
+        self.assertEqual(ShapeArray(Rectangle).total_area(), 0)
+
+    def test_filter(self):
+        """filter takes a mask or a predicate over the areas."""
+        self.assertEqual(self.ids(self.array.filter(
+            [True, False, True, False])), [1, 3])
+        self.assertEqual(self.ids(self.array.filter(
+            lambda areas: [a > 5 for a in areas])), [1, 3, 4])
+        self.assertEqual(len(self.array.filter([False] * 4)), 0)
+        with self.assertRaises(ValueError):
+            self.array.filter([True])
+
+    @unittest.skipIf(shape_array.numpy is None, "NumPy is not installed")
+    def test_filter_numpy_predicate(self):
+        """With NumPy, a predicate can return a boolean ndarray."""
+        if shape_array.numpy is None:
+            self.skipTest("NumPy is hidden")
+        self.assertEqual(self.ids(self.array.filter(
+            lambda areas: areas >= 6)), [1, 3, 4])
+
+    def test_sort(self):
+        """sort is stable, by area or by a column, in either order."""
+        self.assertEqual(self.ids(self.array.sort()), [2, 1, 4, 3])
+        self.assertEqual(self.ids(self.array.sort(reverse=True)),
+                         [3, 1, 4, 2])
+        self.assertEqual(self.ids(self.array.sort("y")), [3, 4, 1, 2])
+        self.assertEqual(len(ShapeArray(Rectangle).sort()), 0)
+        with self.assertRaises(ValueError):
+            self.array.sort("colour")
+
+    def test_take(self):
+        """take copies the rows at the given positions, in order."""
+        taken = self.array.take([3, 0, 3])
+        self.assertEqual(self.ids(taken), [4, 1, 4])
+        self.assertEqual(list(taken.width), [3, 2, 3])
+        self.assertIsInstance(taken.width, array)
+
+    def test_bounding_box(self):
+        """bounding_box covers x to x + width and y to y + height."""
+        self.assertEqual(self.array.bounding_box(), (0, 0, 8, 5))
+        self.assertIsNone(ShapeArray(Rectangle).bounding_box())
+
+    def test_round_trip(self):
+        """to_dictionaries and to_shapes give back the saved shapes."""
+        self.assertEqual(self.array.to_dictionaries(),
+                         [r.to_dictionary() for r in self.shapes])
+        self.assertEqual([str(r) for r in self.array.to_shapes()],
+                         [str(r) for r in self.shapes])
+
+    def test_square_round_trip(self):
+        """A Square collection keeps the Square dictionary format."""
+        squares = [Square(2, 1, 0, 5), Square(4, 0, 3, 6)]
+        columns = ShapeArray.from_shapes(squares)
+        self.assertIs(columns.shape_cls, Square)
+        dictionaries = columns.to_dictionaries()
+        self.assertEqual(dictionaries, [s.to_dictionary() for s in squares])
+        again = ShapeArray.from_dictionaries(dictionaries, Square)
+        self.assertEqual([str(s) for s in again.to_shapes()],
+                         [str(s) for s in squares])
+        self.assertEqual(self.ids(columns.sort(reverse=True)), [6, 5])
+
+
+class TestShapeArrayWithoutNumpy(TestShapeArray):
+    """The standard array fallback gives the same answers."""
+
+    def setUp(self):
+        """Hide NumPy from shape_array for the duration of each test."""
+        patcher = mock.patch.object(shape_array, "numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
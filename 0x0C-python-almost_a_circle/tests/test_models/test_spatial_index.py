@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""Unittest for models.spatial_index.GridIndex.
+
+Run from the project root with:
+    $ python3 -m unittest discover tests
+"""
+import random
+import unittest
+
+from models.rectangle import Rectangle
+from models.spatial_index import GridIndex, _box, _distance
+
+
+class TestNearest(unittest.TestCase):
+    """nearest agrees with a brute-force scan, near and far."""
+
+    def setUp(self):
+        """Index 300 random rectangles near the origin."""
+        rng = random.Random(1)
+        self.rng = rng
+        self.shapes = [Rectangle(rng.randint(1, 30), rng.randint(1, 30),
+                                 rng.randint(0, 300), rng.randint(0, 300),
+                                 i + 1) for i in range(300)]
+        self.index = GridIndex(32, self.shapes)
+
+    def check(self, px, py, k):
+        """Compare the distances returned by nearest with a full scan."""
+        expected = sorted(_distance(_box(shape), px, py)
+                          for shape in self.index._boxes)[:k]
+        found = [dist for dist, _ in self.index.nearest(px, py, k)]
+        self.assertEqual(found, expected)
+
+    def test_random_points(self):
+        """Points inside and around the data."""
+        for _ in range(200):
+            self.check(self.rng.randint(-500, 800),
+                       self.rng.randint(-500, 800), self.rng.randint(1, 4))
+
+    def test_far_point(self):
+        """A point far from the data is answered correctly."""
+        self.check(10 ** 6, -10 ** 6, 3)
+
+    def test_after_remove(self):
+        """The extent shrinks after removals and results stay exact."""
+        for shape in self.shapes[:250]:
+            self.index.remove(shape)
+        for _ in range(100):
+            self.check(self.rng.randint(-500, 800),
+                       self.rng.randint(-500, 800), self.rng.randint(1, 4))
+        for shape in self.shapes[250:]:
+            self.index.remove(shape)
+        self.assertEqual(self.index.nearest(0, 0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
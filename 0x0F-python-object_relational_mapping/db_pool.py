@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+"""Shared SQLAlchemy engines and sessions for the 0x0F queries.
+
+Every script of this project creates its own engine, runs one query and
+exits, so each run pays for a new connection. This module keeps one
+engine per database URL for the whole process instead. Each engine has
+a bounded connection pool and pings a connection before handing it out,
+so connections are reused across calls and stale ones are replaced
+transparently. The tables of model_state and model_city are created the
+first time an engine is made, as the scripts do on every run.
+
+Typical usage example:
+    from db_pool import mysql_url, session_scope
+    from model_state import State
+
+    url = mysql_url("root", "root", "hbtn_0e_6_usa")
+    with session_scope(url) as session:
+        print(session.query(State).count())
+
+Any SQLAlchemy URL works, e.g. "sqlite:///states.db" as a local stand-in
+for MySQL.
+"""
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from model_state import Base
+import model_city  # noqa: F401 (maps City, needed by State.cities)
+
+POOL_SIZE = 5
+MAX_OVERFLOW = 5
+POOL_TIMEOUT = 30
+POOL_RECYCLE = 3600
+
+_engines = {}
+_sessions = {}
+_lock = threading.Lock()
+
+
+def mysql_url(user, passwd, db, host="localhost", port=3306):
+    """Build the URL of a MySQL database, as the scripts connect to it.
+
+    The user name and password are escaped as needed, unlike the
+    formatted strings of the scripts.
+
+    Args:
+        user (str): MySQL user name.
+        passwd (str): MySQL password.
+        db (str): Database name.
+        host (str): Server host. Defaults to "localhost".
+        port (int): Server port. Defaults to 3306.
+
+    Returns:
+        URL: The mysql+mysqldb URL of the database.
+    """
+    return URL.create("mysql+mysqldb", username=user, password=passwd,
+                      host=host, port=port, database=db)
+
+
+def _pool_options(url):
+    """Return the create_engine pool options suited to a URL.
+
+    Args:
+        url (URL): The database URL.
+
+    Returns:
+        dict: Keyword arguments for create_engine.
+    """
+    options = {"pool_pre_ping": True}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # Every connection to an in-memory database is a new, empty
+            # database, so all sessions have to share a single one.
+            options["poolclass"] = StaticPool
+            return options
+    options.update(poolclass=QueuePool, pool_size=POOL_SIZE,
+                   max_overflow=MAX_OVERFLOW, pool_timeout=POOL_TIMEOUT,
+                   pool_recycle=POOL_RECYCLE)
+    return options
+
+
+def get_engine(url):
+    """Return the shared engine of a database, creating it on first use.
+
+    At most POOL_SIZE + MAX_OVERFLOW connections are open at once per
+    engine; a caller needing one more waits up to POOL_TIMEOUT seconds.
+    Connections are checked with a ping before use and recycled after
+    POOL_RECYCLE seconds, before the server times them out.
+
+    Args:
+        url (str or URL): SQLAlchemy database URL, e.g. from mysql_url.
+
+    Returns:
+        Engine: The engine, with the states and cities tables created.
+    """
+    url = make_url(url)
+    with _lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(url, **_pool_options(url))
+            Base.metadata.create_all(engine)
+            _engines[url] = engine
+            _sessions[url] = sessionmaker(bind=engine,
+                                          expire_on_commit=False)
+    return engine
+
+
+@contextmanager
+def session_scope(url):
+    """Provide a session on the shared engine of a database.
+
+    The session is committed when the with block ends normally, rolled
+    back if it raises, and closed in both cases, which returns its
+    connection to the pool. Objects loaded in the block keep their
+    loaded attributes after it ends.
+
+    Args:
+        url (str or URL): SQLAlchemy database URL, e.g. from mysql_url.
+
+    Yields:
+        Session: A new session bound to the shared engine.
+    """
+    url = make_url(url)
+    factory = _sessions.get(url)
+    if factory is None:
+        get_engine(url)
+        factory = _sessions[url]
+    session = factory()
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def dispose_engines():
+    """Close the pooled connections of every shared engine and forget them.
+
+    Call it before forking worker processes or at shutdown; the next
+    call to get_engine or session_scope opens fresh connections.
+    """
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _sessions.clear()
+    for engine in engines:
+        engine.dispose()
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+"""Importable versions of the queries of the 0x0F scripts.
+
+Each function runs the query of one or more scripts in a session of the
+shared, pooled engine of db_pool, and returns plain values instead of
+printing them, so a job runner can call them repeatedly without paying
+for a new connection each time:
+
+    0-select_states, 7-model_state_fetch_all   list_states
+    1-filter_states                            states_starting_with
+    2-my_filter_states, 3-my_safe_filter_...   states_named
+    4-cities_by_state, 14-model_city_fetch...  cities_by_state
+    5-filter_cities                            city_names_in_state
+    8-model_state_fetch_first                  first_state
+    9-model_state_filter_a                     states_containing
+    10-model_state_my_get                      find_state_id
+    11-model_state_insert                      add_state
+    12-model_state_update_id_2                 rename_state
+    13-model_state_delete_a                    delete_states_containing
+
+Every function takes the database URL first, as built by
+db_pool.mysql_url or any SQLAlchemy URL such as "sqlite:///states.db".
+States are returned as (id, name) tuples.
+"""
+from db_pool import session_scope
+from model_city import City
+from model_state import State
+
+
+def list_states(url):
+    """List all states, sorted by id.
+
+    Args:
+        url (str or URL): The database URL.
+
+    Returns:
+        list: (id, name) tuples.
+    """
+    with session_scope(url) as session:
+        return session.query(State.id, State.name).order_by(State.id).all()
+
+
+def states_starting_with(url, prefix="N"):
+    """List the states whose name starts with prefix, case-sensitively.
+
+    The scripts use MySQL's LIKE BINARY for case sensitivity; the
+    database filters with LIKE here and the result is checked again in
+    Python, which gives the same answer on any backend.
+
+    Args:
+        url (str or URL): The database URL.
+        prefix (str): The start of the names. Defaults to "N".
+
+    Returns:
+        list: (id, name) tuples, sorted by id.
+    """
+    with session_scope(url) as session:
+        rows = session.query(State.id, State.name).filter(
+            State.name.startswith(prefix, autoescape=True)).order_by(
+            State.id).all()
+    return [row for row in rows if row.name.startswith(prefix)]
+
+
+def states_named(url, name):
+    """List the states with exactly this name, case-sensitively.
+
+    The name is passed as a bound parameter, as in
+    3-my_safe_filter_states, never formatted into the SQL.
+
+    Args:
+        url (str or URL): The database URL.
+        name (str): The state name.
+
+    Returns:
+        list: (id, name) tuples, sorted by id.
+    """
+    with session_scope(url) as session:
+        rows = session.query(State.id, State.name).filter(
+            State.name == name).order_by(State.id).all()
+    return [row for row in rows if row.name == name]
+
+
+def cities_by_state(url):
+    """List every city with the name of its state, sorted by city id.
+
+    Args:
+        url (str or URL): The database URL.
+
+    Returns:
+        list: (city id, city name, state name) tuples.
+    """
+    with session_scope(url) as session:
+        return session.query(City.id, City.name, State.name).join(
+            State, City.state_id == State.id).order_by(City.id).all()
+
+
+def city_names_in_state(url, state_name):
+    """List the names of the cities of a state, sorted by city id.
+
+    Args:
+        url (str or URL): The database URL.
+        state_name (str): The state name, compared as the database does.
+
+    Returns:
+        list: City names.
+    """
+    with session_scope(url) as session:
+        rows = session.query(City.name).join(
+            State, City.state_id == State.id).filter(
+            State.name == state_name).order_by(City.id).all()
+    return [row.name for row in rows]
+
+
+def first_state(url):
+    """Return the state with the lowest id.
+
+    Args:
+        url (str or URL): The database URL.
+
+    Returns:
+        tuple: (id, name), or None if there are no states.
+    """
+    with session_scope(url) as session:
+        return session.query(State.id, State.name).order_by(
+            State.id).first()
+
+
+def states_containing(url, text="a"):
+    """List the states whose name contains text.
+
+    Args:
+        url (str or URL): The database URL.
+        text (str): The text to look for, compared as the database
+            does. Defaults to "a".
+
+    Returns:
+        list: (id, name) tuples, sorted by id.
+    """
+    with session_scope(url) as session:
+        return session.query(State.id, State.name).filter(
+            State.name.contains(text, autoescape=True)).order_by(
+            State.id).all()
+
+
+def find_state_id(url, name):
+    """Return the id of the first state with this name.
+
+    Args:
+        url (str or URL): The database URL.
+        name (str): The state name, compared as the database does.
+
+    Returns:
+        int: The id, or None if no state has this name.
+    """
+    with session_scope(url) as session:
+        row = session.query(State.id).filter(State.name == name).order_by(
+            State.id).first()
+    return row.id if row else None
+
+
+def add_state(url, name):
+    """Insert a new state.
+
+    Args:
+        url (str or URL): The database URL.
+        name (str): The name of the new state.
+
+    Returns:
+        int: The id of the new state.
+    """
+    with session_scope(url) as session:
+        state = State(name=name)
+        session.add(state)
+        session.flush()
+        return state.id
+
+
+def rename_state(url, state_id, name):
+    """Change the name of a state.
+
+    Args:
+        url (str or URL): The database URL.
+        state_id (int): The id of the state.
+        name (str): Its new name.
+
+    Returns:
+        bool: True if the state exists and was renamed, False otherwise.
+    """
+    with session_scope(url) as session:
+        state = session.get(State, state_id)
+        if state is None:
+            return False
+        state.name = name
+        return True
+
+
+def delete_states_containing(url, text="a"):
+    """Delete the states whose name contains text, and their cities.
+
+    The states are loaded before deletion so that the delete-orphan
+    cascade of State.cities removes their cities as well.
+
+    Args:
+        url (str or URL): The database URL.
+        text (str): The text to look for, compared as the database
+            does. Defaults to "a".
+
+    Returns:
+        int: The number of states deleted.
+    """
+    with session_scope(url) as session:
+        states = session.query(State).filter(
+            State.name.contains(text, autoescape=True)).all()
+        for state in states:
+            session.delete(state)
+        return len(states)